@@ -0,0 +1,135 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Sequence, TypeVar
+
+T = TypeVar("T")  # Type for submitted items
+R = TypeVar("R")  # Type for per-item results
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+    Coalesces concurrently submitted items into batches for a single handler call.
+
+    Items are queued and a background worker collects up to ``max_batch_size``
+    of them, waiting at most ``max_wait`` seconds after the first one arrives.
+    The handler receives the batch and must return one result per item in the
+    same order; results (or the handler's exception) are fanned back to the
+    submitters through futures. A handler returning a different number of
+    results fails the whole batch.
+
+    Attributes:
+        max_batch_size (int): Maximum number of items per handler call
+        max_wait (float): Maximum time in seconds to wait for a batch to fill
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[list[T]], Awaitable[Sequence[R]]],
+        max_batch_size: int,
+        max_wait: float,
+    ) -> None:
+        """
+        Initializes the batcher. The worker is started on first submit.
+
+        Args:
+            handler (Callable[[list[T]], Awaitable[Sequence[R]]]): Batch handler
+            max_batch_size (int): Maximum number of items per handler call
+            max_wait (float): Maximum time in seconds to wait for a batch to fill
+        """
+        self._handler = handler
+        self.max_batch_size = max(max_batch_size, 1)
+        self.max_wait = max_wait
+        self._queue: asyncio.Queue[tuple[T, asyncio.Future]] | None = None
+        self._worker: asyncio.Task | None = None
+        self._dispatches: set[asyncio.Task] = set()
+
+    async def submit(self, item: T) -> R:
+        """
+        Queues an item and waits for its result.
+
+        Args:
+            item (T): Item to process
+
+        Returns:
+            R: Result produced by the handler for this item
+        """
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((item, future))
+        return await future
+
+    async def _collect(self) -> list[tuple[T, asyncio.Future]]:
+        """
+        Waits for the first item and gathers more until the batch is full or the wait expires.
+
+        Returns:
+            list[tuple[T, asyncio.Future]]: Batch of items with their futures
+        """
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _dispatch(self, batch: list[tuple[T, asyncio.Future]]) -> None:
+        """
+        Runs the handler for one batch and resolves the submitters' futures.
+
+        Args:
+            batch (list[tuple[T, asyncio.Future]]): Batch of items with their futures
+        """
+        try:
+            results = await self._handler([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(f"Batch handler returned {len(results)} results for {len(batch)} items")
+        except Exception as err:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(err)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _run(self) -> None:
+        """
+        Worker loop collecting batches and dispatching them without waiting,
+        so a slow handler call does not hold back the next batch.
+        """
+        while True:
+            batch = await self._collect()
+            # Submitters that were cancelled while waiting do not need a result
+            batch = [(item, future) for item, future in batch if not future.done()]
+            if not batch:
+                continue
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def close(self) -> None:
+        """
+        Stops the worker and cancels items still waiting in the queue.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                future.cancel()
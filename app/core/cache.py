@@ -0,0 +1,440 @@
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional, lookups fall back to NumPy
+    njit = None
+
+K = TypeVar("K", bound=Hashable)  # Type for cache keys
+V = TypeVar("V")  # Type for cached values
+
+
+def _best_match_numpy(vectors: np.ndarray, vector: np.ndarray) -> tuple[int, float]:
+    """
+    Finds the row with the highest dot product with the vector.
+
+    Args:
+        vectors (np.ndarray): Matrix of normalized vectors, one per row
+        vector (np.ndarray): Normalized query vector
+
+    Returns:
+        tuple[int, float]: Index of the best row and its score
+    """
+    scores = vectors @ vector
+    index = int(np.argmax(scores))
+    return index, float(scores[index])
+
+
+def _best_match_kernel(vectors, vector):
+    """
+    Single pass over the matrix fusing the dot products with the argmax.
+    Compiled with numba when it is installed.
+    """
+    best_index = 0
+    best_score = -np.inf
+    for i in range(vectors.shape[0]):
+        score = 0.0
+        for j in range(vectors.shape[1]):
+            score += vectors[i, j] * vector[j]
+        if score > best_score:
+            best_index = i
+            best_score = score
+    return best_index, best_score
+
+
+best_match = _best_match_numpy if njit is None else njit(fastmath=True, cache=True)(_best_match_kernel)
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Bounded exact-match cache with least recently used eviction and optional expiry.
+
+    Attributes:
+        max_size (int): Maximum number of cached entries
+        ttl (float): Entry lifetime in seconds, 0 disables expiry
+    """
+
+    def __init__(self, max_size: int, ttl: float = 0) -> None:
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_size (int): Maximum number of cached entries
+            ttl (float): Entry lifetime in seconds, 0 disables expiry
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[V, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> V | None:
+        """
+        Returns the cached value and marks it as recently used.
+
+        Args:
+            key (K): Cache key
+
+        Returns:
+            V | None: Cached value or None on a miss or expired entry
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """
+        Stores a value, evicting the least recently used entry when full.
+
+        Args:
+            key (K): Cache key
+            value (V): Value to cache
+        """
+        if self.max_size <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl > 0 else 0.0
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        if len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes all cached entries.
+        """
+        self._data.clear()
+
+
+class LFUCache(Generic[K, V]):
+    """
+    Bounded exact-match cache with least frequently used eviction and optional expiry.
+
+    Keys are grouped in buckets by hit count, so lookups and evictions are
+    O(1). Among keys with the same count the least recently used one is
+    evicted first. Expired entries are dropped when they are looked up or
+    when room is needed.
+
+    Attributes:
+        max_size (int): Maximum number of cached entries
+        ttl (float): Entry lifetime in seconds, 0 disables expiry
+    """
+
+    def __init__(self, max_size: int, ttl: float = 0) -> None:
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_size (int): Maximum number of cached entries
+            ttl (float): Entry lifetime in seconds, 0 disables expiry
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: dict[K, tuple[V, int, float]] = {}
+        self._buckets: dict[int, OrderedDict[K, None]] = {}
+        self._min_count = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _unlink(self, key: K, count: int) -> None:
+        """
+        Removes a key from its hit count bucket.
+
+        Args:
+            key (K): Cache key
+            count (int): Hit count of the key
+        """
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min_count == count:
+                self._min_count += 1
+
+    def _link(self, key: K, count: int) -> None:
+        """
+        Adds a key to the most recently used end of its hit count bucket.
+
+        Args:
+            key (K): Cache key
+            count (int): Hit count of the key
+        """
+        self._buckets.setdefault(count, OrderedDict())[key] = None
+
+    def _remove(self, key: K) -> None:
+        """
+        Removes an entry and its bucket link.
+
+        Args:
+            key (K): Cache key
+        """
+        _, count, _ = self._data.pop(key)
+        self._unlink(key, count)
+
+    def get(self, key: K) -> V | None:
+        """
+        Returns the cached value and counts the hit.
+
+        Args:
+            key (K): Cache key
+
+        Returns:
+            V | None: Cached value or None on a miss or expired entry
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        value, count, expires_at = entry
+        if expires_at and expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+
+        self._unlink(key, count)
+        self._link(key, count + 1)
+        self._data[key] = (value, count + 1, expires_at)
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """
+        Stores a value, evicting the least frequently used entry when full.
+
+        Args:
+            key (K): Cache key
+            value (V): Value to cache
+        """
+        if self.max_size <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl > 0 else 0.0
+
+        if key in self._data:
+            _, count, _ = self._data[key]
+            self._data[key] = (value, count, expires_at)
+            return
+
+        if len(self._data) >= self.max_size:
+            self._evict()
+        self._data[key] = (value, 1, expires_at)
+        self._link(key, 1)
+        self._min_count = 1
+
+    def _evict(self) -> None:
+        """
+        Removes the least recently used key among the least frequently used ones.
+
+        ``_min_count`` never exceeds the lowest hit count in use, so scanning
+        upwards from it finds the lowest non-empty bucket.
+        """
+        while self._min_count not in self._buckets:
+            self._min_count += 1
+        key = next(iter(self._buckets[self._min_count]))
+        self._remove(key)
+
+    def clear(self) -> None:
+        """
+        Removes all cached entries.
+        """
+        self._data.clear()
+        self._buckets.clear()
+        self._min_count = 0
+
+
+class SemanticCache(Generic[V]):
+    """
+    Fixed-size cache keyed by normalized embedding vectors.
+
+    Keys are stored as rows of a preallocated C-ordered float32 matrix so a
+    lookup is a single pass over all cached vectors. A lookup hits when the best
+    cosine similarity reaches the threshold. When full, the least recently
+    used entry is replaced.
+
+    Attributes:
+        max_size (int): Maximum number of cached entries
+        threshold (float): Minimum cosine similarity for a hit
+    """
+
+    def __init__(self, max_size: int, threshold: float) -> None:
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_size (int): Maximum number of cached entries
+            threshold (float): Minimum cosine similarity for a hit
+        """
+        self.max_size = max_size
+        self.threshold = threshold
+        self._vectors: np.ndarray | None = None
+        self._values: list[V] = []
+        self._last_used = np.zeros(max_size, dtype=np.int64)
+        self._clock = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, vector: np.ndarray) -> V | None:
+        """
+        Returns the value cached for the most similar vector.
+
+        Args:
+            vector (np.ndarray): Normalized embedding vector
+
+        Returns:
+            V | None: Cached value or None if no entry is similar enough
+        """
+        size = len(self._values)
+        if not size:
+            return None
+
+        index, score = best_match(self._vectors[:size], vector)
+        if score < self._threshold_at(index):
+            return None
+
+        self._clock += 1
+        self._last_used[index] = self._clock
+        return self._values[index]
+
+    def _threshold_at(self, index: int) -> float:
+        """
+        Returns the minimum similarity for a hit on the entry.
+
+        Args:
+            index (int): Row of the entry
+
+        Returns:
+            float: Minimum cosine similarity for a hit
+        """
+        return self.threshold
+
+    def put(self, vector: np.ndarray, value: V) -> int | None:
+        """
+        Stores a value, evicting the least recently used entry when full.
+
+        Args:
+            vector (np.ndarray): Normalized embedding vector
+            value (V): Value to cache
+
+        Returns:
+            int | None: Row the value was stored in, or None if caching is disabled
+        """
+        if self.max_size <= 0:
+            return None
+        if self._vectors is None:
+            self._vectors = np.zeros((self.max_size, vector.shape[0]), dtype=np.float32)
+
+        size = len(self._values)
+        if size < self.max_size:
+            index = size
+            self._values.append(value)
+        else:
+            index = int(np.argmin(self._last_used))
+            self._values[index] = value
+
+        self._vectors[index] = vector
+        self._clock += 1
+        self._last_used[index] = self._clock
+        return index
+
+    def clear(self) -> None:
+        """
+        Removes all cached entries.
+        """
+        self._values.clear()
+        self._last_used[:] = 0
+
+
+class AdaptiveSemanticCache(SemanticCache[V]):
+    """
+    Semantic cache that learns a similarity threshold for each entry.
+
+    Every entry starts with the strict initial threshold. When a query missed
+    the cache but its real result matched the result of the nearest entry,
+    that entry's threshold is lowered to the query's similarity, so the region
+    answered by the entry grows towards where it is known to be correct. The
+    threshold never goes below ``min_threshold``.
+
+    Attributes:
+        min_threshold (float): Lowest threshold an entry can learn
+    """
+
+    def __init__(self, max_size: int, threshold: float, min_threshold: float) -> None:
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_size (int): Maximum number of cached entries
+            threshold (float): Initial minimum cosine similarity for a hit
+            min_threshold (float): Lowest threshold an entry can learn
+        """
+        super().__init__(max_size, threshold)
+        self.min_threshold = min(min_threshold, threshold)
+        self._thresholds = np.full(max(max_size, 0), threshold, dtype=np.float32)
+
+    def _threshold_at(self, index: int) -> float:
+        return float(self._thresholds[index])
+
+    def nearest(self, vector: np.ndarray) -> tuple[int, float] | None:
+        """
+        Finds the entry most similar to the vector without counting a hit.
+
+        Args:
+            vector (np.ndarray): Normalized embedding vector
+
+        Returns:
+            tuple[int, float] | None: Row and cosine similarity of the nearest entry, or None if empty
+        """
+        size = len(self._values)
+        if not size:
+            return None
+        index, score = best_match(self._vectors[:size], vector)
+        return index, float(score)
+
+    def value_at(self, index: int) -> V:
+        """
+        Returns the value stored in a row.
+
+        Args:
+            index (int): Row of the entry
+
+        Returns:
+            V: Cached value
+        """
+        return self._values[index]
+
+    def widen(self, index: int, score: float) -> None:
+        """
+        Lowers the entry's threshold so queries as similar as ``score`` hit it.
+
+        Args:
+            index (int): Row of the entry
+            score (float): Similarity of a query whose real result matched the entry
+        """
+        self._thresholds[index] = max(self.min_threshold, min(self._thresholds[index], score))
+
+    def put(self, vector: np.ndarray, value: V) -> int | None:
+        """
+        Stores a value with the initial threshold, evicting the least recently used entry when full.
+
+        Args:
+            vector (np.ndarray): Normalized embedding vector
+            value (V): Value to cache
+
+        Returns:
+            int | None: Row the value was stored in, or None if caching is disabled
+        """
+        index = super().put(vector, value)
+        if index is not None:
+            self._thresholds[index] = self.threshold
+        return index
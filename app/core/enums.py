@@ -1,3 +1,4 @@
+import sys
 from enum import Enum
 
 
@@ -36,8 +37,12 @@ class Language(str, Enum):
     SWIFT = "swift"
     LANGUAGE_AGNOSTIC = "language_agnostic"
 
+    def __init__(self, *args) -> None:
+        # Cache the lowercased name once per member instead of on every str() call
+        self._str = self.name.lower()
+
     def __str__(self) -> str:
-        return self.name.lower()
+        return self._str
 
 
 class RuleAction(str, Enum):
@@ -62,8 +67,28 @@ class LLMClientNames(str, Enum):
     mistral = "mistral"
     gemini = "gemini"
     litellm = "litellm"
+    cascade = "cascade"
 
 
 class ManagerNames(str, Enum):
     similarity = "similarity"
     llm = "llm"
+
+
+ACTION_STATUS_MAP: dict[str, ActionStatus] = {status.value: status for status in ActionStatus}
+
+
+def intern_identifier(identifier: str) -> str:
+    """
+    Returns the interned plain-string form of an identifier.
+
+    Enum members are reduced to their value, so map keys built from enums and
+    identifiers coming from settings or requests resolve to the same object.
+
+    Args:
+        identifier (str): Enum member or plain string identifier
+
+    Returns:
+        str: Interned identifier string
+    """
+    return sys.intern(getattr(identifier, "value", identifier))
@@ -1,6 +1,9 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Generic, List, TypeVar
+from operator import attrgetter
+from typing import Dict, Generic, List, Mapping, Tuple, TypeVar
 
+from app.core.enums import intern_identifier
 from app.core.exceptions import ConfigurationException
 from app.modules.logger import bastion_logger
 from settings import get_settings
@@ -17,26 +20,41 @@ class BaseManager(ABC, Generic[T]):
     This class provides common functionality for managing multiple client instances,
     including initialization, client switching, and active client management.
     It uses generics to support different types of clients while maintaining
-    type safety.
+    type safety. Connection checks and closing run for all clients concurrently.
 
     Attributes:
+        _client_classes (Dict[str, type]): Configured client classes in declaration order, without those that failed to build
         _clients_map (Dict[str, T]): Mapping of client identifiers to client instances
+        _clients (Tuple[T, ...]): Initialized clients in initialization order, used for iteration
         _active_client (Optional[T]): Currently active client for operations
         _active_client_id (Optional[str]): Identifier of the active client
     """
 
-    def __init__(self, clients_map: Dict[str, type], default_client_setting: str) -> None:
+    __slots__ = (
+        "_client_classes",
+        "_clients_map",
+        "_clients",
+        "_active_client",
+        "_active_client_id",
+        "_default_client_setting",
+        "_default_client_getter",
+    )
+
+    def __init__(self, clients_map: Mapping[str, type], default_client_setting: str) -> None:
         """
         Initializes BaseManager with available clients.
 
         Args:
-            clients_map (Dict[str, type]): Mapping of client identifiers to client classes
+            clients_map (Mapping[str, type]): Mapping of client identifiers to client classes
             default_client_setting (str): Setting name for default client
         """
+        self._client_classes: Dict[str, type] = {}
         self._clients_map: Dict[str, T] = {}
+        self._clients: Tuple[T, ...] = ()
         self._active_client: None | T = None
         self._active_client_id: None | str = None
         self._default_client_setting = default_client_setting
+        self._default_client_getter = attrgetter(default_client_setting)
 
         self._initialize_clients(clients_map)
 
@@ -58,22 +76,69 @@ class BaseManager(ABC, Generic[T]):
         """
         return self.__str__()
 
-    def _initialize_clients(self, clients_map: Dict[str, type]) -> None:
+    def _initialize_clients(self, clients_map: Mapping[str, type]) -> None:
         """
-        Initializes available clients based on provided clients map.
+        Initializes the client that will be used as the active one.
+
+        Clients whose settings are missing are skipped without being constructed.
+        Of the configured clients only the default one is built, or, if it cannot
+        be built, the first one in declaration order that can. The others are
+        built on first use by get_client, so providers that are never used do
+        not create SDK/HTTP clients.
 
         Args:
-            clients_map (Dict[str, type]): Mapping of client identifiers to client classes
+            clients_map (Mapping[str, type]): Mapping of client identifiers to client classes
         """
         for client_id, client_class in clients_map.items():
-            try:
-                client = client_class()
-                self._clients_map[client_id] = client
-                bastion_logger.info(f"[{client}] initialized successfully")
-            except ConfigurationException as e:
-                bastion_logger.error(f"[{client_class._identifier}] There are no configuration. Error: {e}")
-            except Exception as e:
-                bastion_logger.error(f"[{client_class._identifier}] Failed to initialize. Error: {e}")
+            client_id = intern_identifier(client_id)
+            if client_class.is_configured(settings):
+                self._client_classes[client_id] = client_class
+            else:
+                bastion_logger.info(f"[{client_id}] There are no configuration. Skipping")
+
+        default_client_id = self._default_client_getter(settings)
+        if default_client_id is not None:
+            default_client_id = intern_identifier(default_client_id)
+
+        # Stable sort moves the default client first and keeps declaration order otherwise
+        for client_id in sorted(self._client_classes, key=lambda cid: cid != default_client_id):
+            if self.get_client(client_id) is not None:
+                break
+
+    def get_client(self, client_id: str) -> T | None:
+        """
+        Returns the client with the given identifier, building it on first use.
+
+        A client that fails to build is logged and not retried.
+
+        Args:
+            client_id (str): Client identifier
+
+        Returns:
+            T | None: Client instance, or None if it is not configured or failed to build
+        """
+        client_id = intern_identifier(client_id)
+        if (client := self._clients_map.get(client_id)) is not None:
+            return client
+
+        client_class = self._client_classes.get(client_id)
+        if client_class is None:
+            return None
+        try:
+            client = client_class()
+        except ConfigurationException as e:
+            del self._client_classes[client_id]
+            bastion_logger.error(f"[{client_id}] There are no configuration. Error: {e}")
+            return None
+        except Exception as e:
+            del self._client_classes[client_id]
+            bastion_logger.error(f"[{client_id}] Failed to initialize. Error: {e}")
+            return None
+
+        self._clients_map[client_id] = client
+        self._clients = tuple(self._clients_map.values())
+        bastion_logger.info(f"[{client}] initialized successfully")
+        return client
 
     async def _activate_clients(self) -> None:
         """
@@ -82,12 +147,31 @@ class BaseManager(ABC, Generic[T]):
         await self._check_connections()
         self._set_active_client()
 
-    @abstractmethod
     async def _check_connections(self) -> None:
         """
         Checks connections for all initialized clients.
         """
-        pass
+        bastion_logger.debug("Checking connections for all initialized clients")
+        statuses = await asyncio.gather(
+            *(client.check_connection() for client in self._clients), return_exceptions=True
+        )
+        for client, status in zip(self._clients, statuses):
+            if isinstance(status, Exception):
+                bastion_logger.error(f"[{self}][{client}] Check connection failed. Error: {status}")
+            elif status:
+                client.enabled = True
+                bastion_logger.info(f"[{self}][{client}] Connection check successful")
+            else:
+                bastion_logger.error(f"[{self}][{client}] Check connection failed")
+
+    async def close_connections(self) -> None:
+        """
+        Close all connections for currently available clients.
+        """
+        statuses = await asyncio.gather(*(client.close() for client in self._clients), return_exceptions=True)
+        for client, status in zip(self._clients, statuses):
+            if isinstance(status, Exception):
+                bastion_logger.error(f"[{self}][{client}] Failed to close connection: {status}")
 
     def _set_active_client(self, client_id: str = None) -> None:
         """
@@ -97,7 +181,9 @@ class BaseManager(ABC, Generic[T]):
             client_id (str, optional): Client identifier to set as active
         """
         if client_id is None:
-            client_id = getattr(settings, self._default_client_setting, None)
+            client_id = self._default_client_getter(settings)
+            if client_id is not None:
+                client_id = intern_identifier(client_id)
 
         if client := self._clients_map.get(client_id):
             if client.enabled is False:
@@ -106,9 +192,9 @@ class BaseManager(ABC, Generic[T]):
             self._active_client = client
             self._active_client_id = client_id
             bastion_logger.info(f"[{self}][{client}] Set as active client")
-        elif not self._active_client and self._clients_map:
-            self._active_client = next(iter(self._clients_map.values()))
-            self._active_client_id = getattr(self._active_client, "identifier", None)
+        elif not self._active_client and self._clients:
+            self._active_client = self._clients[0]
+            self._active_client_id = intern_identifier(self._active_client._identifier)
             bastion_logger.info(f"Switched active client to {self._active_client_id}")
         else:
             bastion_logger.warning(f"Cannot switch to client '{client_id}': client not available")
@@ -133,19 +219,21 @@ class BaseManager(ABC, Generic[T]):
         """
         pass
 
-    def get_available_clients(self) -> List[T]:
+    def get_available_clients(self) -> List[type]:
         """
-        Returns list of available client identifiers.
+        Returns the classes of available clients without building the ones not used yet.
 
         Returns:
-            List[str]: List of available client identifiers
+            List[type]: Configured client classes in declaration order
         """
-        return list(self._clients_map.values())
+        return list(self._client_classes.values())
 
-    def switch_active_client(self, client_id: str) -> bool:
+    async def switch_active_client(self, client_id: str) -> bool:
         """
         Switches the active client to the specified one.
 
+        Clients are built on first use, so connections are checked before the switch.
+
         Args:
             client_id (str): Identifier of the client to switch to
 
@@ -153,11 +241,8 @@ class BaseManager(ABC, Generic[T]):
             bool: True if switch was successful, False otherwise
         """
         old_client_id = self._active_client_id
+        client_id = intern_identifier(client_id)
+        if client_id != old_client_id and self.get_client(client_id) is not None:
+            await self._check_connections()
         self._set_active_client(client_id)
         return old_client_id != self._active_client_id
-
-    async def close_connections(self) -> None:
-        """
-        Close all connections for currently available clients.
-        """
-        ...
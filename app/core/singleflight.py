@@ -0,0 +1,44 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)  # Type for call keys
+V = TypeVar("V")  # Type for call results
+
+
+class SingleFlight(Generic[K, V]):
+    """
+    Collapses concurrent calls with the same key into one execution.
+
+    The first caller for a key starts the call as a task; callers arriving
+    while it is in flight await the same task. The call is shielded, so a
+    cancelled caller does not cancel the work shared with the others, and
+    its exception is propagated to every caller.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty registry of in-flight calls.
+        """
+        self._calls: dict[K, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: K, call: Callable[[], Awaitable[V]]) -> tuple[V, bool]:
+        """
+        Runs the call unless one with the same key is already in flight.
+
+        Args:
+            key (K): Key identifying identical calls
+            call (Callable[[], Awaitable[V]]): Coroutine factory executed once per key
+
+        Returns:
+            tuple[V, bool]: Call result and whether it was shared with another caller
+        """
+        task = self._calls.get(key)
+        shared = task is not None
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(task), shared
@@ -34,6 +34,11 @@ class BastionApp:
         else:
             self.kafka_client = None
 
+        # Settings read for every reported task are bound once
+        self._service_name = self.settings.PROJECT_NAME
+        self._service_version = self.settings.VERSION
+        self._save_prompt = bool(self.settings.KAFKA and self.settings.KAFKA.save_prompt)
+
     def __task_status(self, task_result: list[PipelineResult]) -> ActionStatus:
         """
         Determine the overall task status based on individual pipeline results.
@@ -62,12 +67,12 @@ class BastionApp:
             payload = task.model_dump()
             payload.update(
                 {
-                    "service": self.settings.PROJECT_NAME,
-                    "version": self.settings.VERSION,
+                    "service": self._service_name,
+                    "version": self._service_version,
                     "timestamp": datetime.now().isoformat(),
                 }
             )
-            if self.settings.KAFKA.save_prompt:
+            if self._save_prompt:
                 payload["prompt"] = prompt
             if task_id:
                 payload["task_id"] = task_id
@@ -1,13 +1,16 @@
+from types import MappingProxyType
+
+from app.core.enums import intern_identifier
 from app.managers.similarity.manager import SimilarityManager
 from app.managers.llm.manager import LLMManager
 
 
-ALL_MANAGERS = [
+ALL_MANAGERS = (
     SimilarityManager(),
     LLMManager(),
-]
+)
 
-ALL_MANAGERS_MAP = {
-    manager._identifier: manager
+ALL_MANAGERS_MAP = MappingProxyType({
+    intern_identifier(manager._identifier): manager
     for manager in ALL_MANAGERS
-}
+})
@@ -1,18 +1,23 @@
+from types import MappingProxyType
+
+from app.core.enums import intern_identifier
 # from app.managers.llm.clients.anthropic import AsyncAnthropicClient
 # from app.managers.llm.clients.azure_openai import AsyncAzureOpenAIClient
 # from app.managers.llm.clients.openai import AsyncOpenAIClient
 from app.managers.llm.clients.ollama import AsyncOllamaClient
 from app.managers.llm.clients.litellm import AsyncLiteLLMClient
+from app.managers.llm.clients.cascade import CascadeLLMClient
 
-ALL_CLIENTS = [
+ALL_CLIENTS = (
     # AsyncOpenAIClient,
     # AsyncAnthropicClient,
     # AsyncAzureOpenAIClient,
     AsyncOllamaClient,
     AsyncLiteLLMClient,
-]
+    CascadeLLMClient,
+)
 
-ALL_CLIENTS_MAP = {
-    client._identifier: client
+ALL_CLIENTS_MAP = MappingProxyType({
+    intern_identifier(client._identifier): client
     for client in ALL_CLIENTS
-}
+})
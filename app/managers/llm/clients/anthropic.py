@@ -1,15 +1,15 @@
-import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from anthropic import AsyncAnthropic
-
-from app.core.enums import ActionStatus, LLMClientNames
-from app.core.exceptions import ConfigurationException
-from app.managers.llm.clients.base import BaseLLMClient
+from app.core.enums import LLMClientNames
+from app.managers.llm.clients.base import PROBE_MESSAGES, BaseLLMClient
+from app.managers.llm.pool import ConnectionPool
 from app.models.pipeline import PipelineResult
 from app.modules.logger import bastion_logger
 from settings import get_settings
 
+if TYPE_CHECKING:
+    from anthropic import AsyncAnthropic
+
 settings = get_settings()
 
 
@@ -28,25 +28,34 @@ class AsyncAnthropicClient(BaseLLMClient):
         SYSTEM_PROMPT (str): System prompt for AI analysis
     """
 
-    _client: AsyncAnthropic
+    _client: "AsyncAnthropic"
     _identifier: LLMClientNames = LLMClientNames.anthropic
     description = "Anthropic-based client for LLM operations using Claude AI models."
 
-    def __init__(self):
+    _display_name = "Anthropic Client"
+    _client_cls = "anthropic.AsyncAnthropic"
+    _model_setting = "ANTHROPIC_MODEL"
+    _required_settings = ("ANTHROPIC_API_KEY",)
+    _client_settings = {"api_key": "ANTHROPIC_API_KEY"}
+    _uses_shared_http_client = True
+
+    def __init__(self, pool: ConnectionPool | None = None):
         """
-        Initializes Anthropic pipeline with API client and model configuration.
+        Initializes Anthropic client and the request arguments shared by every call.
 
-        Sets up the Anthropic API client with the provided API key and configures
-        the model for analysis. Enables the pipeline if API key is available.
+        Args:
+            pool (ConnectionPool | None): Pool of the client using this one as a stage
         """
-        super().__init__()
-        self.client = None
-        model = settings.ANTHROPIC_MODEL
-        self.model = model
-        self.system_prompt = self._build_system_prompt()
-        self.__load_client()
-
-    def _get_additional_instructions(self) -> str:
+        super().__init__(pool)
+        self._request_kwargs = {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "system": self.system_prompt,
+        }
+
+    @classmethod
+    def _get_additional_instructions(cls) -> str:
         """
         Get Anthropic Claude-specific additional instructions.
 
@@ -55,59 +64,36 @@ class AsyncAnthropicClient(BaseLLMClient):
         """
         return """"""
 
-    def __str__(self) -> str:
-        return "Anthropic Client"
+    def _get_client_kwargs(self) -> dict[str, Any]:
+        """
+        Builds Anthropic client arguments, passing base_url only when it is not the default.
 
-    async def check_connection(self) -> None | Any:
+        Returns:
+            dict[str, Any]: Keyword arguments for AsyncAnthropic
         """
-        Checks connection to Anthropic API.
+        kwargs = super()._get_client_kwargs()
+        if settings.ANTHROPIC_BASE_URL and settings.ANTHROPIC_BASE_URL != "https://api.anthropic.com":
+            kwargs["base_url"] = settings.ANTHROPIC_BASE_URL
+        return kwargs
+
+    async def _probe(self) -> Any:
+        """
+        Sends a 1-token message to the configured Claude model.
 
         Raises:
             Exception: On failed connection or API error
         """
         try:
-            # Simple test request to check API connectivity
             # Anthropic doesn't have a list models endpoint, so we make a simple messages call
-            response = await self.client.messages.create(
+            return await self.client.messages.create(
                 model=self.model,
                 max_tokens=1,
-                messages=[{"role": "user", "content": "test"}],
+                messages=PROBE_MESSAGES,
             )
-            if response:
-                self.enabled = True
-                bastion_logger.info(f"[{self}] Connection check successful")
-            return response
         except Exception as e:
             raise Exception(f"Failed to connect to Anthropic API: {e}")
 
-    def __load_client(self) -> None:
-        """
-        Loads the Anthropic client.
-        """
-        if not settings.ANTHROPIC_API_KEY:
-            raise ConfigurationException(
-                f"[{self}] failed to load client. Model: {self.model}. API key is not set."
-            )
-        else:
-            anthropic_settings = {
-                "api_key": settings.ANTHROPIC_API_KEY,
-            }
-            # Only add base_url if it's not the default
-            if (
-                settings.ANTHROPIC_BASE_URL
-                and settings.ANTHROPIC_BASE_URL != "https://api.anthropic.com"
-            ):
-                anthropic_settings["base_url"] = settings.ANTHROPIC_BASE_URL
-
-            try:
-                self.client = AsyncAnthropic(**anthropic_settings)
-                self.enabled = True
-            except Exception as err:
-                raise Exception(
-                    f"[{self}][{self.model}] failed to load client. Error: {str(err)}"
-                )
-
-    async def run(self, text: str) -> PipelineResult:
+    async def _analyze(self, text: str) -> PipelineResult:
         """
         Performs AI-powered analysis of the prompt using Anthropic Claude.
 
@@ -123,21 +109,14 @@ class AsyncAnthropicClient(BaseLLMClient):
         """
         try:
             response = await self.client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-                system=self.system_prompt,
                 messages=[{"role": "user", "content": text}],
+                **self._request_kwargs,
             )
             # Extract text from response
             analysis = response.content[0].text
-            bastion_logger.info(f"Analysis: {analysis}")
+            bastion_logger.info("%s Analysis: %s", self._log_prefix, analysis)
             return self._process_response(analysis, text)
         except Exception as err:
             msg = f"Error analyzing prompt, error={str(err)}"
             bastion_logger.error(msg)
-            error_data = {
-                "status": ActionStatus.ERROR,
-                "reason": msg,
-            }
-            return self._process_response(json.dumps(error_data), text)
+            return self._process_error(msg, err)
@@ -1,15 +1,14 @@
-import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from openai import AsyncAzureOpenAI
-
-from app.core.enums import ActionStatus, LLMClientNames
-from app.core.exceptions import ConfigurationException
+from app.core.enums import LLMClientNames
 from app.managers.llm.clients.base import BaseLLMClient
 from app.models.pipeline import PipelineResult
 from app.modules.logger import bastion_logger
 from settings import get_settings
 
+if TYPE_CHECKING:
+    from openai import AsyncAzureOpenAI
+
 settings = get_settings()
 
 
@@ -28,27 +27,26 @@ class AsyncAzureOpenAIClient(BaseLLMClient):
         SYSTEM_PROMPT (str): System prompt for AI analysis
     """
 
-    _client: AsyncAzureOpenAI
+    _client: "AsyncAzureOpenAI"
     _identifier: LLMClientNames = LLMClientNames.azure
     description = (
         "Azure OpenAI-based client for GPT models via Microsoft Azure infrastructure."
     )
 
-    def __init__(self):
-        """
-        Initializes Azure OpenAI pipeline with API client and model configuration.
-
-        Sets up the Azure OpenAI API client with the provided endpoint, API key, and
-        configures the model deployment for analysis.
-        """
-        super().__init__()
-        self.client = None
-        model = settings.AZURE_OPENAI_DEPLOYMENT
-        self.model = model
-        self.system_prompt = self._build_system_prompt()
-        self.__load_client()
-
-    def _get_additional_instructions(self) -> str:
+    _display_name = "Azure OpenAI Client"
+    _client_cls = "openai.AsyncAzureOpenAI"
+    _model_setting = "AZURE_OPENAI_DEPLOYMENT"
+    _required_settings = ("AZURE_OPENAI_ENDPOINT", "AZURE_OPENAI_API_KEY")
+    _client_settings = {
+        "api_key": "AZURE_OPENAI_API_KEY",
+        "azure_endpoint": "AZURE_OPENAI_ENDPOINT",
+        "api_version": "AZURE_OPENAI_API_VERSION",
+    }
+    _uses_shared_http_client = True
+    _supports_structured_output = True
+
+    @classmethod
+    def _get_additional_instructions(cls) -> str:
         """
         Get Azure OpenAI-specific additional instructions.
 
@@ -57,50 +55,32 @@ class AsyncAzureOpenAIClient(BaseLLMClient):
         """
         return """"""
 
-    def __str__(self) -> str:
-        return "Azure OpenAI Client"
+    def _get_chat_completions_endpoint(self) -> tuple[str, dict[str, str]] | None:
+        """
+        Returns the chat completions URL of the configured Azure OpenAI deployment.
+
+        Returns:
+            tuple[str, dict[str, str]]: Endpoint URL and request headers
+        """
+        url = (
+            f"{settings.AZURE_OPENAI_ENDPOINT.rstrip('/')}/openai/deployments/{self.model}"
+            f"/chat/completions?api-version={settings.AZURE_OPENAI_API_VERSION}"
+        )
+        return url, {"api-key": settings.AZURE_OPENAI_API_KEY, "Content-Type": "application/json"}
 
-    async def check_connection(self) -> None | Any:
+    async def _probe(self) -> Any:
         """
-        Checks connection to Azure OpenAI API.
+        Sends a 1-token completion to the configured Azure OpenAI deployment.
 
         Raises:
             Exception: On failed connection or API error
         """
         try:
-            # Simple test request to check API connectivity
-            status = await self.client.models.list()
-            if status:
-                self.enabled = True
-                bastion_logger.info(f"[{self}] Connection check successful")
-            return status
+            return await self._probe_chat_completion()
         except Exception as e:
             raise Exception(f"Failed to connect to Azure OpenAI API: {e}")
 
-    def __load_client(self) -> None:
-        """
-        Loads the Azure OpenAI client.
-        """
-        if not (settings.AZURE_OPENAI_ENDPOINT and settings.AZURE_OPENAI_API_KEY):
-            raise ConfigurationException(
-                f"[{self}] failed to load client. Model: {self.model}. Azure endpoint or API key is not set."
-            )
-
-        azure_settings = {
-            "api_key": settings.AZURE_OPENAI_API_KEY,
-            "azure_endpoint": settings.AZURE_OPENAI_ENDPOINT,
-            "api_version": settings.AZURE_OPENAI_API_VERSION,
-        }
-
-        try:
-            self.client = AsyncAzureOpenAI(**azure_settings)
-            self.enabled = True
-        except Exception as err:
-            raise Exception(
-                f"[{self}][{self.model}] failed to load client. Error: {str(err)}"
-            )
-
-    async def run(self, text: str) -> PipelineResult:
+    async def _analyze(self, text: str) -> PipelineResult:
         """
         Performs AI-powered analysis of the prompt using Azure OpenAI.
 
@@ -116,20 +96,10 @@ class AsyncAzureOpenAIClient(BaseLLMClient):
         """
         messages = self._prepare_messages(text)
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-            )
-            analysis = response.choices[0].message.content
-            bastion_logger.info(f"Analysis: {analysis}")
+            analysis = await self._complete_chat(messages)
+            bastion_logger.info("%s Analysis: %s", self._log_prefix, analysis)
             return self._process_response(analysis, text)
         except Exception as err:
             msg = f"Error analyzing prompt, error={str(err)}"
             bastion_logger.error(msg)
-            error_data = {
-                "status": ActionStatus.ERROR,
-                "reason": msg,
-            }
-            return self._process_response(json.dumps(error_data), text)
+            return self._process_error(msg, err)
@@ -1,23 +1,252 @@
-import json
+import asyncio
+import importlib
+import re
+import time
 from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator
 
-from app.core.enums import ActionStatus
+import httpx
+import orjson
+
+from app.core.batcher import MicroBatcher
+from app.core.cache import LFUCache, SemanticCache
+from app.core.enums import ACTION_STATUS_MAP, ActionStatus, RuleAction
+from app.core.exceptions import ConfigurationException
+from app.core.singleflight import SingleFlight
+from app.managers.llm.pool import ConnectionPool
 from app.models.pipeline import PipelineResult, TriggeredRuleData
 from app.modules.logger import bastion_logger
 from settings import get_settings
 
 settings = get_settings()
 
+# Verdicts that produce a triggered rule, with the rule action for each
+_TRIGGER_ACTIONS = {ActionStatus.BLOCK: RuleAction.BLOCK, ActionStatus.NOTIFY: RuleAction.NOTIFY}
+
+# Minimal request used by connection checks
+PROBE_MESSAGES = ({"role": "user", "content": "ping"},)
+
+# Verdict schema used for provider-side constrained decoding
+VERDICT_JSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "status": {"type": "string", "enum": ["block", "notify", "allow"]},
+        "reason": {"type": "string"},
+    },
+    "required": ["status", "reason"],
+    "additionalProperties": False,
+}
+VERDICT_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "safety_verdict", "strict": True, "schema": VERDICT_JSON_SCHEMA},
+}
+
+# Asks for a verdict that fits within LLM_MAX_TOKENS_SAFETY
+SHORT_REASON_INSTRUCTION = "Keep the reason to one short sentence."
+
+# Completed "status" field in a partially received JSON verdict
+_STATUS_PATTERN = re.compile(r'"status"\s*:\s*"([^"]*)"')
+
+HTTP_LIMITS = httpx.Limits(
+    max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+    max_keepalive_connections=settings.LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+)
+_shared_http_client: httpx.AsyncClient | None = None
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """
+    Returns the HTTP client shared by all HTTP-based LLM clients.
+
+    The client is created on first use so every SDK client reuses a single
+    keep-alive connection pool instead of owning its own.
+
+    Returns:
+        httpx.AsyncClient: Shared async HTTP client
+    """
+    global _shared_http_client
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        _shared_http_client = httpx.AsyncClient(limits=HTTP_LIMITS, timeout=settings.LLM_TIMEOUT)
+    return _shared_http_client
+
+
+async def close_shared_http_client() -> None:
+    """
+    Closes the shared HTTP client if it was created.
+    """
+    global _shared_http_client
+    if _shared_http_client is not None and not _shared_http_client.is_closed:
+        await _shared_http_client.aclose()
+    _shared_http_client = None
+
+
+def is_rate_limit_error(error: Exception | None) -> bool:
+    """
+    Checks whether a provider error is an HTTP 429 response.
+
+    SDK errors expose ``status_code`` directly, httpx errors through ``response``.
+
+    Args:
+        error (Exception | None): Exception raised by a provider call
+
+    Returns:
+        bool: True if the provider rejected the request with 429
+    """
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+    return status_code == 429
+
+
+def truncate_utf8(text: str, max_bytes: int) -> str:
+    """
+    Truncates text to at most max_bytes of UTF-8 without splitting a character.
+
+    Args:
+        text (str): Text to truncate
+        max_bytes (int): Maximum encoded size in bytes
+
+    Returns:
+        str: Original text if it fits, otherwise its longest prefix that fits
+    """
+    # A character takes at most 4 bytes, so short texts need no encoding
+    if len(text) * 4 <= max_bytes:
+        return text
+    encoded = text.encode("utf-8")
+    if len(encoded) <= max_bytes:
+        return text
+    return encoded[:max_bytes].decode("utf-8", "ignore")
+
+
+def extract_json_object(text: str) -> dict | None:
+    """
+    Recovers the first valid JSON object embedded in free-form text.
+
+    LLMs often wrap the requested JSON in markdown fences or add prose around
+    it. Starting at each ``{`` in turn, a brace-depth state machine that skips
+    braces inside string literals finds the balanced ``{...}`` candidate, which
+    is parsed until one succeeds. An object nested in an unclosed outer brace
+    is therefore still found.
+
+    Args:
+        text (str): Raw LLM output
+
+    Returns:
+        dict | None: First JSON object found or None
+    """
+    start = text.find("{")
+    while start != -1:
+        depth = 0
+        in_string = False
+        escaped = False
+        for index in range(start, len(text)):
+            char = text[index]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    try:
+                        loaded = orjson.loads(text[start : index + 1])
+                    except orjson.JSONDecodeError:
+                        break
+                    if isinstance(loaded, dict):
+                        return loaded
+                    break
+        # Unbalanced or invalid candidate, an object may still start at a later brace
+        start = text.find("{", start + 1)
+    return None
+
 
 class BaseLLMClient(ABC):
+    """
+    Base class for LLM clients.
+
+    Subclasses describe how their SDK client is built declaratively and the
+    base class loads it:
+
+    Attributes:
+        _client_cls (str): Dotted path of the SDK client class; the SDK is
+            imported only when a configured client is loaded
+        _model_setting (str): Settings attribute holding the model name
+        _required_settings (tuple): Settings that must be set; a nested tuple
+            means at least one of its settings must be set
+        _client_settings (dict[str, str]): SDK keyword argument -> settings attribute
+        _uses_shared_http_client (bool): Whether to pass the shared httpx client
+        _supports_structured_output (bool): Whether requests carry the verdict schema
+            when LLM_STRUCTURED_OUTPUT_ENABLED is set
+    """
+
     _identifier: str | None = None
+    _display_name: str = "LLM Client"
     enabled: bool = False
     description: str = ""
 
-    def __init__(self):
-        """Initialize base LLM client with common settings."""
+    _client_cls: str = ""
+    _model_setting: str = ""
+    _required_settings: tuple[str | tuple[str, ...], ...] = ()
+    _client_settings: dict[str, str] = {}
+    _uses_shared_http_client: bool = False
+    _supports_structured_output: bool = False
+
+    def __init__(self, pool: ConnectionPool | None = None):
+        """
+        Initialize base LLM client with common settings and load the SDK client.
+
+        Args:
+            pool (ConnectionPool | None): Pool of a client that uses this one as a stage; such a
+                client shares the pool and leaves caching and batching to its owner
+        """
         self.temperature = settings.LLM_TEMPERATURE
+        self.structured_output = settings.LLM_STRUCTURED_OUTPUT_ENABLED and self._supports_structured_output
         self.max_tokens = settings.LLM_MAX_TOKENS
+        if self._limits_reason():
+            # The prompt asks for a one-sentence reason, so the verdict fits the cap
+            self.max_tokens = min(settings.LLM_MAX_TOKENS, settings.LLM_MAX_TOKENS_SAFETY)
+        self._response_format_kwargs = (
+            {"response_format": VERDICT_RESPONSE_FORMAT} if self.structured_output else {}
+        )
+        is_stage = pool is not None
+        self.pool = pool if is_stage else ConnectionPool(settings.LLM_POOL_SIZE, settings.LLM_POOL_BURST_LIMIT)
+        self.client = None
+        self.model = getattr(settings, self._model_setting, None)
+        self.stream_responses = settings.LLM_STREAMING_ENABLED
+        self.trust_internal_models = settings.TRUST_INTERNAL_MODELS
+        self.max_prompt_bytes = settings.LLM_MAX_PROMPT_BYTES
+        self.adaptive_concurrency = settings.LLM_ADAPTIVE_CONCURRENCY_ENABLED
+        self._healthcheck_ttl = settings.LLM_HEALTHCHECK_TTL
+        self._last_ok_ts: float | None = None
+        self._healthcheck_lock = asyncio.Lock()
+        self._exact_cache: LFUCache[int, PipelineResult] | None = None
+        if settings.LLM_EXACT_CACHE_SIZE > 0 and not is_stage:
+            # Recurring attack strings are kept over one-off prompts
+            self._exact_cache = LFUCache(settings.LLM_EXACT_CACHE_SIZE, settings.LLM_EXACT_CACHE_TTL)
+        self._semantic_cache: SemanticCache[PipelineResult] | None = None
+        if settings.LLM_SEMANTIC_CACHE_ENABLED and not is_stage:
+            self._semantic_cache = SemanticCache(
+                settings.LLM_SEMANTIC_CACHE_SIZE, settings.LLM_SEMANTIC_CACHE_THRESHOLD
+            )
+        self._inflight: SingleFlight[int, PipelineResult] = SingleFlight()
+        self._batcher: MicroBatcher[str, PipelineResult] | None = None
+        if settings.LLM_BATCH_SIZE > 1 and not is_stage:
+            self._batcher = MicroBatcher(
+                self._analyze_batch, settings.LLM_BATCH_SIZE, settings.LLM_BATCH_WAIT_MS / 1000
+            )
+        self._load_client()
+        self._direct_http: tuple[str, dict[str, str]] | None = None
+        if settings.LLM_DIRECT_HTTP_ENABLED:
+            self._direct_http = self._get_chat_completions_endpoint()
+        # Allow verdicts carry no rules, so one prebuilt result serves all of them
+        self._allow_result = PipelineResult(name=self._display_name, triggered_rules=[], status=ActionStatus.ALLOW)
 
     # Base system prompt - shared across all LLM clients
     BASE_SYSTEM_PROMPT = """You are an AI prompt safety analyzer. Your task is to evaluate the given user text for potential risks, malicious intent, or policy violations.
@@ -38,7 +267,32 @@ Return only a JSON object in the following format:
     "reason": "Clear explanation of why this decision was made"
 }"""
 
-    def _build_system_prompt(self) -> str:
+    system_prompt: str = BASE_SYSTEM_PROMPT
+    _log_prefix: str = "[LLM Client]"
+    _rule_id: str | None = None
+    _system_message: dict[str, str] = {"role": "system", "content": BASE_SYSTEM_PROMPT}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Builds the system prompt once per client class.
+
+        The prompt does not depend on instance state, so it is stored as a
+        class attribute, together with the system message sent with every
+        request, instead of being rebuilt for every instance or call.
+        """
+        super().__init_subclass__(**kwargs)
+        cls.system_prompt = cls._build_system_prompt()
+        cls._system_message = {"role": "system", "content": cls.system_prompt}
+        # Per-request log lines use lazy %-formatting with this prefix
+        cls._log_prefix = f"[{cls._display_name}]"
+        # Plain string id for triggered rules built without validation
+        cls._rule_id = getattr(cls._identifier, "value", cls._identifier)
+
+    def __str__(self) -> str:
+        return self._display_name
+
+    @classmethod
+    def _build_system_prompt(cls) -> str:
         """
         Build the complete system prompt for this client.
 
@@ -48,14 +302,30 @@ Return only a JSON object in the following format:
         Returns:
             str: Complete system prompt for the client
         """
-        base_prompt = self.BASE_SYSTEM_PROMPT
-        additional = self._get_additional_instructions()
+        base_prompt = cls.BASE_SYSTEM_PROMPT
+        if cls._limits_reason():
+            base_prompt = f"{base_prompt}\n\n{SHORT_REASON_INSTRUCTION}"
+        additional = cls._get_additional_instructions()
 
         if additional:
             return f"{base_prompt}\n\n{additional}"
         return base_prompt
 
-    def _get_additional_instructions(self) -> str:
+    @classmethod
+    def _limits_reason(cls) -> bool:
+        """
+        Checks whether verdicts are asked for a short reason and capped at LLM_MAX_TOKENS_SAFETY.
+
+        Only clients sending the verdict schema are capped; the others keep
+        LLM_MAX_TOKENS, so a long reason cannot cut their JSON verdict off.
+
+        Returns:
+            bool: True if the client sends the verdict schema and structured output is enabled
+        """
+        return cls._supports_structured_output and settings.LLM_STRUCTURED_OUTPUT_ENABLED
+
+    @classmethod
+    def _get_additional_instructions(cls) -> str:
         """
         Get additional client-specific instructions to append to the base prompt.
 
@@ -67,6 +337,78 @@ Return only a JSON object in the following format:
         """
         return ""
 
+    @classmethod
+    def _get_missing_settings(cls, app_settings: Any) -> tuple[str, ...]:
+        """
+        Returns the first required setting group that is not set.
+
+        Args:
+            app_settings (Settings): Application settings
+
+        Returns:
+            tuple[str, ...]: Names of the missing setting group, empty if all are set
+        """
+        for required in cls._required_settings:
+            names = required if isinstance(required, tuple) else (required,)
+            if not any(getattr(app_settings, name, None) for name in names):
+                return names
+        return ()
+
+    @classmethod
+    def is_configured(cls, app_settings: Any) -> bool:
+        """
+        Checks whether the settings required by this client are set.
+
+        Args:
+            app_settings (Settings): Application settings
+
+        Returns:
+            bool: True if the client can be loaded, False otherwise
+        """
+        return not cls._get_missing_settings(app_settings)
+
+    def _get_client_kwargs(self) -> dict[str, Any]:
+        """
+        Builds keyword arguments for the SDK client.
+
+        Override this method in subclasses that need to transform settings
+        before passing them to the SDK.
+
+        HTTP-based SDK clients retry rate limited, timed out and 5xx requests
+        themselves with jittered exponential backoff, so only the request
+        timeout and the number of retries are configured here.
+
+        Returns:
+            dict[str, Any]: Keyword arguments for the SDK client
+        """
+        kwargs = {name: getattr(settings, setting) for name, setting in self._client_settings.items()}
+        if self._uses_shared_http_client:
+            kwargs["http_client"] = get_shared_http_client()
+            kwargs["timeout"] = settings.LLM_TIMEOUT
+            kwargs["max_retries"] = settings.LLM_MAX_RETRIES
+        return kwargs
+
+    def _load_client(self) -> None:
+        """
+        Validates required settings and instantiates the SDK client.
+
+        Raises:
+            ConfigurationException: If required settings are not set
+            Exception: If the SDK client fails to initialize
+        """
+        if missing := self._get_missing_settings(settings):
+            raise ConfigurationException(
+                f"[{self}] failed to load client. Model: {self.model}. {' or '.join(missing)} is not set."
+            )
+
+        try:
+            module_name, _, class_name = self._client_cls.rpartition(".")
+            client_cls = getattr(importlib.import_module(module_name), class_name)
+            self.client = client_cls(**self._get_client_kwargs())
+            self.enabled = True
+        except Exception as err:
+            raise Exception(f"[{self}][{self.model}] failed to load client. Error: {str(err)}")
+
     def _load_response(self, response: str | dict) -> dict | None:
         """
         Parses JSON response from LLM API.
@@ -85,19 +427,150 @@ Return only a JSON object in the following format:
             if isinstance(response, dict):
                 return response
             # Otherwise parse JSON string
-            loaded_data = json.loads(response)
+            loaded_data = orjson.loads(response)
             return loaded_data
+        except orjson.JSONDecodeError as err:
+            if isinstance(response, str) and (recovered := extract_json_object(response)) is not None:
+                bastion_logger.debug("%s Recovered JSON object from non-JSON response", self._log_prefix)
+                return recovered
+            bastion_logger.error(f"[{self}] Response is not valid JSON, error={str(err)}")
+            return None
         except Exception as err:
             bastion_logger.error(f"Error loading response, error={str(err)}")
             return None
 
+    async def _read_stream(self, chunks: AsyncIterator[str]) -> str | dict:
+        """
+        Consumes a streamed LLM response, stopping early on an "allow" verdict.
+
+        The status is looked up in the received text as soon as its value is
+        complete. An "allow" verdict needs no reason, so the rest of the stream
+        is skipped; any other verdict is read to the end to keep its reason.
+
+        Args:
+            chunks (AsyncIterator[str]): Text deltas of the response
+
+        Returns:
+            str | dict: Full response text, or the verdict dict on early exit
+        """
+        buffer = ""
+        status_known = False
+        async for chunk in chunks:
+            if not chunk:
+                continue
+            buffer += chunk
+            if not status_known and (match := _STATUS_PATTERN.search(buffer)):
+                status_known = True
+                if match.group(1) == ActionStatus.ALLOW.value:
+                    bastion_logger.debug("%s Allow verdict received, stream stopped early", self._log_prefix)
+                    return {"status": ActionStatus.ALLOW.value, "reason": ""}
+        return buffer
+
+    def _chat_completion_kwargs(self, messages: list[dict]) -> dict[str, Any]:
+        """
+        Builds the arguments of an OpenAI-compatible chat completion request.
+
+        Override this method in clients whose provider needs different arguments.
+
+        Args:
+            messages (list[dict]): Prepared chat messages
+
+        Returns:
+            dict[str, Any]: Keyword arguments for ``chat.completions.create``
+        """
+        return {
+            "model": self.model,
+            "messages": messages,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            **self._response_format_kwargs,
+        }
+
+    async def _stream_chat_completion(self, messages: list[dict]) -> str | dict:
+        """
+        Streams an OpenAI-compatible chat completion, stopping early on an "allow" verdict.
+
+        Args:
+            messages (list[dict]): Prepared chat messages
+
+        Returns:
+            str | dict: Full response text, or the verdict dict on early exit
+        """
+        stream = await self.client.chat.completions.create(**self._chat_completion_kwargs(messages), stream=True)
+        try:
+            return await self._read_stream(
+                chunk.choices[0].delta.content async for chunk in stream if chunk.choices
+            )
+        finally:
+            await stream.close()
+
+    def _get_chat_completions_endpoint(self) -> tuple[str, dict[str, str]] | None:
+        """
+        Returns the URL and headers for posting chat completions without the SDK.
+
+        Override this method in clients whose provider exposes an
+        OpenAI-compatible chat completions endpoint.
+
+        Returns:
+            tuple[str, dict[str, str]] | None: Endpoint URL and request headers, None if unsupported
+        """
+        return None
+
+    async def _post_chat_completion(self, messages: list[dict]) -> str:
+        """
+        Posts a chat completion request over the shared HTTP client.
+
+        Skips the SDK request and response models, since only the content
+        of the first choice is read.
+
+        Args:
+            messages (list[dict]): Prepared chat messages
+
+        Returns:
+            str: Content of the first choice
+
+        Raises:
+            httpx.HTTPStatusError: If the provider returns an error status
+        """
+        url, headers = self._direct_http
+        payload = self._chat_completion_kwargs(messages)
+        response = await get_shared_http_client().post(url, content=orjson.dumps(payload), headers=headers)
+        response.raise_for_status()
+        return orjson.loads(response.content)["choices"][0]["message"]["content"]
+
+    async def _complete_chat(self, messages: list[dict]) -> str | dict:
+        """
+        Sends an OpenAI-compatible chat completion request and returns the verdict text.
+
+        The response is streamed when LLM_STREAMING_ENABLED is set, posted
+        without the SDK when LLM_DIRECT_HTTP_ENABLED is set and the provider
+        has an endpoint for it, and requested through the SDK otherwise.
+
+        Args:
+            messages (list[dict]): Prepared chat messages
+
+        Returns:
+            str | dict: Response text, or the verdict dict on an early stream exit
+
+        Raises:
+            Exception: On failed connection or API error
+        """
+        if self.stream_responses:
+            return await self._stream_chat_completion(messages)
+        if self._direct_http is not None:
+            return await self._post_chat_completion(messages)
+        response = await self.client.chat.completions.create(**self._chat_completion_kwargs(messages))
+        return response.choices[0].message.content
+
     def _prepare_messages(self, text: str) -> list[dict]:
         """
         Prepares messages for LLM API request.
 
         Creates a conversation structure with system prompt and user input
         for the LLM chat completion API. This is the default format used by
-        OpenAI, Azure OpenAI, and Ollama.
+        OpenAI, Azure OpenAI, and Ollama. The system message is shared by all
+        requests of the class, so only the user message is allocated per call.
+        Messages stay plain dicts because the SDKs validate them as mappings.
 
         Override this method in subclasses if different format is needed
         (e.g., Anthropic uses system parameter separately).
@@ -108,13 +581,7 @@ Return only a JSON object in the following format:
         Returns:
             list[dict]: List of message dictionaries for LLM API
         """
-        return [
-            {
-                "role": "system",
-                "content": self.system_prompt,
-            },
-            {"role": "user", "content": text},
-        ]
+        return [self._system_message, {"role": "user", "content": text}]
 
     def _process_response(
         self, analysis: str | dict, original_text: str
@@ -138,46 +605,259 @@ Return only a JSON object in the following format:
         if analysis_dict is None:
             bastion_logger.error(f"[{self}] Failed to parse LLM response")
             return PipelineResult(
-                name=str(self),
+                name=self._display_name,
                 triggered_rules=[],
                 status=ActionStatus.ERROR,
                 details="Failed to parse LLM response",
             )
 
-        triggered_rules = []
-        if analysis_dict.get("status") in ("block", "notify"):
-            triggered_rules.append(
-                TriggeredRuleData(
-                    id=self._identifier,
-                    name=str(self),
-                    details=analysis_dict.get("reason"),
-                    action=ActionStatus(analysis_dict.get("status")),
-                )
-            )
-
         # Get status with default fallback
         status_str = analysis_dict.get("status", "error")
+        status = ACTION_STATUS_MAP.get(status_str) if isinstance(status_str, str) else None
 
         # Handle empty or invalid status
-        if not status_str or status_str.strip() == "":
-            bastion_logger.error(f"[{self}] Received empty status from LLM")
-            status = ActionStatus.ERROR
-        else:
-            try:
-                status = ActionStatus(status_str)
-            except ValueError:
+        if status is None:
+            if not status_str or (isinstance(status_str, str) and not status_str.strip()):
+                bastion_logger.error(f"[{self}] Received empty status from LLM")
+            else:
                 bastion_logger.error(f"[{self}] Invalid status: {status_str}")
-                status = ActionStatus.ERROR
+            status = ActionStatus.ERROR
+
+        if status is ActionStatus.ALLOW:
+            bastion_logger.info("%s Analyzing for %s, status: %s", self._log_prefix, self._identifier, status)
+            return self._allow_result
+
+        triggered_rules = []
+        if status in _TRIGGER_ACTIONS:
+            # A missing reason should not turn a block or notify verdict into an error
+            reason = analysis_dict.get("reason", "")
+            if self.trust_internal_models and isinstance(reason, str):
+                rule = TriggeredRuleData.model_construct(
+                    id=self._rule_id,
+                    name=self._display_name,
+                    details=reason,
+                    action=_TRIGGER_ACTIONS[status],
+                )
+            else:
+                rule = TriggeredRuleData(
+                    id=self._rule_id,
+                    name=self._display_name,
+                    details=reason,
+                    action=_TRIGGER_ACTIONS[status],
+                )
+            triggered_rules.append(rule)
+
+        bastion_logger.info("%s Analyzing for %s, status: %s", self._log_prefix, self._identifier, status)
+        if self.trust_internal_models:
+            return PipelineResult.model_construct(
+                name=self._display_name, triggered_rules=triggered_rules, status=status
+            )
+        return PipelineResult(
+            name=self._display_name, triggered_rules=triggered_rules, status=status
+        )
+
+    def _process_error(self, msg: str, error: Exception | None = None) -> PipelineResult:
+        """
+        Creates an ERROR analysis result for a failed LLM call.
 
-        bastion_logger.info(f"Analyzing for {self._identifier}, status: {status}")
+        When adaptive concurrency is enabled, a rate limited call halves the
+        number of concurrent requests allowed by the client's pool.
+
+        Args:
+            msg (str): Error description
+            error (Exception | None): Exception raised by the provider call, if any
+
+        Returns:
+            PipelineResult: Result with ERROR status and no triggered rules
+        """
+        if self.adaptive_concurrency and is_rate_limit_error(error):
+            self.pool.decrease()
+            bastion_logger.warning(f"[{self}] Rate limited, concurrency limit lowered to {self.pool.limit}")
         return PipelineResult(
-            name=str(self), triggered_rules=triggered_rules, status=status
+            name=self._display_name,
+            triggered_rules=[],
+            status=ActionStatus.ERROR,
+            details=msg,
+        )
+
+    async def check_connection(self) -> bool:
+        """
+        Checks connection to the LLM provider.
+
+        A successful check is reused for LLM_HEALTHCHECK_TTL seconds, and
+        concurrent checks share a single in-flight probe.
+
+        Returns:
+            bool: True if the provider answered the probe
+
+        Raises:
+            Exception: On failed connection or API error
+        """
+        if self._is_healthcheck_fresh():
+            return True
+        async with self._healthcheck_lock:
+            if self._is_healthcheck_fresh():
+                return True
+            if not await self._probe():
+                return False
+            self._last_ok_ts = time.monotonic()
+            self.enabled = True
+            bastion_logger.info(f"[{self}] Connection check successful")
+            return True
+
+    def _is_healthcheck_fresh(self) -> bool:
+        """
+        Returns True if the last successful connection check is within the TTL.
+        """
+        return self._last_ok_ts is not None and time.monotonic() - self._last_ok_ts < self._healthcheck_ttl
+
+    async def _probe_chat_completion(self) -> Any:
+        """
+        Sends a 1-token completion to the configured model of an OpenAI-compatible API.
+
+        This exercises the actual deployment instead of listing the model catalog.
+
+        Returns:
+            ChatCompletion: Probe response
+        """
+        return await self.client.chat.completions.create(
+            model=self.model, messages=PROBE_MESSAGES, max_tokens=1
         )
 
     @abstractmethod
-    def check_connection(self) -> None:
+    async def _probe(self) -> Any:
+        """
+        Sends a cheap request to the provider.
+
+        Returns:
+            Any: Truthy provider response on success
+
+        Raises:
+            Exception: On failed connection or API error
+        """
         pass
 
+    def _exact_cache_key(self, text: str) -> int:
+        """
+        Builds the exact-match cache key for a prompt.
+
+        Whitespace runs and letter case are normalized so trivially different
+        prompts share a verdict.
+
+        Args:
+            text (str): Text prompt to analyze
+
+        Returns:
+            int: Cache key
+        """
+        return hash((self.model, self._identifier, " ".join(text.split()).lower()))
+
+    async def run(self, text: str) -> PipelineResult:
+        """
+        Analyzes the prompt, reusing cached verdicts where possible.
+
+        The exact-match cache on normalized prompt text is checked first. When
+        the semantic cache is enabled, the prompt embedding is then compared
+        with recently analyzed prompts. The LLM is called only when both miss,
+        and concurrent requests for the same normalized prompt share a single
+        call. ERROR results are never cached. Blank prompts are allowed
+        without a call, and prompts longer than LLM_MAX_PROMPT_BYTES are
+        truncated when the limit is set.
+
+        Args:
+            text (str): Text prompt to analyze
+
+        Returns:
+            PipelineResult: Analysis result with triggered rules or ERROR status on error
+        """
+        if not text or text.isspace():
+            return self._allow_result
+        if self.max_prompt_bytes > 0:
+            text = truncate_utf8(text, self.max_prompt_bytes)
+
+        exact_key = self._exact_cache_key(text)
+        if self._exact_cache is not None:
+            if (cached := self._exact_cache.get(exact_key)) is not None:
+                bastion_logger.debug("%s Exact cache hit", self._log_prefix)
+                return cached
+
+        vector = None
+        if self._semantic_cache is not None:
+            # Imported here so LLM clients do not load torch and sentence-transformers unless the cache is on
+            from app.utils import embed_prompt
+
+            try:
+                vector = await embed_prompt(text)
+            except Exception as err:
+                bastion_logger.warning(f"[{self}] Semantic cache is skipped, failed to embed prompt: {err}")
+            else:
+                if (cached := self._semantic_cache.get(vector)) is not None:
+                    bastion_logger.debug("%s Semantic cache hit", self._log_prefix)
+                    return cached
+
+        call = self._batcher.submit if self._batcher is not None else self._analyze_in_pool
+        result, shared = await self._inflight.do(exact_key, lambda: call(text))
+        if shared:
+            bastion_logger.debug("%s Joined in-flight request", self._log_prefix)
+            return result
+        if result.status != ActionStatus.ERROR:
+            if self.adaptive_concurrency:
+                self.pool.increase()
+            if self._exact_cache is not None:
+                self._exact_cache.put(exact_key, result)
+            if vector is not None:
+                self._semantic_cache.put(vector, result)
+        return result
+
+    async def _analyze_in_pool(self, text: str) -> PipelineResult:
+        """
+        Sends the prompt to the provider while holding a slot of the client's pool.
+
+        Only provider calls take a slot, so cached verdicts and requests that
+        join an in-flight call never wait behind slow provider requests.
+
+        Args:
+            text (str): Text prompt to analyze
+
+        Returns:
+            PipelineResult: Analysis result with triggered rules or ERROR status on error
+        """
+        async with self.pool.get_connection():
+            return await self._analyze(text)
+
+    async def _analyze_batch(self, texts: list[str]) -> list[PipelineResult]:
+        """
+        Analyzes a batch of prompts collected by the micro-batcher.
+
+        By default the prompts are sent concurrently over the shared HTTP pool,
+        each holding its own pool slot. Override this method in subclasses
+        whose provider accepts several prompts in one request, holding one
+        slot around that request.
+
+        Args:
+            texts (list[str]): Text prompts to analyze
+
+        Returns:
+            list[PipelineResult]: Analysis results in the same order as ``texts``
+        """
+        return await asyncio.gather(*(self._analyze_in_pool(text) for text in texts))
+
+    async def close(self) -> None:
+        """
+        Stops background work owned by the client.
+        """
+        if self._batcher is not None:
+            await self._batcher.close()
+
     @abstractmethod
-    def run(self, text: str) -> PipelineResult:
+    async def _analyze(self, text: str) -> PipelineResult:
+        """
+        Sends the prompt to the LLM provider and processes its verdict.
+
+        Args:
+            text (str): Text prompt to analyze
+
+        Returns:
+            PipelineResult: Analysis result with triggered rules or ERROR status on error
+        """
         pass
@@ -0,0 +1,225 @@
+from typing import Any
+
+from app.core.enums import ActionStatus, LLMClientNames
+from app.core.exceptions import ConfigurationException
+from app.managers.llm.clients.anthropic import AsyncAnthropicClient
+from app.managers.llm.clients.azure_openai import AsyncAzureOpenAIClient
+from app.managers.llm.clients.base import VERDICT_JSON_SCHEMA, BaseLLMClient
+from app.managers.llm.clients.litellm import AsyncLiteLLMClient
+from app.managers.llm.clients.ollama import AsyncOllamaClient
+from app.managers.llm.clients.openai import AsyncOpenAIClient
+from app.managers.llm.pool import ConnectionPool
+from app.models.pipeline import PipelineResult, TriggeredRuleData
+from app.modules.logger import bastion_logger
+from settings import get_settings
+
+settings = get_settings()
+
+ESCALATION_CLIENTS: dict[str, type[BaseLLMClient]] = {
+    LLMClientNames.openai.value: AsyncOpenAIClient,
+    LLMClientNames.anthropic.value: AsyncAnthropicClient,
+    LLMClientNames.azure.value: AsyncAzureOpenAIClient,
+    LLMClientNames.litellm.value: AsyncLiteLLMClient,
+}
+
+# Verdict schema extended with the self-reported confidence of the local model
+_CASCADE_JSON_SCHEMA = {
+    **VERDICT_JSON_SCHEMA,
+    "properties": {
+        **VERDICT_JSON_SCHEMA["properties"],
+        "confidence": {"type": "number", "minimum": 0, "maximum": 1},
+    },
+    "required": ["status", "confidence", "reason"],
+}
+
+
+class LocalClassifierClient(AsyncOllamaClient):
+    """
+    Ollama client used as the first stage of the cascade.
+
+    The model reports a confidence with every verdict. Verdicts below
+    LLM_CASCADE_ESCALATION_THRESHOLD are returned as ERROR so the cascade
+    forwards the prompt to the escalation client.
+
+    Attributes:
+        escalation_threshold (float): Minimum confidence to accept a local verdict
+    """
+
+    _display_name = "Cascade Local Classifier"
+
+    def __init__(self, pool: ConnectionPool | None = None):
+        """
+        Initializes the local classifier with a small context window and output limit.
+
+        Args:
+            pool (ConnectionPool | None): Pool of the cascade using this classifier as its first stage
+        """
+        super().__init__(pool)
+        self.model = settings.LLM_CASCADE_LOCAL_MODEL or settings.OLLAMA_MODEL
+        self.escalation_threshold = settings.LLM_CASCADE_ESCALATION_THRESHOLD
+        # A streamed "allow" verdict is returned before the confidence is read
+        self.stream_responses = False
+        if self.structured_output:
+            self._format = _CASCADE_JSON_SCHEMA
+        self._options = {
+            **self._options,
+            "num_ctx": settings.LLM_CASCADE_NUM_CTX,
+            "num_predict": settings.LLM_CASCADE_NUM_PREDICT,
+        }
+
+    @classmethod
+    def _limits_reason(cls) -> bool:
+        """
+        Asks for a short reason, since the output is always capped by LLM_CASCADE_NUM_PREDICT.
+
+        Returns:
+            bool: Always True
+        """
+        return True
+
+    @classmethod
+    def _get_additional_instructions(cls) -> str:
+        """
+        Get instructions asking the local model to report its confidence.
+
+        Returns:
+            str: Additional instructions for the local classifier
+        """
+        return f"""{super()._get_additional_instructions()}
+- Add a "confidence" field to the JSON object: a number from 0 to 1 showing how certain you are of the status"""
+
+    def _process_response(self, analysis: str | dict, original_text: str) -> PipelineResult:
+        """
+        Accepts the local verdict only if its confidence reaches the threshold.
+
+        Args:
+            analysis (str | dict): JSON string or dict response from LLM analysis
+            original_text (str): Original prompt text that was analyzed
+
+        Returns:
+            PipelineResult: Processed analysis result, or ERROR status for low-confidence verdicts
+        """
+        analysis_dict = self._load_response(analysis)
+        if analysis_dict is None:
+            return self._process_error("Failed to parse local classifier response")
+
+        confidence = analysis_dict.get("confidence")
+        if not isinstance(confidence, (int, float)) or confidence < self.escalation_threshold:
+            bastion_logger.info("%s Low confidence verdict: %s", self._log_prefix, confidence)
+            return self._process_error(f"Low confidence verdict: {confidence}")
+        return super()._process_response(analysis_dict, original_text)
+
+
+class CascadeLLMClient(BaseLLMClient):
+    """
+    Two-stage client classifying prompts with a small local model first.
+
+    Prompts are analyzed by a quantized model served by Ollama. Only verdicts
+    the local model is not confident about, or that fail, are escalated to the
+    client named by LLM_CASCADE_ESCALATION_CLIENT. Final verdicts go through
+    the regular exact and semantic caches of this client and are reported
+    under its name. Both stages share the pool of the cascade and have no
+    caches or batcher of their own, so a rate limited escalation lowers the
+    concurrency of the cascade.
+
+    Attributes:
+        _identifier (LLMClientNames): Cascade identifier
+        local_client (LocalClassifierClient): First-stage Ollama classifier
+        escalation_client (BaseLLMClient): Client used for borderline prompts
+    """
+
+    _identifier: LLMClientNames = LLMClientNames.cascade
+    description = "Cascade client using a local Ollama model first and escalating borderline prompts."
+
+    _display_name = "Cascade Client"
+    _required_settings = ("LLM_CASCADE_ENABLED", "OLLAMA_BASE_URL", "LLM_CASCADE_ESCALATION_CLIENT")
+
+    @classmethod
+    def is_configured(cls, app_settings: Any) -> bool:
+        """
+        Checks that the cascade is enabled and its escalation client is configured.
+
+        Args:
+            app_settings (Settings): Application settings
+
+        Returns:
+            bool: True if the client can be loaded, False otherwise
+        """
+        escalation_cls = ESCALATION_CLIENTS.get(app_settings.LLM_CASCADE_ESCALATION_CLIENT)
+        return (
+            super().is_configured(app_settings)
+            and escalation_cls is not None
+            and escalation_cls.is_configured(app_settings)
+        )
+
+    def _load_client(self) -> None:
+        """
+        Validates required settings and instantiates both stages of the cascade.
+
+        Raises:
+            ConfigurationException: If required settings are not set or the escalation client is unknown
+        """
+        if missing := self._get_missing_settings(settings):
+            raise ConfigurationException(f"[{self}] failed to load client. {' or '.join(missing)} is not set.")
+
+        escalation_cls = ESCALATION_CLIENTS.get(settings.LLM_CASCADE_ESCALATION_CLIENT)
+        if escalation_cls is None:
+            raise ConfigurationException(
+                f"[{self}] unknown escalation client: {settings.LLM_CASCADE_ESCALATION_CLIENT}"
+            )
+
+        self.local_client = LocalClassifierClient(self.pool)
+        self.escalation_client = escalation_cls(self.pool)
+        self.model = f"{self.local_client.model} -> {self.escalation_client.model}"
+        self.enabled = True
+
+    async def _probe(self) -> Any:
+        """
+        Checks connections of both stages.
+
+        Raises:
+            Exception: On failed connection or API error
+        """
+        return await self.local_client.check_connection() and await self.escalation_client.check_connection()
+
+    async def _analyze(self, text: str) -> PipelineResult:
+        """
+        Analyzes the prompt locally and escalates low-confidence or failed verdicts.
+
+        Args:
+            text (str): Text prompt to analyze
+
+        Returns:
+            PipelineResult: Analysis result with triggered rules or ERROR status on error
+        """
+        result = await self.local_client._analyze(text)
+        if result.status is ActionStatus.ERROR:
+            bastion_logger.info("%s Escalating to %s", self._log_prefix, self.escalation_client)
+            result = await self.escalation_client._analyze(text)
+        return self._as_cascade_result(result)
+
+    def _as_cascade_result(self, result: PipelineResult) -> PipelineResult:
+        """
+        Reports a verdict of either stage under the cascade's name and identifier.
+
+        Args:
+            result (PipelineResult): Verdict returned by a stage
+
+        Returns:
+            PipelineResult: The same verdict attributed to the cascade
+        """
+        if result.status is ActionStatus.ALLOW:
+            return self._allow_result
+        triggered_rules = [
+            TriggeredRuleData(id=self._rule_id, name=self._display_name, details=rule.details, action=rule.action)
+            for rule in result.triggered_rules
+        ]
+        return PipelineResult(name=self._display_name, triggered_rules=triggered_rules, status=result.status)
+
+    async def close(self) -> None:
+        """
+        Stops background work owned by the cascade and both stages.
+        """
+        await super().close()
+        await self.local_client.close()
+        await self.escalation_client.close()
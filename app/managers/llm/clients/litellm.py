@@ -1,15 +1,14 @@
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-# import ollama
-import openai
-
-from app.core.enums import ActionStatus, LLMClientNames
-from app.core.exceptions import ConfigurationException
+from app.core.enums import LLMClientNames
 from app.managers.llm.clients.base import BaseLLMClient
 from app.models.pipeline import PipelineResult
 from app.modules.logger import bastion_logger
 from settings import get_settings
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
 settings = get_settings()
 
 
@@ -21,31 +20,26 @@ class AsyncLiteLLMClient(BaseLLMClient):
     to analyze prompts for potential issues, ethical concerns, or harmful content. 
 
     Attributes:
-        # _client (ollama.AsyncClient): Official Ollama async client
-        _identifier (LLMClientNames): Ollama identifier
+        _client (AsyncOpenAI): OpenAI-compatible async client for the LiteLLM proxy
+        _identifier (LLMClientNames): LiteLLM identifier
         model (str): Model to use for analysis (e.g., llama3, mistral)
         SYSTEM_PROMPT (str): System prompt for AI analysis
     """
 
-    # _client: ollama.AsyncClient
+    _client: "AsyncOpenAI"
     _identifier: LLMClientNames = LLMClientNames.litellm
     description = "LiteLLM-based client for locally routed LLM models or Cloud-based models (via OpenRouter)."
 
-    def __init__(self):
-        """
-        Initializes LiteLLM pipeline with API client and model configuration.
+    _display_name = "LiteLLM Client"
+    _client_cls = "openai.AsyncOpenAI"
+    _model_setting = "LITELLM_MODEL"
+    _required_settings = ("LITELLM_BASE_URL",)
+    _client_settings = {"base_url": "LITELLM_BASE_URL"}
+    _uses_shared_http_client = True
+    _supports_structured_output = True
 
-        Sets up an async client pointing to LiteLLM router server
-        and configures the model for analysis.
-        """
-        super().__init__()
-        self.client = None
-        model = settings.LITELLM_MODEL
-        self.model = model
-        self.system_prompt = self._build_system_prompt()
-        self.__load_client()
-
-    def _get_additional_instructions(self) -> str:
+    @classmethod
+    def _get_additional_instructions(cls) -> str:
         """
         Get Ollama-specific additional instructions.
 
@@ -57,44 +51,38 @@ class AsyncLiteLLMClient(BaseLLMClient):
 - Always return valid JSON format as specified above
 - Focus on accurate threat detection for local LLM deployments"""
 
-    def __str__(self) -> str:
-        return "LiteLLM Client"
+    def _get_client_kwargs(self) -> dict[str, Any]:
+        """
+        Builds LiteLLM client arguments. The proxy does not check the API key.
 
-    async def check_connection(self) -> None | Any:
+        Returns:
+            dict[str, Any]: Keyword arguments for openai.AsyncOpenAI
         """
-        Checks connection to LiteLLM Proxy Router.
+        return {**super()._get_client_kwargs(), "api_key": "anything"}
 
-        Raises:
-            Exception: On failed connection or API error
+    def _get_chat_completions_endpoint(self) -> tuple[str, dict[str, str]] | None:
         """
-        try:
-            # Test request to check LiteLLM connectivity by listing available models
-            models = await self.client.list()
-            if models:
-                self.enabled = True
-                bastion_logger.info(f"[{self}] Connection check successful")
-            return models
-        except Exception as e:
-            raise Exception(f"Failed to connect to LiteLLM Proxy Router: {e}")
+        Returns the LiteLLM Proxy Router chat completions URL.
 
-    def __load_client(self) -> None:
+        Returns:
+            tuple[str, dict[str, str]]: Endpoint URL and request headers
         """
-        Loads the LiteLLM client using openai library.
+        url = f"{settings.LITELLM_BASE_URL.rstrip('/')}/chat/completions"
+        return url, {"Content-Type": "application/json"}
+
+    async def _probe(self) -> Any:
         """
-        if not settings.LITELLM_BASE_URL:
-            raise ConfigurationException(
-                f"[{self}] failed to load client. Model: {self.model}. LiteLLM base URL is not set."
-            )
+        Sends a 1-token completion to the configured LiteLLM model route.
 
+        Raises:
+            Exception: On failed connection or API error
+        """
         try:
-            self.client = openai.OpenAI(api_key="anything", base_url=settings.LITELLM_BASE_URL)
-            self.enabled = True
-        except Exception as err:
-            raise Exception(
-                f"[{self}][{self.model}] failed to load client. Error: {str(err)}"
-            )
+            return await self._probe_chat_completion()
+        except Exception as e:
+            raise Exception(f"Failed to connect to LiteLLM Proxy Router: {e}")
 
-    async def run(self, text: str) -> PipelineResult:
+    async def _analyze(self, text: str) -> PipelineResult:
         """
         Performs AI-powered analysis of the prompt using LiteLLM.
 
@@ -110,22 +98,10 @@ class AsyncLiteLLMClient(BaseLLMClient):
         """
         messages = self._prepare_messages(text)
         try:
-            # bastion_logger.info(f"Analysis: {analysis}")
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-            )
-            analysis = response.choices[0].message.content
-            bastion_logger.info(f"Analysis: {analysis}")
+            analysis = await self._complete_chat(messages)
+            bastion_logger.info("%s Analysis: %s", self._log_prefix, analysis)
             return self._process_response(analysis, text)
         except Exception as err:
             msg = f"LiteLLM - Error analyzing prompt, error={str(err)}"
             bastion_logger.error(msg)
-            error_data = {
-                "status": ActionStatus.ERROR,
-                "reason": msg,
-            }
-            return self._process_response(error_data, text)
\ No newline at end of file
+            return self._process_error(msg, err)
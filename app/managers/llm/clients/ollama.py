@@ -1,14 +1,15 @@
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import ollama
-
-from app.core.enums import ActionStatus, LLMClientNames
-from app.core.exceptions import ConfigurationException
-from app.managers.llm.clients.base import BaseLLMClient
+from app.core.enums import LLMClientNames
+from app.managers.llm.clients.base import HTTP_LIMITS, VERDICT_JSON_SCHEMA, BaseLLMClient, get_shared_http_client
+from app.managers.llm.pool import ConnectionPool
 from app.models.pipeline import PipelineResult
 from app.modules.logger import bastion_logger
 from settings import get_settings
 
+if TYPE_CHECKING:
+    import ollama
+
 settings = get_settings()
 
 
@@ -27,25 +28,36 @@ class AsyncOllamaClient(BaseLLMClient):
         SYSTEM_PROMPT (str): System prompt for AI analysis
     """
 
-    _client: ollama.AsyncClient
+    _client: "ollama.AsyncClient"
     _identifier: LLMClientNames = LLMClientNames.ollama
     description = "Ollama-based client for locally hosted LLM models using official Ollama library."
 
-    def __init__(self):
+    _display_name = "Ollama Client"
+    _client_cls = "ollama.AsyncClient"
+    _model_setting = "OLLAMA_MODEL"
+    _required_settings = ("OLLAMA_BASE_URL",)
+    _supports_structured_output = True
+
+    def __init__(self, pool: ConnectionPool | None = None):
         """
-        Initializes Ollama pipeline with API client and model configuration.
+        Initializes Ollama client and the response format and options used for every call.
 
-        Sets up the official Ollama async client pointing to Ollama server
-        and configures the model for analysis.
+        Args:
+            pool (ConnectionPool | None): Pool of the client using this one as a stage
         """
-        super().__init__()
-        self.client = None
-        model = settings.OLLAMA_MODEL
-        self.model = model
-        self.system_prompt = self._build_system_prompt()
-        self.__load_client()
-
-    def _get_additional_instructions(self) -> str:
+        super().__init__(pool)
+        # Force JSON output, constrained to the verdict schema when enabled
+        self._format = VERDICT_JSON_SCHEMA if self.structured_output else "json"
+        self._options = {
+            "temperature": self.temperature,
+            "num_predict": self.max_tokens,
+        }
+        # Keeping the model loaded keeps the cached system prompt prefix warm
+        self._keep_alive = settings.OLLAMA_KEEP_ALIVE
+        self._version_url = f"{self._get_client_kwargs()['host']}/api/version"
+
+    @classmethod
+    def _get_additional_instructions(cls) -> str:
         """
         Get Ollama-specific additional instructions.
 
@@ -57,50 +69,53 @@ class AsyncOllamaClient(BaseLLMClient):
 - Always return valid JSON format as specified above
 - Focus on accurate threat detection for local LLM deployments"""
 
-    def __str__(self) -> str:
-        return "Ollama Client"
+    def _get_client_kwargs(self) -> dict[str, Any]:
+        """
+        Builds Ollama client arguments from OLLAMA_BASE_URL.
+
+        The /v1 suffix is removed if present since the official library doesn't use it.
+        The library builds its own httpx client, so only the shared pool limits and timeout are passed.
 
-    async def check_connection(self) -> None | Any:
+        Returns:
+            dict[str, Any]: Keyword arguments for ollama.AsyncClient
         """
-        Checks connection to Ollama API.
+        host = settings.OLLAMA_BASE_URL.rstrip("/")
+        if host.endswith("/v1"):
+            host = host[:-3]
+        return {"host": host, "limits": HTTP_LIMITS, "timeout": settings.LLM_TIMEOUT}
+
+    async def _probe(self) -> Any:
+        """
+        Checks Ollama connectivity with the version endpoint and warms up the model.
+
+        The response is a few bytes and, unlike listing models, does not
+        depend on how many models are installed.
 
         Raises:
             Exception: On failed connection or API error
         """
         try:
-            # Test request to check Ollama connectivity by listing available models
-            models = await self.client.list()
-            if models:
-                self.enabled = True
-                bastion_logger.info(f"[{self}] Connection check successful")
-            return models
+            response = await get_shared_http_client().get(self._version_url)
+            response.raise_for_status()
         except Exception as e:
             raise Exception(f"Failed to connect to Ollama API: {e}")
+        await self._warm_up()
+        return True
 
-    def __load_client(self) -> None:
-        """
-        Loads the Ollama client using official Ollama library.
+    async def _warm_up(self) -> None:
         """
-        if not settings.OLLAMA_BASE_URL:
-            raise ConfigurationException(
-                f"[{self}] failed to load client. Model: {self.model}. Ollama base URL is not set."
-            )
-
-        # Extract host from OLLAMA_BASE_URL
-        # Remove /v1 suffix if present since official library doesn't use it
-        host = settings.OLLAMA_BASE_URL.rstrip("/")
-        if host.endswith("/v1"):
-            host = host[:-3]
+        Loads the model into memory so the first prompt does not pay the load time.
 
+        A chat request without messages only loads the model, and keep_alive
+        keeps it loaded between requests.
+        """
         try:
-            self.client = ollama.AsyncClient(host=host)
-            self.enabled = True
-        except Exception as err:
-            raise Exception(
-                f"[{self}][{self.model}] failed to load client. Error: {str(err)}"
-            )
+            await self.client.chat(model=self.model, messages=[], keep_alive=self._keep_alive)
+            bastion_logger.info(f"[{self}] Model {self.model} loaded")
+        except Exception as e:
+            bastion_logger.warning(f"[{self}] Failed to warm up model {self.model}: {e}")
 
-    async def run(self, text: str) -> PipelineResult:
+    async def _analyze(self, text: str) -> PipelineResult:
         """
         Performs AI-powered analysis of the prompt using Ollama.
 
@@ -115,20 +130,20 @@ class AsyncOllamaClient(BaseLLMClient):
             PipelineResult: Analysis result with triggered rules or ERROR status on error
         """
         messages = self._prepare_messages(text)
+        if self.stream_responses:
+            return await self._analyze_streamed(text, messages)
         try:
             response = await self.client.chat(
                 model=self.model,
                 messages=messages,
-                format="json",  # Force JSON response format
-                options={
-                    "temperature": self.temperature,
-                    "num_predict": self.max_tokens,
-                },
+                format=self._format,
+                options=self._options,
+                keep_alive=self._keep_alive,
             )
 
             # Debug logging
-            bastion_logger.debug(f"Ollama response type: {type(response)}")
-            bastion_logger.debug(f"Ollama response: {response}")
+            bastion_logger.debug("%s Ollama response type: %s", self._log_prefix, type(response))
+            bastion_logger.debug("%s Ollama response: %s", self._log_prefix, response)
 
             # Handle dict response
             if isinstance(response, dict):
@@ -149,21 +164,53 @@ class AsyncOllamaClient(BaseLLMClient):
                 bastion_logger.error(
                     f"Failed to extract content from response: {response}"
                 )
-                return PipelineResult(
-                    name=str(self),
-                    triggered_rules=[],
-                    status=ActionStatus.ERROR,
-                    details="Failed to extract content from Ollama response",
-                )
+                return self._process_error("Failed to extract content from Ollama response")
 
-            bastion_logger.info(f"Analysis: {analysis}")
+            bastion_logger.info("%s Analysis: %s", self._log_prefix, analysis)
             return self._process_response(analysis, text)
         except Exception as err:
             msg = f"Error analyzing prompt, error={str(err)}"
             bastion_logger.error(msg)
-            return PipelineResult(
-                name=str(self),
-                triggered_rules=[],
-                status=ActionStatus.ERROR,
-                details=msg,
+            return self._process_error(msg, err)
+
+    async def _analyze_streamed(self, text: str, messages: list[dict]) -> PipelineResult:
+        """
+        Performs the analysis with a streamed Ollama response.
+
+        Some models return no content when streamed with a format; streaming
+        is then turned off for this client and the prompt is analyzed again
+        without it.
+
+        Args:
+            text (str): Text prompt to analyze
+            messages (list[dict]): Prepared chat messages
+
+        Returns:
+            PipelineResult: Analysis result with triggered rules or ERROR status on error
+        """
+        try:
+            stream = await self.client.chat(
+                model=self.model,
+                messages=messages,
+                format=self._format,
+                options=self._options,
+                keep_alive=self._keep_alive,
+                stream=True,
             )
+            chunks = (chunk["message"]["content"] async for chunk in stream)
+            try:
+                analysis = await self._read_stream(chunks)
+            finally:
+                await chunks.aclose()
+
+            if not analysis:
+                bastion_logger.warning(f"[{self}] Empty streamed response, falling back to non-streaming requests")
+                self.stream_responses = False
+                return await self._analyze(text)
+
+            bastion_logger.info("%s Analysis: %s", self._log_prefix, analysis)
+            return self._process_response(analysis, text)
+        except Exception as err:
+            msg = f"Error analyzing prompt, error={str(err)}"
+            bastion_logger.error(msg)
+            return self._process_error(msg, err)
@@ -1,14 +1,14 @@
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from openai import AsyncOpenAI
-
-from app.core.enums import ActionStatus, LLMClientNames
-from app.core.exceptions import ConfigurationException
+from app.core.enums import LLMClientNames
 from app.managers.llm.clients.base import BaseLLMClient
 from app.models.pipeline import PipelineResult
 from app.modules.logger import bastion_logger
 from settings import get_settings
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
 settings = get_settings()
 
 
@@ -27,25 +27,20 @@ class AsyncOpenAIClient(BaseLLMClient):
         SYSTEM_PROMPT (str): System prompt for AI analysis
     """
 
-    _client: AsyncOpenAI
+    _client: "AsyncOpenAI"
     _identifier: LLMClientNames = LLMClientNames.openai
     description = "OpenAI-based client for LLM operations using AI language models."
 
-    def __init__(self):
-        """
-        Initializes OpenAI pipeline with API client and model configuration.
+    _display_name = "OpenAI Client"
+    _client_cls = "openai.AsyncOpenAI"
+    _model_setting = "OPENAI_MODEL"
+    _required_settings = (("OPENAI_API_KEY", "OPENAI_BASE_URL"),)
+    _client_settings = {"api_key": "OPENAI_API_KEY", "base_url": "OPENAI_BASE_URL"}
+    _uses_shared_http_client = True
+    _supports_structured_output = True
 
-        Sets up the OpenAI API client with the provided API key and configures
-        the model for analysis. Enables the pipeline if API key is available.
-        """
-        super().__init__()
-        self.client = None
-        model = settings.OPENAI_MODEL
-        self.model = model
-        self.system_prompt = self._build_system_prompt()
-        self.__load_client()
-
-    def _get_additional_instructions(self) -> str:
+    @classmethod
+    def _get_additional_instructions(cls) -> str:
         """
         Get OpenAI-specific additional instructions.
 
@@ -54,46 +49,29 @@ class AsyncOpenAIClient(BaseLLMClient):
         """
         return """"""
 
-    def __str__(self) -> str:
-        return "OpenAI Client"
+    def _get_chat_completions_endpoint(self) -> tuple[str, dict[str, str]] | None:
+        """
+        Returns the OpenAI chat completions URL and bearer token headers.
+
+        Returns:
+            tuple[str, dict[str, str]]: Endpoint URL and request headers
+        """
+        url = f"{settings.OPENAI_BASE_URL.rstrip('/')}/chat/completions"
+        return url, {"Authorization": f"Bearer {settings.OPENAI_API_KEY}", "Content-Type": "application/json"}
 
-    async def check_connection(self) -> None | Any:
+    async def _probe(self) -> Any:
         """
-        Checks connection to OpenAI API.
+        Sends a 1-token completion to the configured OpenAI model.
 
         Raises:
             Exception: On failed connection or API error
         """
         try:
-            # Simple test request to check API connectivity
-            status = await self.client.models.list()
-            if status:
-                self.enabled = True
-                bastion_logger.info(f"[{self}] Connection check successful")
-            return status
+            return await self._probe_chat_completion()
         except Exception as e:
             raise Exception(f"Failed to connect to OpenAI API: {e}")
 
-    def __load_client(self) -> None:
-        """
-        Loads the OpenAI client.
-        """
-        if not (settings.OPENAI_API_KEY or settings.OPENAI_BASE_URL):
-            raise ConfigurationException(
-                f"[{self}] failed to load client. Model: {self.model}. API key or base URL is not set."
-            )
-        else:
-            openai_settings = {
-                "api_key": settings.OPENAI_API_KEY,
-                "base_url": settings.OPENAI_BASE_URL,
-            }
-            try:
-                self.client = AsyncOpenAI(**openai_settings)
-                self.enabled = True
-            except Exception as err:
-                raise Exception(f"[{self}][{self.model}] failed to load client. Error: {str(err)}")
-
-    async def run(self, text: str) -> PipelineResult:
+    async def _analyze(self, text: str) -> PipelineResult:
         """
         Performs AI-powered analysis of the prompt using OpenAI.
 
@@ -109,17 +87,10 @@ class AsyncOpenAIClient(BaseLLMClient):
         """
         messages = self._prepare_messages(text)
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model, messages=messages, temperature=self.temperature, max_tokens=self.max_tokens
-            )
-            analysis = response.choices[0].message.content
-            bastion_logger.info(f"Analysis: {analysis}")
+            analysis = await self._complete_chat(messages)
+            bastion_logger.info("%s Analysis: %s", self._log_prefix, analysis)
             return self._process_response(analysis, text)
         except Exception as err:
             msg = f"Error analyzing prompt, error={str(err)}"
             bastion_logger.error(msg)
-            error_data = {
-                "status": ActionStatus.ERROR,
-                "reason": msg,
-            }
-            return self._process_response(error_data, text)
+            return self._process_error(msg, err)
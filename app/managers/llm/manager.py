@@ -1,29 +1,33 @@
 from app.core.enums import ActionStatus, ManagerNames
 from app.core.manager import BaseManager
 from app.managers.llm.clients import ALL_CLIENTS_MAP
-from app.managers.llm.clients.base import BaseLLMClient
+from app.managers.llm.clients.base import BaseLLMClient, close_shared_http_client
 from app.models.pipeline import PipelineResult
 from app.modules.logger import bastion_logger
-from settings import get_settings
 
-settings = get_settings()
+_NO_CLIENT_MSG = "No active LLM client available for text validation"
+_NO_CLIENT_RESULT = PipelineResult(
+    name="LLM Manager", triggered_rules=[], status=ActionStatus.ERROR, details=_NO_CLIENT_MSG
+)
 
 
 class LLMManager(BaseManager[BaseLLMClient]):
     """
-    Manager class for similarity search operations.
+    Manager class for LLM operations.
 
     This class manages connections to different LLM clients,
     providing a unified interface for LLM operations. It automatically
-    selects the appropriate client based on available settings, with OpenAI
-    being the default when both are available.
+    selects the client named by LLM_DEFAULT_CLIENT, falling back to the
+    first configured client.
 
     Attributes:
         _clients_map (Dict[str, BaseLLMClient]): Mapping of client identifiers to client instances
-        _active_client (Optional[BaseSearchClient]): Currently active client for operations
+        _active_client (Optional[BaseLLMClient]): Currently active client for operations
         _active_client_id (str): Identifier of the active client
     """
 
+    __slots__ = ()
+
     _identifier: ManagerNames = ManagerNames.llm
     description = "Manager class for LLM operations using AI language models."
 
@@ -31,40 +35,22 @@ class LLMManager(BaseManager[BaseLLMClient]):
         """
         Initializes LLMManager with available LLM clients.
 
-        Creates LLM clients based on available settings.
-        Sets the active client according to priority:
-        1. OpenAI (if available)
-        2. Other LLM clients (if available)
-        3. None (if neither available)
+        Builds the client named by LLM_DEFAULT_CLIENT, or the first configured
+        one if it is not available. Other clients are built on first use.
         """
         super().__init__(ALL_CLIENTS_MAP, "LLM_DEFAULT_CLIENT")
 
     def __str__(self) -> str:
         return "LLM Manager"
 
-    async def _check_connections(self) -> None:
-        """
-        Checks connections for all initialized clients.
-        Connection checks are deferred until the first async operation.
-        """
-        bastion_logger.debug("Checking connections for all initialized clients")
-        for client in self._clients_map.values():
-            try:
-                status = await client.check_connection()
-                if status:
-                    client.enabled = True
-                    bastion_logger.info(f"[{self}][{client}] Connection check successful")
-                else:
-                    bastion_logger.error(f"[{self}][{client}] Check connection failed")
-            except Exception as e:
-                bastion_logger.error(f"{str(e)}")
-
     async def run(self, text: str) -> PipelineResult:
         """
         Validates input text using the active client.
 
         Delegates the validation of input text to the currently active client.
         Returns PipelineResult with ERROR status if no client is available.
+        Provider errors are already turned into ERROR results by the client,
+        and anything unexpected is handled by the LLM pipeline.
 
         Args:
             text (str): Text prompt to analyze
@@ -72,24 +58,15 @@ class LLMManager(BaseManager[BaseLLMClient]):
         Returns:
             PipelineResult: Result of text validation or ERROR status if no client available
         """
-        if not self._active_client:
-            msg = "No active LLM client available for text validation"
-            bastion_logger.warning(msg)
-            return PipelineResult(
-                name=str(self),
-                triggered_rules=[],
-                status=ActionStatus.ERROR,
-                details=msg,
-            )
+        client = self._active_client
+        if not client:
+            bastion_logger.warning(_NO_CLIENT_MSG)
+            return _NO_CLIENT_RESULT
+        return await client.run(text)
 
-        try:
-            return await self._active_client.run(text=text)
-        except Exception as e:
-            msg = f"Error during validation of input text with {self._active_client_id}: {e}"
-            bastion_logger.error(msg)
-            return PipelineResult(
-                name=str(self),
-                triggered_rules=[],
-                status=ActionStatus.ERROR,
-                details=msg,
-            )
+    async def close_connections(self) -> None:
+        """
+        Closes all available clients and the HTTP connection pool they share.
+        """
+        await super().close_connections()
+        await close_shared_http_client()
@@ -0,0 +1,153 @@
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque
+
+
+class ConnectionPool:
+    """
+    Burstable slot pool limiting concurrent requests to an LLM provider.
+
+    Free slots are kept in a plain deque, so acquiring a slot while the pool
+    has capacity never yields to the event loop. Once all regular slots are in
+    use, up to ``burst_limit`` extra slots are handed out to absorb spikes.
+    Only when both are exhausted does a caller wait for a released slot.
+
+    The number of slots in use can additionally be capped by an adaptive
+    limit: ``decrease`` halves it when the provider rate limits requests and
+    ``increase`` raises it by one slot per successful request (AIMD).
+
+    Attributes:
+        size (int): Number of regular slots
+        burst_limit (int): Number of extra slots allowed above ``size``
+    """
+
+    def __init__(self, size: int, burst_limit: int = 0) -> None:
+        """
+        Initializes the pool.
+
+        Args:
+            size (int): Number of regular slots, must be positive
+            burst_limit (int): Number of extra slots allowed during spikes
+        """
+        if size < 1:
+            raise ValueError("Connection pool size must be positive")
+        self.size = size
+        self.burst_limit = max(burst_limit, 0)
+        self._available: Deque[int] = deque(range(size))
+        self._burst_in_use = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._limit = size + self.burst_limit
+
+    @property
+    def in_use(self) -> int:
+        """
+        Returns the number of slots currently handed out.
+
+        Returns:
+            int: Regular plus burst slots in use
+        """
+        return self.size - len(self._available) + self._burst_in_use
+
+    @property
+    def limit(self) -> int:
+        """
+        Returns the current adaptive limit of slots in use.
+
+        Returns:
+            int: Maximum number of slots handed out at once
+        """
+        return self._limit
+
+    def _acquire_nowait(self) -> int | None:
+        """
+        Takes a slot without waiting.
+
+        Returns:
+            int | None: Regular slot index, -1 for a burst slot, None if at capacity
+        """
+        if self.in_use >= self._limit:
+            return None
+        if self._available:
+            return self._available.popleft()
+        if self._burst_in_use < self.burst_limit:
+            self._burst_in_use += 1
+            return -1
+        return None
+
+    async def acquire(self) -> int:
+        """
+        Takes a slot, waiting only when the pool is at capacity.
+
+        Returns:
+            int: Slot index, -1 for a burst slot
+        """
+        slot = self._acquire_nowait()
+        if slot is not None:
+            return slot
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            return await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release(waiter.result())
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self, slot: int) -> None:
+        """
+        Returns a slot to the pool and wakes waiters the limit allows.
+
+        Args:
+            slot (int): Slot index returned by ``acquire``
+        """
+        if slot == -1:
+            self._burst_in_use -= 1
+        else:
+            self._available.append(slot)
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        """
+        Hands free slots to waiting callers in arrival order.
+        """
+        while self._waiters:
+            slot = self._acquire_nowait()
+            if slot is None:
+                return
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                self.release(slot)
+                return
+            waiter.set_result(slot)
+
+    def decrease(self) -> None:
+        """
+        Halves the adaptive limit after the provider rejected a request.
+        """
+        self._limit = max(self._limit // 2, 1)
+
+    def increase(self) -> None:
+        """
+        Raises the adaptive limit by one slot after a successful request.
+        """
+        if self._limit < self.size + self.burst_limit:
+            self._limit += 1
+            self._wake_waiters()
+
+    @asynccontextmanager
+    async def get_connection(self) -> AsyncIterator[int]:
+        """
+        Holds a pool slot for the duration of the context.
+
+        Yields:
+            int: Slot index, -1 for a burst slot
+        """
+        slot = await self.acquire()
+        try:
+            yield slot
+        finally:
+            self.release(slot)
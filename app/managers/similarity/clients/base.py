@@ -1,18 +1,117 @@
 import asyncio
+import hashlib
+import time
 from abc import ABC, abstractmethod
+from operator import itemgetter
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
+from app.core.cache import AdaptiveSemanticCache, LRUCache
 from app.core.exceptions import ConfigurationException
+from app.core.singleflight import SingleFlight
 from app.core.enums import RuleAction
 from app.models.pipeline import PipelineResult, TriggeredRuleData
 from app.modules.logger import bastion_logger
-from app.utils import text_embedding, split_text_into_sentences
+from app.utils import run_in_embedding_thread, split_text_into_sentences, text_embedding_batch
 from settings import get_settings
 from scripts.similarity.const import INDEX_MAPPING
 
 
 settings = get_settings()
 
+# Seconds before a missing prompt index is checked again
+INDEX_RECHECK_INTERVAL = 30.0
+
+# Dimension of the vectors stored in the prompt index
+EMBEDDING_DIMENSION = 768
+
+# Documents written per bulk indexing request
+INDEX_BATCH_SIZE = 100
+
+# Retries of documents rejected with 429 by an overloaded cluster, and the first backoff in seconds
+INDEX_MAX_RETRIES = 3
+INDEX_RETRY_BACKOFF = 1.0
+
+# Searches sent per multi-search request
+SEARCH_BATCH_SIZE = 64
+
+# Sentence embeddings shared by all search clients; repeated sentences skip the model
+_embedding_cache: LRUCache[str, np.ndarray] = LRUCache(settings.SIMILARITY_EMBEDDING_CACHE_SIZE)
+
+
+def embed_sentences(chunks: List[str]) -> List[np.ndarray]:
+    """
+    Returns the embeddings of sentences, reusing those embedded before.
+
+    Sentences missing from the cache are embedded together in one model call.
+    Cached vectors are read-only because they are shared between requests.
+
+    Args:
+        chunks (List[str]): Sentences to embed
+
+    Returns:
+        List[np.ndarray]: Normalized float32 embedding of each sentence
+    """
+    keys = [chunk.strip() for chunk in chunks]
+    vectors = {key: vector for key in keys if (vector := _embedding_cache.get(key)) is not None}
+    if vectors:
+        bastion_logger.debug("Embedding cache hits: %s of %s", len(vectors), len(keys))
+
+    missing = [key for key in dict.fromkeys(keys) if key not in vectors]
+    if missing:
+        for key, row in zip(missing, text_embedding_batch(missing)):
+            vector = row.copy()
+            vector.setflags(write=False)
+            _embedding_cache.put(key, vector)
+            vectors[key] = vector
+    return [vectors[key] for key in keys]
+
+
+def _vector_key(vector: np.ndarray) -> bytes:
+    """
+    Returns the result cache key of a query vector.
+
+    The vector is rounded to float16, so tiny numerical differences between
+    embeddings of the same sentence share a key.
+
+    Args:
+        vector (np.ndarray): Query vector
+
+    Returns:
+        bytes: 16-byte digest of the rounded vector
+    """
+    return hashlib.blake2b(np.asarray(vector, dtype=np.float16).tobytes(), digest_size=16).digest()
+
+
+def best_hit_per_category(resp: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Keeps only the best hit per category of a search response.
+
+    Args:
+        resp (Dict[str, Any]): Search response, hits sorted by score
+
+    Returns:
+        List[Dict[str, Any]]: Best hit of each category
+    """
+    documents = {}
+    for hit in resp.get("hits", {}).get("hits", ()):
+        documents.setdefault(hit["_source"]["category"], hit)
+    return list(documents.values())
+
+
+def _document_ids(documents: List[Dict[str, Any]]) -> frozenset:
+    """
+    Returns the ids of the documents in a search result.
+
+    Args:
+        documents (List[Dict[str, Any]]): Search result documents
+
+    Returns:
+        frozenset: Document ids
+    """
+    return frozenset(doc["_source"].get("id") for doc in documents)
+
 
 class BaseSearchClient(ABC):
     """
@@ -28,6 +127,7 @@ class BaseSearchClient(ABC):
     """
 
     _identifier: str | None = None
+    _display_name: str = "Search Client"
     enabled: bool = False
 
     def __init__(self, similarity_prompt_index: str, search_settings: Any) -> None:
@@ -42,6 +142,23 @@ class BaseSearchClient(ABC):
         self._search_settings = search_settings
         self.notify_threshold = settings.SIMILARITY_NOTIFY_THRESHOLD
         self.block_threshold = settings.SIMILARITY_BLOCK_THRESHOLD
+        self._index_checked = False
+        self._index_recheck_at = 0.0
+        self._search_failures = 0
+        self._result_cache: LRUCache[bytes, List[Dict[str, Any]]] | None = None
+        if settings.SIMILARITY_RESULT_CACHE_SIZE > 0:
+            self._result_cache = LRUCache(settings.SIMILARITY_RESULT_CACHE_SIZE, settings.SIMILARITY_RESULT_CACHE_TTL)
+        self._prompt_cache: LRUCache[bytes, PipelineResult] | None = None
+        if settings.SIMILARITY_PROMPT_CACHE_SIZE > 0:
+            self._prompt_cache = LRUCache(settings.SIMILARITY_PROMPT_CACHE_SIZE, settings.SIMILARITY_RESULT_CACHE_TTL)
+        self._region_cache: AdaptiveSemanticCache[List[Dict[str, Any]]] | None = None
+        if settings.SIMILARITY_REGION_CACHE_SIZE > 0:
+            self._region_cache = AdaptiveSemanticCache(
+                settings.SIMILARITY_REGION_CACHE_SIZE,
+                settings.SIMILARITY_REGION_CACHE_THRESHOLD,
+                settings.SIMILARITY_REGION_CACHE_MIN_THRESHOLD,
+            )
+        self._inflight: SingleFlight[bytes, PipelineResult] = SingleFlight()
         self._client = self._initialize_client()
 
     def __str__(self) -> str:
@@ -49,9 +166,9 @@ class BaseSearchClient(ABC):
         String representation of the client.
 
         Returns:
-            str: Class name of the client
+            str: Display name of the client
         """
-        return self.__class__.__name__
+        return self._display_name
 
     def __repr__(self) -> str:
         """
@@ -62,6 +179,19 @@ class BaseSearchClient(ABC):
         """
         return self.__str__()
 
+    @classmethod
+    def is_configured(cls, app_settings: Any) -> bool:
+        """
+        Checks whether connection settings for this search system are set.
+
+        Args:
+            app_settings (Settings): Application settings
+
+        Returns:
+            bool: True if the client can be initialized, False otherwise
+        """
+        return True
+
     @property
     def client(self) -> Any:
         """
@@ -127,11 +257,53 @@ class BaseSearchClient(ABC):
         Creates index.
         """
         try:
+            self._clear_result_caches()
             return await self._client.index(index=self.similarity_prompt_index, body=body)
         except Exception as e:
             bastion_logger.error(f"[{self}][{self._search_settings.host}][{self.similarity_prompt_index}] Failed to create index: {e}")
             return False
 
+    async def index_bulk(self, bodies: List[Dict[str, Any]]) -> bool:
+        """
+        Indexes documents with bulk requests of up to INDEX_BATCH_SIZE documents.
+
+        Documents rejected with 429 are resent with exponential backoff, up to
+        INDEX_MAX_RETRIES times; any other document error fails the upload.
+
+        Args:
+            bodies (List[Dict[str, Any]]): Documents to index
+
+        Returns:
+            bool: True if all documents were indexed, False otherwise
+        """
+        self._clear_result_caches()
+        action = {"index": {"_index": self.similarity_prompt_index}}
+        for start in range(0, len(bodies), INDEX_BATCH_SIZE):
+            batch = bodies[start : start + INDEX_BATCH_SIZE]
+            for attempt in range(INDEX_MAX_RETRIES + 1):
+                if attempt:
+                    await asyncio.sleep(INDEX_RETRY_BACKOFF * 2 ** (attempt - 1))
+                operations = []
+                for body in batch:
+                    operations.append(action)
+                    operations.append(body)
+                try:
+                    resp = await self._client.bulk(body=operations)
+                except Exception as e:
+                    bastion_logger.error(f"[{self}][{self._search_settings.host}][{self.similarity_prompt_index}] Failed to index documents: {e}")
+                    return False
+                if not resp.get("errors"):
+                    break
+                statuses = [item["index"].get("status") for item in resp["items"]]
+                if any(status >= 300 and status != 429 for status in statuses):
+                    bastion_logger.error(f"[{self}][{self._search_settings.host}][{self.similarity_prompt_index}] Failed to index some documents")
+                    return False
+                batch = [body for body, status in zip(batch, statuses) if status == 429]
+            else:
+                bastion_logger.error(f"[{self}][{self._search_settings.host}][{self.similarity_prompt_index}] Documents still rejected after {INDEX_MAX_RETRIES} retries")
+                return False
+        return True
+
     async def _search(self, index: str, body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Executes search query to search system.
@@ -152,6 +324,11 @@ class BaseSearchClient(ABC):
         try:
             return await self._client.search(index=index, body=body)
         except Exception as e:
+            self._search_failures += 1
+            if "NotFoundError" in str(type(e)):
+                self._forget_prompt_index()
+                bastion_logger.warning(f"[{self._search_settings.host}][{index}] Index not found")
+                return None
             if "ConnectionError" in str(type(e)):
                 error_msg = f"Failed to establish connection with {self}. Error: {e}"
                 bastion_logger.error(f"[{self._search_settings.host}][{index}] {error_msg}")
@@ -163,7 +340,61 @@ class BaseSearchClient(ABC):
                 bastion_logger.exception(f"[{self._search_settings.host}][{index}] {error_msg}")
             return None
 
-    async def search_similar_documents(self, vector: List[float]) -> List[Dict[str, Any]]:
+    async def _msearch(self, body: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Executes several search queries in one multi-search request.
+
+        Args:
+            body (List[Dict[str, Any]]): Alternating header and query bodies
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: One response per query or None on error
+        """
+        try:
+            resp = await self._client.msearch(body=body)
+            return resp["responses"]
+        except Exception as e:
+            self._search_failures += 1
+            if "NotFoundError" in str(type(e)):
+                self._forget_prompt_index()
+            bastion_logger.exception(
+                f"[{self._search_settings.host}][{self.similarity_prompt_index}] Failed to execute multi-search. Error: {e}"
+            )
+            return None
+
+    def _prepare_vector(self, vector: np.ndarray | List[float]) -> np.ndarray | None:
+        """
+        Validates a query vector and converts it to a float32 array.
+
+        Search clients serialize NumPy arrays directly, so the embedding is
+        not boxed into a list of Python floats.
+
+        Args:
+            vector (np.ndarray | List[float]): Vector for searching similar documents
+
+        Returns:
+            np.ndarray | None: One-dimensional float32 vector or None if the vector is invalid
+        """
+        # Embeddings produced by the pipeline already have the expected shape and type
+        if isinstance(vector, np.ndarray) and vector.dtype == np.float32 and vector.shape == (EMBEDDING_DIMENSION,):
+            return vector
+
+        try:
+            prepared = np.asarray(vector, dtype=np.float32)
+        except (TypeError, ValueError):
+            prepared = None
+        if prepared is None or prepared.ndim != 1 or not prepared.size:
+            bastion_logger.warning(f"[{self.similarity_prompt_index}] Invalid vector provided for similarity search")
+            return None
+
+        # Check if vector has expected dimensions (typically 768 for many embedding models)
+        if prepared.shape[0] != EMBEDDING_DIMENSION:
+            bastion_logger.warning(
+                f"[{self.similarity_prompt_index}] Vector dimension mismatch: expected {EMBEDDING_DIMENSION}, got {prepared.shape[0]}"
+            )
+        return prepared
+
+    async def search_similar_documents(self, vector: np.ndarray | List[float]) -> List[Dict[str, Any]]:
         """
         Searches for similar documents by vector using cosine similarity.
 
@@ -172,14 +403,178 @@ class BaseSearchClient(ABC):
         them by categories to avoid duplicates.
 
         Args:
-            vector (List[float]): Vector for searching similar documents
+            vector (np.ndarray | List[float]): Vector for searching similar documents
 
         Returns:
             List[Dict[str, Any]]: List of similar documents, grouped by categories.
                                  Each document contains metadata and source data.
         """
+        vector = self._prepare_vector(vector)
+        if vector is None:
+            return []
+
+        body = self._similarity_query(vector)
+
+        bastion_logger.debug("[%s] Query body: %s", self.similarity_prompt_index, body)
+
+        if not await self._prompt_index_exists():
+            bastion_logger.warning(f"[{self.similarity_prompt_index}] Index does not exist")
+            return []
+
+        resp = await self._search(index=self.similarity_prompt_index, body=body)
+        if resp:
+            return best_hit_per_category(resp)
+
+        bastion_logger.error(f"[{self.similarity_prompt_index}] Failed to search similar documents - no response")
+        return []
+
+    def _similarity_query(self, vector: np.ndarray) -> Dict[str, Any]:
+        """
+        Builds the search body for finding documents similar to a vector.
+
+        Args:
+            vector (np.ndarray): Prepared query vector
+
+        Returns:
+            Dict[str, Any]: Search query body
+        """
         raise NotImplementedError("Subclasses must implement this method")
 
+    def _clear_result_caches(self) -> None:
+        """
+        Drops cached search results after the index changed.
+        """
+        if self._result_cache is not None:
+            self._result_cache.clear()
+        if self._prompt_cache is not None:
+            self._prompt_cache.clear()
+        if self._region_cache is not None:
+            self._region_cache.clear()
+
+    def _lookup_cached_documents(self, vector: np.ndarray) -> List[Dict[str, Any]] | None:
+        """
+        Returns cached documents for a query vector.
+
+        The region cache answers vectors within the region learned for a past
+        query; the result cache answers repeats of the same vector.
+
+        Args:
+            vector (np.ndarray): Vector for searching similar documents
+
+        Returns:
+            List[Dict[str, Any]] | None: Cached documents or None on a miss
+        """
+        if self._region_cache is not None and (documents := self._region_cache.get(vector)) is not None:
+            bastion_logger.debug("[%s] Region cache hit", self.similarity_prompt_index)
+            return documents
+        if self._result_cache is not None and (documents := self._result_cache.get(_vector_key(vector))) is not None:
+            bastion_logger.debug("[%s] Search result cache hit", self.similarity_prompt_index)
+            return documents
+        return None
+
+    def _store_cached_documents(self, vector: np.ndarray, documents: List[Dict[str, Any]]) -> None:
+        """
+        Caches the documents found for a query vector.
+
+        If the documents are the same as those of the nearest past query,
+        that query's region is widened to include the vector.
+
+        Args:
+            vector (np.ndarray): Vector the documents were found for
+            documents (List[Dict[str, Any]]): Documents returned by the search
+        """
+        if self._result_cache is not None:
+            self._result_cache.put(_vector_key(vector), documents)
+        if self._region_cache is not None:
+            if (nearest := self._region_cache.nearest(vector)) is not None:
+                index, score = nearest
+                if _document_ids(documents) == _document_ids(self._region_cache.value_at(index)):
+                    self._region_cache.widen(index, score)
+            self._region_cache.put(vector, documents)
+
+    async def _search_similar_documents_cached(self, vectors: List[np.ndarray]) -> List[List[Dict[str, Any]]]:
+        """
+        Searches for similar documents, reusing results of recent and near-duplicate queries.
+
+        Only the vectors missing from the caches are searched, in a single
+        batch. Results of a batch in which a search failed or could not run,
+        because of an invalid vector or a missing index, are not cached.
+
+        Args:
+            vectors (List[np.ndarray]): Vectors for searching similar documents
+
+        Returns:
+            List[List[Dict[str, Any]]]: Similar documents for each vector
+        """
+        results = [self._lookup_cached_documents(vector) for vector in vectors]
+        missing = [i for i, documents in enumerate(results) if documents is None]
+        if not missing:
+            return results
+
+        failures = self._search_failures
+        found = await self.search_similar_documents_many([vectors[i] for i in missing])
+        cache = self._search_failures == failures
+        for i, documents in zip(missing, found):
+            results[i] = documents
+            if cache:
+                self._store_cached_documents(vectors[i], documents)
+        return results
+
+    async def search_similar_documents_many(self, vectors: List[np.ndarray]) -> List[List[Dict[str, Any]]]:
+        """
+        Searches for documents similar to each of several vectors.
+
+        The vectors are searched with multi-search requests of up to
+        SEARCH_BATCH_SIZE searches, so a prompt usually costs one round trip
+        however many sentences it has, while very long prompts do not build
+        unbounded requests. The requests of a long prompt are sent
+        concurrently; a failed request leaves only its own vectors without
+        results.
+
+        Args:
+            vectors (List[np.ndarray]): Vectors for searching similar documents
+
+        Returns:
+            List[List[Dict[str, Any]]]: Similar documents for each vector, grouped by categories
+        """
+        prepared = [self._prepare_vector(vector) for vector in vectors]
+        results: List[List[Dict[str, Any]]] = [[] for _ in vectors]
+        queries = [i for i, vector in enumerate(prepared) if vector is not None]
+        # Searches that never ran count as failures, so their empty results are not cached
+        self._search_failures += len(vectors) - len(queries)
+        if not queries:
+            return results
+
+        bastion_logger.debug("[%s] Executing %s similarity searches", self.similarity_prompt_index, len(queries))
+        if not await self._prompt_index_exists():
+            bastion_logger.warning(f"[{self.similarity_prompt_index}] Index does not exist")
+            self._search_failures += len(queries)
+            return results
+
+        header = {"index": self.similarity_prompt_index}
+        batches = [queries[start : start + SEARCH_BATCH_SIZE] for start in range(0, len(queries), SEARCH_BATCH_SIZE)]
+        bodies = []
+        for batch in batches:
+            body = []
+            for i in batch:
+                body.append(header)
+                body.append(self._similarity_query(prepared[i]))
+            bodies.append(body)
+        all_responses = await asyncio.gather(*(self._msearch(body) for body in bodies))
+
+        for batch, responses in zip(batches, all_responses):
+            if responses is None:
+                continue
+            for i, resp in zip(batch, responses):
+                if "error" in resp:
+                    self._search_failures += 1
+                    if isinstance(resp["error"], dict) and resp["error"].get("type") == "index_not_found_exception":
+                        self._forget_prompt_index()
+                    bastion_logger.error(f"[{self.similarity_prompt_index}] Failed to search similar documents: {resp['error']}")
+                else:
+                    results[i] = best_hit_per_category(resp)
+        return results
+
     async def _index_exists(self, index: str) -> bool:
         """
         Checks if index exists.
@@ -196,6 +591,35 @@ class BaseSearchClient(ABC):
             bastion_logger.error(f"[{self._search_settings.host}][{index}] Failed to check index existence: {e}")
             return False
 
+    async def _prompt_index_exists(self) -> bool:
+        """
+        Checks that the prompt index exists, remembering a positive answer.
+
+        Once the index is found, searches skip the check until a search
+        reports it missing. A missing index is checked again after
+        INDEX_RECHECK_INTERVAL seconds to pick up late index creation.
+
+        Returns:
+            bool: True if the prompt index exists, False otherwise
+        """
+        if self._index_checked:
+            return True
+        now = time.monotonic()
+        if now < self._index_recheck_at:
+            return False
+        if await self._index_exists(self.similarity_prompt_index):
+            self._index_checked = True
+            return True
+        self._index_recheck_at = now + INDEX_RECHECK_INTERVAL
+        return False
+
+    def _forget_prompt_index(self) -> None:
+        """
+        Drops the remembered prompt index check after a search reported the index missing.
+        """
+        self._index_checked = False
+        self._index_recheck_at = time.monotonic() + INDEX_RECHECK_INTERVAL
+
     async def test_connection(self) -> bool:
         """
         Tests connection with search system and basic functionality.
@@ -242,11 +666,25 @@ class BaseSearchClient(ABC):
             return False
 
     async def prepare_triggered_rules(self, similar_documents: list[dict]) -> list[TriggeredRuleData]:
+        """
+        Prepare rules with deduplication by doc_id.
+
+        For identical documents, preference is given to those with higher score.
+        Converts similar documents to TriggeredRuleData objects.
+
+        Args:
+            similar_documents (list[dict]): List of documents with search results
+
+        Returns:
+            list[TriggeredRuleData]: List of unique TriggeredRuleData objects
+        """
+        # Sorted by score, so the best copy of a document is written last and kept
+        deduplicated_docs = {doc["doc_id"]: doc for doc in sorted(similar_documents, key=itemgetter("score"))}
         return [
             TriggeredRuleData(
                 action=doc["action"], id=doc["doc_id"], name=doc["name"], details=doc["details"], body=doc["body"]
             )
-            for doc in similar_documents
+            for doc in deduplicated_docs.values()
         ]
 
 
@@ -284,22 +722,19 @@ class BaseSearchClientMethods(BaseSearchClient):
             return RuleAction.BLOCK
         return RuleAction.NOTIFY
 
-    async def __search_similar_documents(self, chunk: str) -> list[dict]:
+    def __format_documents(self, similar_documents: List[Dict[str, Any]]) -> list[dict]:
         """
-        Search for similar documents using vector embeddings.
+        Formats documents found for a sentence for further processing.
 
-        Converts text chunk to vector embedding and searches OpenSearch
-        for similar documents. Filters results by similarity threshold
-        and formats them for further processing.
+        Filters results by similarity threshold and keeps the metadata and
+        score needed for triggered rules.
 
         Args:
-            chunk (str): Text chunk to search for similar content
+            similar_documents (List[Dict[str, Any]]): Documents found for the sentence
 
         Returns:
             list[dict]: List of similar documents with metadata and scores
         """
-        vector = text_embedding(chunk)
-        similar_documents = await self.search_similar_documents(vector)
         return [
             {
                 "action": self._get_action(doc["_score"]),
@@ -317,9 +752,33 @@ class BaseSearchClientMethods(BaseSearchClient):
         """
         Analyzes prompt for similar content using vector similarity search.
 
-        Splits the prompt into sentences, processes them in batches,
-        and searches for similar documents using vector embeddings.
-        Returns analysis results with triggered rules for similar content.
+        Verdicts of recently seen prompts are reused, and concurrent calls
+        with the same prompt share one analysis. Verdicts of analyses during
+        which a search failed or could not run are not cached.
+
+        Args:
+            text (str): Text prompt to analyze for similar content
+
+        Returns:
+            PipelineResult: Analysis result with triggered rules and status
+        """
+        key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        if self._prompt_cache is not None and (result := self._prompt_cache.get(key)) is not None:
+            bastion_logger.debug("[%s] Prompt cache hit", self.similarity_prompt_index)
+            return result
+
+        failures = self._search_failures
+        result, shared = await self._inflight.do(key, lambda: self._analyze(text))
+        if shared:
+            bastion_logger.debug("[%s] Joined in-flight similarity search", self.similarity_prompt_index)
+        elif self._prompt_cache is not None and self._search_failures == failures:
+            self._prompt_cache.put(key, result)
+        return result
+
+    async def _analyze(self, text: str) -> PipelineResult:
+        """
+        Splits the prompt into unique sentences, embeds them in one model call,
+        and searches for similar documents of all sentences in one batch.
 
         Args:
             text (str): Text prompt to analyze for similar content
@@ -328,18 +787,16 @@ class BaseSearchClientMethods(BaseSearchClient):
             PipelineResult: Analysis result with triggered rules and status
         """
         similar_documents = []
-        chunks = self.__split_prompt_into_sentences(text)
-        bastion_logger.info(f"Analyzing for {len(chunks)} sentences")
-
-        batch_size = 5
-        for i in range(0, len(chunks), batch_size):
-            batch = chunks[i : i + batch_size]
-            tasks = [self.__search_similar_documents(chunk) for chunk in batch]
-            batch_results = await asyncio.gather(*tasks)
-            for result in batch_results:
-                similar_documents.extend(result)
+        # Repeated sentences find the same documents, which are deduplicated by id later
+        sentences = (sentence.strip() for sentence in self.__split_prompt_into_sentences(text))
+        chunks = list(dict.fromkeys(sentence for sentence in sentences if sentence))
+        bastion_logger.debug("Analyzing for %s sentences", len(chunks))
+        if chunks:
+            vectors = await run_in_embedding_thread(embed_sentences, chunks)
+            for documents in await self._search_similar_documents_cached(vectors):
+                similar_documents.extend(self.__format_documents(documents))
         triggered_rules = await self.prepare_triggered_rules(similar_documents)
-        bastion_logger.info(f"Found {len(triggered_rules)} similar documents")
+        bastion_logger.debug("Found %s similar documents", len(triggered_rules))
         return PipelineResult(
             name=str(self), status=self._pipeline_status(triggered_rules), triggered_rules=triggered_rules
         )
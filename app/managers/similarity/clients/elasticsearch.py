@@ -1,13 +1,45 @@
-from typing import Any, Dict, List
+from typing import Any, Dict
 
+import numpy as np
+import orjson
 from elasticsearch import AsyncElasticsearch
+from elasticsearch.serializer import JSONSerializer, NdjsonSerializer
 
 from app.managers.similarity.clients.base import BaseSearchClientMethods
-from app.models.pipeline import TriggeredRuleData
 from app.modules.logger import bastion_logger
 from app.core.enums import SimilarityClientNames
 from settings import get_settings
-from scripts.similarity.const import INDEX_MAPPING_NO_KNN
+from scripts.similarity.const import INDEX_MAPPING_ES_KNN, INDEX_MAPPING_NO_KNN, SOURCE_FIELDS
+
+# Invariant parts of the script_score query, shared by every search body
+_COSINE_SCRIPT = "cosineSimilarity(params.query_vector, 'vector') + 1.0"
+_MATCH_ALL = {"match_all": {}}
+_SCRIPT_SCORE_BODY = {"size": 5, "_source": SOURCE_FIELDS}
+
+
+class OrjsonSerializer(JSONSerializer):
+    """
+    JSON serializer encoding request bodies and decoding responses with orjson.
+
+    Query vectors are float32 arrays, which orjson encodes natively instead of
+    going through the per-element fallback of the standard library encoder.
+    """
+
+    mimetype = "application/json"
+
+    def json_dumps(self, data: Any) -> bytes:
+        return orjson.dumps(data, default=self.default, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    def json_loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class OrjsonNdjsonSerializer(OrjsonSerializer, NdjsonSerializer):
+    """
+    Newline-delimited variant of OrjsonSerializer used for msearch bodies.
+    """
+
+    mimetype = "application/x-ndjson"
 
 
 class AsyncElasticsearchClient(BaseSearchClientMethods):
@@ -21,6 +53,7 @@ class AsyncElasticsearchClient(BaseSearchClientMethods):
 
     _identifier: SimilarityClientNames = SimilarityClientNames.elasticsearch
     description = "Elasticsearch-based client for similarity search operations using vector embeddings in database."
+    _display_name = "Elasticsearch Client"
 
     def __init__(self) -> None:
         """
@@ -31,9 +64,24 @@ class AsyncElasticsearchClient(BaseSearchClientMethods):
             raise Exception("Elasticsearch settings are not specified in environment variables")
 
         super().__init__(settings.SIMILARITY_PROMPT_INDEX, settings.ES)
+        self._knn_body = {
+            "size": 5,
+            "knn": {"field": "vector", "k": 5, "num_candidates": max(settings.ES.num_candidates, 5)},
+            "_source": SOURCE_FIELDS,
+        }
 
-    def __str__(self) -> str:
-        return "Elasticsearch Client"
+    @classmethod
+    def is_configured(cls, app_settings: Any) -> bool:
+        """
+        Checks whether Elasticsearch settings are set.
+
+        Args:
+            app_settings (Settings): Application settings
+
+        Returns:
+            bool: True if Elasticsearch settings are specified
+        """
+        return bool(app_settings.ES)
 
     def _initialize_client(self) -> AsyncElasticsearch:
         """
@@ -43,105 +91,49 @@ class AsyncElasticsearchClient(BaseSearchClientMethods):
             AsyncElasticsearch: Initialized Elasticsearch client
         """
         config = self._search_settings.get_client_config()
-        return AsyncElasticsearch(**config)
+        serializers = {
+            OrjsonSerializer.mimetype: OrjsonSerializer(),
+            OrjsonNdjsonSerializer.mimetype: OrjsonNdjsonSerializer(),
+        }
+        return AsyncElasticsearch(**config, serializers=serializers)
 
-    async def search_similar_documents(self, vector: List[float]) -> List[Dict[str, Any]]:
+    def _similarity_query(self, vector: np.ndarray) -> Dict[str, Any]:
         """
-        Searches for similar documents by vector using cosine similarity.
+        Builds the similarity query.
 
-        Performs search for documents similar to given vector using
-        cosine similarity. Returns up to 5 most similar documents, grouping
-        them by categories to avoid duplicates.
+        With native kNN enabled, the top-level kNN request traverses the HNSW
+        graph directly. Otherwise a script_score query scores every document,
+        for indexes whose vectors are not indexed for kNN. Only the fields
+        read from hits are returned. The invariant parts of both bodies are
+        shared, so only the dicts holding the vector are built per query.
 
         Args:
-            vector (List[float]): Vector for searching similar documents
+            vector (np.ndarray): Prepared query vector
 
         Returns:
-            List[Dict[str, Any]]: List of similar documents, grouped by categories.
-                                 Each document contains metadata and source data.
+            Dict[str, Any]: Search query body
         """
-        if not vector or not isinstance(vector, list) or len(vector) == 0:
-            bastion_logger.warning(f"[{self.similarity_prompt_index}] Invalid vector provided for similarity search")
-            return []
-
-        # Check if vector has expected dimensions (typically 768 for many embedding models)
-        if len(vector) != 768:
-            bastion_logger.warning(
-                f"[{self.similarity_prompt_index}] Vector dimension mismatch: expected 768, got {len(vector)}"
-            )
-
-        # Use script_score query for vector similarity search (for Elasticsearch without k-NN plugin)
-        body = {
-            "size": 5,
+        if self._search_settings.native_knn:
+            return {**self._knn_body, "knn": {**self._knn_body["knn"], "query_vector": vector}}
+        return {
+            **_SCRIPT_SCORE_BODY,
             "query": {
                 "script_score": {
-                    "query": {"match_all": {}},
-                    "script": {
-                        "source": "cosineSimilarity(params.query_vector, 'vector') + 1.0",
-                        "params": {"query_vector": vector}
-                    }
+                    "query": _MATCH_ALL,
+                    "script": {"source": _COSINE_SCRIPT, "params": {"query_vector": vector}},
                 }
-            }
+            },
         }
 
-        # Log the query for debugging
-        bastion_logger.debug(
-            f"[{self.similarity_prompt_index}] Executing similarity search with vector length: {len(vector)}"
-        )
-        bastion_logger.debug(f"[{self.similarity_prompt_index}] Query body: {body}")
-
-        try:
-            # Check if index exists before searching
-            if not await self._index_exists(self.similarity_prompt_index):
-                bastion_logger.warning(f"[{self.similarity_prompt_index}] Index does not exist")
-                return []
-        except Exception as e:
-            bastion_logger.error(f"[{self.similarity_prompt_index}] Failed to check index existence: {e}")
-            return []
-
-        resp = await self._search(index=self.similarity_prompt_index, body=body)
-        if resp:
-            documents = {}
-            for hit in resp.get("hits", {}).get("hits", []):
-                if hit["_source"]["category"] not in documents:
-                    documents[hit["_source"]["category"]] = hit
-            return list(documents.values())
-
-        bastion_logger.error(f"[{self.similarity_prompt_index}] Failed to search similar documents - no response")
-        return []
-
-    async def prepare_triggered_rules(self, similar_documents: list[dict]) -> list[TriggeredRuleData]:
-        """
-        Prepare rules with deduplication by doc_id.
-
-        For identical documents, preference is given to those with higher score.
-        Converts similar documents to TriggeredRuleData objects.
-
-        Args:
-            similar_documents (list[dict]): List of documents with search results
-
-        Returns:
-            list[TriggeredRuleData]: List of unique TriggeredRuleData objects
-        """
-        deduplicated_docs = {}
-        for doc in similar_documents:
-            doc_id = doc["doc_id"]
-            if doc_id not in deduplicated_docs or doc["score"] > deduplicated_docs[doc_id]["score"]:
-                deduplicated_docs[doc_id] = doc
-        return [
-            TriggeredRuleData(
-                action=doc["action"], id=doc["doc_id"], name=doc["name"], details=doc["details"], body=doc["body"]
-            )
-            for doc in deduplicated_docs.values()
-        ]
-
     async def index_create(self) -> bool:
         """
-        Creates index with alternative mapping for Elasticsearch without k-NN plugin.
+        Creates index with an HNSW-indexed vector field when native kNN is enabled,
+        or with the alternative mapping for Elasticsearch without k-NN plugin.
         """
+        mapping = INDEX_MAPPING_ES_KNN if self._search_settings.native_knn else INDEX_MAPPING_NO_KNN
         try:
             return await self._client.indices.create(
-                index=self.similarity_prompt_index, body=INDEX_MAPPING_NO_KNN
+                index=self.similarity_prompt_index, body=mapping
             )
         except Exception as e:
             bastion_logger.error(f"[{self}][{self._search_settings.host}][{self.similarity_prompt_index}] Failed to create index: {e}")
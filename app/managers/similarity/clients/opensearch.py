@@ -1,11 +1,32 @@
-from typing import Any, Dict, List
+from typing import Any, Dict
+import numpy as np
+import orjson
 from opensearchpy import AsyncOpenSearch
+from opensearchpy.serializer import JSONSerializer
 
 from app.managers.similarity.clients.base import BaseSearchClientMethods
-from app.models.pipeline import TriggeredRuleData
 from app.modules.logger import bastion_logger
 from app.core.enums import SimilarityClientNames
 from settings import get_settings
+from scripts.similarity.const import INDEX_MAPPING, SOURCE_FIELDS
+
+
+class OrjsonSerializer(JSONSerializer):
+    """
+    JSON serializer encoding request bodies and decoding responses with orjson.
+
+    Query vectors are float32 arrays, which orjson encodes natively; types it
+    does not know fall back to the default conversions of the base serializer.
+    """
+
+    def loads(self, s: str | bytes) -> Any:
+        return orjson.loads(s)
+
+    def dumps(self, data: Any) -> str:
+        # Bodies already serialized by the caller are passed through, as in the base serializer
+        if isinstance(data, str):
+            return data
+        return orjson.dumps(data, default=self.default, option=orjson.OPT_SERIALIZE_NUMPY).decode()
 
 
 class AsyncOpenSearchClient(BaseSearchClientMethods):
@@ -19,6 +40,7 @@ class AsyncOpenSearchClient(BaseSearchClientMethods):
 
     _identifier: SimilarityClientNames = SimilarityClientNames.opensearch
     description = "OpenSearch-based client for similarity search operations using vector embeddings in database."
+    _display_name = "OpenSearch Client"
 
     def __init__(self) -> None:
         """
@@ -30,8 +52,18 @@ class AsyncOpenSearchClient(BaseSearchClientMethods):
 
         super().__init__(settings.SIMILARITY_PROMPT_INDEX, settings.OS)
 
-    def __str__(self) -> str:
-        return "OpenSearch Client"
+    @classmethod
+    def is_configured(cls, app_settings: Any) -> bool:
+        """
+        Checks whether OpenSearch settings are set.
+
+        Args:
+            app_settings (Settings): Application settings
+
+        Returns:
+            bool: True if OpenSearch settings are specified
+        """
+        return bool(app_settings.OS)
 
     def _initialize_client(self) -> AsyncOpenSearch:
         """
@@ -40,95 +72,39 @@ class AsyncOpenSearchClient(BaseSearchClientMethods):
         Returns:
             AsyncOpenSearch: Initialized OpenSearch client
         """
-        return AsyncOpenSearch(**self._search_settings.get_client_config())
+        return AsyncOpenSearch(**self._search_settings.get_client_config(), serializer=OrjsonSerializer())
 
-    async def search_similar_documents(self, vector: List[float]) -> List[Dict[str, Any]]:
+    def _similarity_query(self, vector: np.ndarray) -> Dict[str, Any]:
         """
-        Searches for similar documents by vector using cosine similarity.
-
-        Performs search for documents similar to given vector using
-        cosine similarity. Returns up to 5 most similar documents, grouping
-        them by categories to avoid duplicates.
+        Builds a k-NN query for vector similarity search, returning only the fields read from hits.
 
         Args:
-            vector (List[float]): Vector for searching similar documents
+            vector (np.ndarray): Prepared query vector
 
         Returns:
-            List[Dict[str, Any]]: List of similar documents, grouped by categories.
-                                 Each document contains metadata and source data.
+            Dict[str, Any]: Search query body
         """
-        if not vector or not isinstance(vector, list) or len(vector) == 0:
-            bastion_logger.warning(f"[{self.similarity_prompt_index}] Invalid vector provided for similarity search")
-            return []
-
-        # Check if vector has expected dimensions (typically 768 for many embedding models)
-        if len(vector) != 768:
-            bastion_logger.warning(
-                f"[{self.similarity_prompt_index}] Vector dimension mismatch: expected 768, got {len(vector)}"
-            )
-
-        # Use KNN query for vector similarity search
-        body = {"size": 5, "query": {"knn": {"vector": {"vector": vector, "k": 5}}}}
-
-        # Log the query for debugging
-        bastion_logger.debug(
-            f"[{self.similarity_prompt_index}] Executing similarity search with vector length: {len(vector)}"
-        )
-        bastion_logger.debug(f"[{self.similarity_prompt_index}] Query body: {body}")
+        return {"size": 5, "_source": SOURCE_FIELDS, "query": {"knn": {"vector": {"vector": vector, "k": 5}}}}
 
-        try:
-            # Check if index exists before searching
-            if not await self._index_exists(self.similarity_prompt_index):
-                bastion_logger.warning(f"[{self.similarity_prompt_index}] Index does not exist")
-                return []
-        except Exception as e:
-            bastion_logger.error(f"[{self.similarity_prompt_index}] Failed to check index existence: {e}")
-            return []
-
-        resp = await self._search(index=self.similarity_prompt_index, body=body)
-        if resp:
-            documents = {}
-            for hit in resp.get("hits", {}).get("hits", []):
-                if hit["_source"]["category"] not in documents:
-                    documents[hit["_source"]["category"]] = hit
-            return list(documents.values())
-
-        # Fallback: try simpler KNN query if the main one failed
-        bastion_logger.warning(f"[{self.similarity_prompt_index}] Main KNN query failed, trying fallback")
-        fallback_body = {"size": 5, "query": {"knn": {"vector": {"vector": vector, "k": 3}}}}
-
-        fallback_resp = await self._search(index=self.similarity_prompt_index, body=fallback_body)
-        if fallback_resp:
-            documents = {}
-            for hit in fallback_resp.get("hits", {}).get("hits", []):
-                if hit["_source"]["category"] not in documents:
-                    documents[hit["_source"]["category"]] = hit
-            return list(documents.values())
-
-        bastion_logger.error(f"[{self.similarity_prompt_index}] Failed to search similar documents - no response")
-        return []
-
-    async def prepare_triggered_rules(self, similar_documents: list[dict]) -> list[TriggeredRuleData]:
+    async def index_create(self) -> bool:
         """
-        Prepare rules with deduplication by doc_id.
-
-        For identical documents, preference is given to those with higher score.
-        Converts similar documents to TriggeredRuleData objects.
-
-        Args:
-            similar_documents (list[dict]): List of documents with search results
-
-        Returns:
-            list[TriggeredRuleData]: List of unique TriggeredRuleData objects
+        Creates the k-NN index. With OS__CONCURRENT_SEGMENT_SEARCH enabled, each
+        shard scores its segments in parallel, which speeds up vector search on
+        multi-core nodes. With OS__SCALAR_QUANTIZATION enabled, Lucene keeps the
+        HNSW graph vectors as int7, cutting the memory used for k-NN about four
+        times; queries are sent as float32 and quantized by the engine.
         """
-        deduplicated_docs = {}
-        for doc in similar_documents:
-            doc_id = doc["doc_id"]
-            if doc_id not in deduplicated_docs or doc["score"] > deduplicated_docs[doc_id]["score"]:
-                deduplicated_docs[doc_id] = doc
-        return [
-            TriggeredRuleData(
-                action=doc["action"], id=doc["doc_id"], name=doc["name"], details=doc["details"], body=doc["body"]
-            )
-            for doc in deduplicated_docs.values()
-        ]
+        mapping = INDEX_MAPPING
+        if self._search_settings.concurrent_segment_search:
+            index_settings = {**INDEX_MAPPING["settings"]["index"], "search.concurrent_segment_search.mode": "all"}
+            mapping = {**mapping, "settings": {"index": index_settings}}
+        if self._search_settings.scalar_quantization:
+            vector = INDEX_MAPPING["mappings"]["properties"]["vector"]
+            method = {**vector["method"], "parameters": {"encoder": {"name": "sq"}}}
+            properties = {**INDEX_MAPPING["mappings"]["properties"], "vector": {**vector, "method": method}}
+            mapping = {**mapping, "mappings": {"properties": properties}}
+        try:
+            return await self._client.indices.create(index=self.similarity_prompt_index, body=mapping)
+        except Exception as e:
+            bastion_logger.error(f"[{self}][{self._search_settings.host}][{self.similarity_prompt_index}] Failed to create index: {e}")
+            return False
@@ -1,14 +1,24 @@
+import asyncio
 from typing import Any, Dict, List
 
+import numpy as np
 from qdrant_client import AsyncQdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct, Filter, FieldCondition, MatchValue, ScoredPoint
-
-from app.managers.similarity.clients.base import BaseSearchClientMethods
-from app.models.pipeline import TriggeredRuleData
+from qdrant_client.http.exceptions import UnexpectedResponse
+from qdrant_client.models import (
+    Distance, VectorParams, PointStruct, Filter, FieldCondition, MatchValue, ScoredPoint,
+    QuantizationSearchParams, ScalarQuantization, ScalarQuantizationConfig, ScalarType, SearchParams,
+    PayloadSchemaType, Prefetch, QueryRequest, OptimizersConfigDiff
+)
+
+from app.core.batcher import MicroBatcher
+from app.managers.similarity.clients.base import INDEX_BATCH_SIZE, BaseSearchClientMethods
 from app.modules.logger import bastion_logger
 from app.core.enums import SimilarityClientNames
 from settings import get_settings
 
+# Named vectors of collections created with Matryoshka truncation
+_FULL_VECTOR = "full"
+_MRL_VECTOR = "mrl"
 
 class AsyncQdrantClientWrapper(BaseSearchClientMethods):
     """
@@ -27,6 +37,7 @@ class AsyncQdrantClientWrapper(BaseSearchClientMethods):
 
     _identifier: SimilarityClientNames = SimilarityClientNames.qdrant
     description = "Qdrant-based client for high-performance similarity search operations using vector embeddings."
+    _display_name = "Qdrant Client"
 
     def __init__(self) -> None:
         """
@@ -37,9 +48,32 @@ class AsyncQdrantClientWrapper(BaseSearchClientMethods):
             raise Exception("Qdrant settings are not specified in environment variables")
 
         super().__init__(settings.SIMILARITY_PROMPT_INDEX, settings.QDRANT)
+        self._search_semaphore = asyncio.Semaphore(max(settings.QDRANT.max_concurrent_searches, 1))
+        self._mrl_dimension = settings.QDRANT.mrl_dimension
+        self._search_params: SearchParams | None = None
+        if settings.QDRANT.quantization:
+            # Candidates are found with int8 vectors and rescored with the originals
+            self._search_params = SearchParams(
+                quantization=QuantizationSearchParams(rescore=True, oversampling=settings.QDRANT.oversampling)
+            )
+        self._batcher: MicroBatcher[np.ndarray, List[Dict[str, Any]]] | None = None
+        if settings.QDRANT.batch_size > 1:
+            self._batcher = MicroBatcher(
+                self._search_batch, settings.QDRANT.batch_size, settings.QDRANT.batch_wait_ms / 1000
+            )
+
+    @classmethod
+    def is_configured(cls, app_settings: Any) -> bool:
+        """
+        Checks whether Qdrant settings are set.
 
-    def __str__(self) -> str:
-        return "Qdrant Client"
+        Args:
+            app_settings (Settings): Application settings
+
+        Returns:
+            bool: True if Qdrant settings are specified
+        """
+        return bool(app_settings.QDRANT)
 
     def _initialize_client(self) -> AsyncQdrantClient:
         """
@@ -82,7 +116,39 @@ class AsyncQdrantClientWrapper(BaseSearchClientMethods):
             bastion_logger.error(f"[{self._search_settings.host}][{collection_name}] Failed to check collection existence: {e}")
             return False
 
-    async def search_similar_documents(self, vector: List[float]) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _format_points(points: List[ScoredPoint]) -> List[Dict[str, Any]]:
+        """
+        Converts scored points into documents, keeping only the best match per category.
+
+        Args:
+            points (List[ScoredPoint]): Points returned by a search, best first
+
+        Returns:
+            List[Dict[str, Any]]: Documents with metadata and scores
+        """
+        documents = []
+        seen = set()
+        for point in points:
+            payload = point.payload
+            category = payload.get("category")
+            if category in seen:
+                continue
+            seen.add(category)
+            documents.append(
+                {
+                    "_score": point.score,
+                    "_source": {
+                        "id": payload.get("id"),
+                        "category": category,
+                        "details": payload.get("details", ""),
+                        "text": payload.get("text", ""),
+                    },
+                }
+            )
+        return documents
+
+    async def search_similar_documents(self, vector: np.ndarray | List[float]) -> List[Dict[str, Any]]:
         """
         Searches for similar documents by vector using cosine similarity.
 
@@ -91,79 +157,172 @@ class AsyncQdrantClientWrapper(BaseSearchClientMethods):
         with optional filtering by payload fields.
 
         Args:
-            vector (List[float]): Vector for searching similar documents
+            vector (np.ndarray | List[float]): Vector for searching similar documents
 
         Returns:
             List[Dict[str, Any]]: List of similar documents with metadata and scores
         """
-        if not vector or not isinstance(vector, list) or len(vector) == 0:
-            bastion_logger.warning(f"[{self.similarity_prompt_index}] Invalid vector provided for similarity search")
-            return []
+        return (await self.search_similar_documents_many([vector]))[0]
 
-        # Check if vector has expected dimensions (typically 768 for many embedding models)
-        if len(vector) != 768:
-            bastion_logger.warning(
-                f"[{self.similarity_prompt_index}] Vector dimension mismatch: expected 768, got {len(vector)}"
-            )
+    async def _search_batch(self, vectors: List[np.ndarray]) -> List[List[Dict[str, Any]]]:
+        """
+        Searches for documents similar to each vector with one batch request.
 
-        # Log the query for debugging
-        bastion_logger.debug(
-            f"[{self.similarity_prompt_index}] Executing similarity search with vector length: {len(vector)}"
-        )
+        Args:
+            vectors (List[np.ndarray]): Prepared vectors for searching similar documents
 
-        try:
-            # Check if collection exists before searching
-            if not await self._index_exists(self.similarity_prompt_index):
-                bastion_logger.warning(f"[{self.similarity_prompt_index}] Collection does not exist")
-                return []
-        except Exception as e:
-            bastion_logger.error(f"[{self.similarity_prompt_index}] Failed to check collection existence: {e}")
-            return []
+        Returns:
+            List[List[Dict[str, Any]]]: Similar documents for each vector
 
-        try:
-            # Perform vector search with score threshold
-            results: List[ScoredPoint] = await self._client.search(
+        Raises:
+            Exception: On failed search request
+        """
+        async with self._search_semaphore:
+            responses = await self._client.query_batch_points(
                 collection_name=self.similarity_prompt_index,
-                query_vector=vector,
-                limit=5,
-                score_threshold=self.notify_threshold,  # Built-in threshold filtering
+                requests=[self._query_request(vector) for vector in vectors],
             )
+        return [self._format_points(response.points) for response in responses]
 
-            # Deduplicate by category - keep only the best match per category
-            documents = {}
-            for point in results:
-                category = point.payload.get("category")
-                if category not in documents:
-                    documents[category] = {
-                        "_score": point.score,
-                        "_source": {
-                            "id": point.payload.get("id"),
-                            "category": category,
-                            "details": point.payload.get("details", ""),
-                            "text": point.payload.get("text", ""),
-                        }
-                    }
-
-            return list(documents.values())
+    def _query_request(self, vector: np.ndarray) -> QueryRequest:
+        """
+        Builds the query for one vector of a batch request.
 
-        except Exception as e:
-            bastion_logger.error(f"[{self.similarity_prompt_index}] Failed to search similar documents: {e}")
-            return []
+        Args:
+            vector (np.ndarray): Prepared full-size query vector
+
+        Returns:
+            QueryRequest: Query for the batch request
+        """
+        if self._mrl_dimension:
+            return self._mrl_request(vector)
+        return QueryRequest(
+            query=vector.tolist(),
+            limit=5,
+            score_threshold=self.notify_threshold,  # Built-in threshold filtering
+            with_payload=True,
+            params=self._search_params,
+        )
+
+    def _mrl_request(self, vector: np.ndarray) -> QueryRequest:
+        """
+        Builds a query searching truncated vectors and rescoring the candidates with full vectors.
+
+        Args:
+            vector (np.ndarray): Prepared full-size query vector
+
+        Returns:
+            QueryRequest: Query for the batch request
+        """
+        return QueryRequest(
+            prefetch=Prefetch(
+                query=vector[: self._mrl_dimension].tolist(),
+                using=_MRL_VECTOR,
+                limit=max(self._search_settings.mrl_candidates, 5),
+            ),
+            query=vector.tolist(),
+            using=_FULL_VECTOR,
+            limit=5,
+            score_threshold=self.notify_threshold,
+            with_payload=True,
+            params=self._search_params,
+        )
+
+    async def search_similar_documents_many(self, vectors: List[np.ndarray]) -> List[List[Dict[str, Any]]]:
+        """
+        Searches for documents similar to each of several vectors.
+
+        The vectors are searched with a single batch request, so a prompt
+        costs one round trip however many sentences it has. With
+        QDRANT__BATCH_SIZE above 1, vectors of concurrent prompts are
+        coalesced into shared batch requests. At most
+        QDRANT__MAX_CONCURRENT_SEARCHES batch requests of this client are
+        in flight.
+
+        Args:
+            vectors (List[np.ndarray]): Vectors for searching similar documents
+
+        Returns:
+            List[List[Dict[str, Any]]]: Similar documents for each vector
+        """
+        prepared = [self._prepare_vector(vector) for vector in vectors]
+        results: List[List[Dict[str, Any]]] = [[] for _ in vectors]
+        queries = [i for i, vector in enumerate(prepared) if vector is not None]
+        # Searches that never ran count as failures, so their empty results are not cached
+        self._search_failures += len(vectors) - len(queries)
+        if not queries:
+            return results
+
+        if not await self._prompt_index_exists():
+            bastion_logger.warning(f"[{self.similarity_prompt_index}] Collection does not exist")
+            self._search_failures += len(queries)
+            return results
+
+        if self._batcher is not None:
+            found = await asyncio.gather(
+                *(self._batcher.submit(prepared[i]) for i in queries), return_exceptions=True
+            )
+        else:
+            try:
+                found = await self._search_batch([prepared[i] for i in queries])
+            except Exception as e:
+                found = [e] * len(queries)
+
+        for i, documents in zip(queries, found):
+            if isinstance(documents, Exception):
+                self._search_failures += 1
+                if isinstance(documents, UnexpectedResponse) and documents.status_code == 404:
+                    self._forget_prompt_index()
+                bastion_logger.error(f"[{self.similarity_prompt_index}] Failed to search similar documents: {documents}")
+            else:
+                results[i] = documents
+        return results
 
     async def index_create(self) -> bool:
         """
         Creates a new collection in Qdrant with vector configuration.
 
+        With QDRANT__QUANTIZATION enabled, int8 copies of the vectors are kept
+        in RAM for search while the original vectors are stored on disk.
+        The category field results are grouped by gets a keyword payload index.
+        With QDRANT__MRL_DIMENSION set, the collection stores the full vectors
+        and their leading dimensions as separate named vectors. QDRANT__SEGMENT_NUMBER
+        overrides the number of segments a search fans out to.
+
         Returns:
             bool: True if collection was created successfully, False otherwise
         """
+        quantization = self._search_settings.quantization
+        quantization_config = None
+        if quantization:
+            quantization_config = ScalarQuantization(
+                scalar=ScalarQuantizationConfig(type=ScalarType.INT8, always_ram=True)
+            )
+        vectors_config = VectorParams(
+            size=768,  # Vector dimension
+            distance=Distance.COSINE,  # Cosine similarity
+            on_disk=quantization,
+        )
+        if self._mrl_dimension:
+            # Full vectors are only read to rescore the candidates found with the truncated ones
+            vectors_config = {
+                _FULL_VECTOR: VectorParams(size=768, distance=Distance.COSINE, on_disk=True),
+                _MRL_VECTOR: VectorParams(size=self._mrl_dimension, distance=Distance.COSINE),
+            }
+        optimizers_config = None
+        if self._search_settings.segment_number > 0:
+            optimizers_config = OptimizersConfigDiff(default_segment_number=self._search_settings.segment_number)
         try:
             await self._client.create_collection(
                 collection_name=self.similarity_prompt_index,
-                vectors_config=VectorParams(
-                    size=768,  # Vector dimension
-                    distance=Distance.COSINE,  # Cosine similarity
-                ),
+                vectors_config=vectors_config,
+                quantization_config=quantization_config,
+                optimizers_config=optimizers_config,
+            )
+            await self._client.create_payload_index(
+                collection_name=self.similarity_prompt_index,
+                field_name="category",
+                field_schema=PayloadSchemaType.KEYWORD,
             )
             bastion_logger.info(f"[{self}][{self._search_settings.host}][{self.similarity_prompt_index}] Collection created successfully")
             return True
@@ -171,6 +330,34 @@ class AsyncQdrantClientWrapper(BaseSearchClientMethods):
             bastion_logger.error(f"[{self}][{self._search_settings.host}][{self.similarity_prompt_index}] Failed to create collection: {e}")
             return False
 
+    def _point(self, body: Dict[str, Any]) -> PointStruct:
+        """
+        Builds a point from a document.
+
+        Args:
+            body (Dict[str, Any]): Document with keys: id, vector (array or list), text, category, details
+
+        Returns:
+            PointStruct: Point to upsert into the collection
+        """
+        vector = body.get("vector")
+        if isinstance(vector, np.ndarray):
+            # Point models validate plain lists; arrays are converted only at this boundary
+            vector = vector.tolist()
+        if self._mrl_dimension:
+            # Qdrant normalizes cosine vectors, so the truncated copy needs no rescaling
+            vector = {_FULL_VECTOR: vector, _MRL_VECTOR: vector[: self._mrl_dimension]}
+        return PointStruct(
+            id=body.get("id"),
+            vector=vector,
+            payload={
+                "id": body.get("id"),
+                "text": body.get("text"),
+                "category": body.get("category", ""),
+                "details": body.get("details", ""),
+            }
+        )
+
     async def index(self, body: Dict[str, Any]) -> bool:
         """
         Indexes a single document into Qdrant collection.
@@ -182,65 +369,58 @@ class AsyncQdrantClientWrapper(BaseSearchClientMethods):
             bool: True if indexing was successful, False otherwise
         """
         try:
-            point = PointStruct(
-                id=body.get("id"),
-                vector=body.get("vector"),
-                payload={
-                    "id": body.get("id"),
-                    "text": body.get("text"),
-                    "category": body.get("category", ""),
-                    "details": body.get("details", ""),
-                }
-            )
-
+            self._clear_result_caches()
             await self._client.upsert(
                 collection_name=self.similarity_prompt_index,
-                points=[point]
+                points=[self._point(body)]
             )
 
-            bastion_logger.debug(f"[{self.similarity_prompt_index}] Indexed document: {body.get('id')}")
+            bastion_logger.debug("[%s] Indexed document: %s", self.similarity_prompt_index, body.get("id"))
             return True
 
         except Exception as e:
             bastion_logger.error(f"[{self}][{self._search_settings.host}][{self.similarity_prompt_index}] Failed to index document: {e}")
             return False
 
-    async def prepare_triggered_rules(self, similar_documents: list[dict]) -> list[TriggeredRuleData]:
+    async def index_bulk(self, bodies: List[Dict[str, Any]]) -> bool:
         """
-        Prepare rules with deduplication by doc_id.
+        Indexes documents into Qdrant collection, upserting up to INDEX_BATCH_SIZE points per request.
 
-        For identical documents, preference is given to those with higher score.
-        Converts similar documents to TriggeredRuleData objects.
+        Batches are upserted concurrently, bounded by QDRANT__MAX_CONCURRENT_SEARCHES.
 
         Args:
-            similar_documents (list[dict]): List of documents with search results
+            bodies (List[Dict[str, Any]]): Documents to index with keys: id, vector, text, category, details
 
         Returns:
-            list[TriggeredRuleData]: List of unique TriggeredRuleData objects
-        """
-        deduplicated_docs = {}
-        for doc in similar_documents:
-            doc_id = doc["doc_id"]
-            if doc_id not in deduplicated_docs or doc["score"] > deduplicated_docs[doc_id]["score"]:
-                deduplicated_docs[doc_id] = doc
-
-        return [
-            TriggeredRuleData(
-                action=doc["action"],
-                id=doc["doc_id"],
-                name=doc["name"],
-                details=doc["details"],
-                body=doc["body"]
+            bool: True if all documents were indexed, False otherwise
+        """
+
+        async def upsert(points: List[PointStruct]) -> None:
+            async with self._search_semaphore:
+                await self._client.upsert(collection_name=self.similarity_prompt_index, points=points)
+
+        try:
+            self._clear_result_caches()
+            points = [self._point(body) for body in bodies]
+            await asyncio.gather(
+                *(upsert(points[start : start + INDEX_BATCH_SIZE]) for start in range(0, len(points), INDEX_BATCH_SIZE))
             )
-            for doc in deduplicated_docs.values()
-        ]
+            bastion_logger.debug("[%s] Indexed %s documents", self.similarity_prompt_index, len(points))
+            return True
+
+        except Exception as e:
+            bastion_logger.error(f"[{self}][{self._search_settings.host}][{self.similarity_prompt_index}] Failed to index documents: {e}")
+            return False
 
     async def close(self) -> None:
         """
         Closes connection with Qdrant server.
 
-        Properly closes the client connection and cleans up resources.
+        Stops the search batcher, then properly closes the client connection
+        and cleans up resources.
         """
+        if self._batcher is not None:
+            await self._batcher.close()
         try:
             if self._client:
                 await self._client.close()
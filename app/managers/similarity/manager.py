@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from app.core.enums import ActionStatus, ManagerNames
 from app.core.manager import BaseManager
@@ -6,9 +6,6 @@ from app.managers.similarity.clients import ALL_CLIENTS_MAP
 from app.managers.similarity.clients.base import BaseSearchClient
 from app.models.pipeline import PipelineResult
 from app.modules.logger import bastion_logger
-from settings import get_settings
-
-settings = get_settings()
 
 
 class SimilarityManager(BaseManager[BaseSearchClient]):
@@ -26,6 +23,8 @@ class SimilarityManager(BaseManager[BaseSearchClient]):
         _active_client_id (str): Identifier of the active client
     """
 
+    __slots__ = ()
+
     _identifier: ManagerNames = ManagerNames.similarity
     description = "Manager class for similarity search operations using vector embeddings in database."
 
@@ -44,23 +43,6 @@ class SimilarityManager(BaseManager[BaseSearchClient]):
     def __str__(self) -> str:
         return "Similarity Manager"
 
-    async def _check_connections(self) -> None:
-        """
-        Checks connections for all initialized clients.
-        Connection checks are deferred until the first async operation.
-        """
-        bastion_logger.debug("Checking connections for all initialized clients")
-        for client in self._clients_map.values():
-            try:
-                status = await client.check_connection()
-                if status:
-                    client.enabled = True
-                    bastion_logger.info(f"[{self}][{client}] Connection check successful")
-                else:
-                    bastion_logger.error(f"[{self}][{client}] Check connection failed")
-            except Exception as e:
-                bastion_logger.error(f"{str(e)}")
-
     @property
     def index_name(self) -> str:
         return self._active_client.similarity_prompt_index
@@ -74,6 +56,9 @@ class SimilarityManager(BaseManager[BaseSearchClient]):
     async def index(self, body: Dict[str, Any]) -> bool:
         return await self._active_client.index(body)
 
+    async def index_bulk(self, bodies: List[Dict[str, Any]]) -> bool:
+        return await self._active_client.index_bulk(bodies)
+
     async def index_create(self) -> bool:
         return await self._active_client.index_create()
 
@@ -111,10 +96,3 @@ class SimilarityManager(BaseManager[BaseSearchClient]):
                 status=ActionStatus.ERROR,
                 details=msg,
             )
-
-    async def close_connections(self) -> None:
-        """
-        Closes connections for all available clients.
-        """
-        for client in self._clients_map.values():
-            await client.close()
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from app.core.enums import ActionStatus, RuleAction
 
@@ -20,6 +20,9 @@ class TriggeredRuleData(BaseModel):
 
 
 class PipelineResult(BaseModel):
+    # Results are shared between callers and caches, so they are immutable
+    model_config = ConfigDict(frozen=True)
+
     status: ActionStatus
     name: str
     triggered_rules: list[TriggeredRuleData] = []
@@ -1,6 +1,6 @@
-import json
 from typing import Any, Dict, Optional
 
+import orjson
 from confluent_kafka import Producer
 from confluent_kafka.error import KafkaError
 
@@ -110,7 +110,7 @@ class KafkaClient:
 
         try:
             # Serialize message to JSON
-            message_bytes = json.dumps(message).encode("utf-8")
+            message_bytes = orjson.dumps(message)
             key_bytes = key.encode("utf-8") if key else None
 
             # Send message
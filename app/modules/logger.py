@@ -1,12 +1,90 @@
 import logging
 import logging.handlers
-from queue import Queue
+from queue import Empty, SimpleQueue
 
 from settings import get_settings
 
 settings = get_settings()
 
-log_queue = Queue()
+# Maximum number of queued records written to the stream at once
+LOG_BATCH_SIZE = 128
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """
+    Queue listener writing all records queued since its last write with one stream write.
+
+    The listener blocks for the first record and then drains whatever else is
+    already queued, up to ``batch_size`` records, so bursts are formatted into
+    one buffer and flushed once while a lone record is written immediately.
+    Records are written to the stream of the first handler.
+
+    Attributes:
+        batch_size (int): Maximum number of records per write
+    """
+
+    def __init__(self, queue: SimpleQueue, handler: logging.StreamHandler, batch_size: int = LOG_BATCH_SIZE):
+        """
+        Initializes the listener.
+
+        Args:
+            queue (SimpleQueue): Queue the records are published to
+            handler (logging.StreamHandler): Handler whose formatter, filters and stream are used
+            batch_size (int): Maximum number of records per write
+        """
+        super().__init__(queue, handler)
+        self.batch_size = max(batch_size, 1)
+
+    def _drain(self) -> list:
+        """
+        Waits for the first record and takes the ones queued behind it.
+
+        Returns:
+            list: Queued records, possibly ending with the stop sentinel
+        """
+        batch = [self.dequeue(True)]
+        while len(batch) < self.batch_size and batch[-1] is not self._sentinel:
+            try:
+                batch.append(self.dequeue(False))
+            except Empty:
+                break
+        return batch
+
+    def _monitor(self) -> None:
+        """
+        Writes batches of records until the stop sentinel is received.
+        """
+        handler = self.handlers[0]
+        while True:
+            batch = self._drain()
+            lines = []
+            last_record = None
+            for record in batch:
+                if record is self._sentinel:
+                    break
+                record = self.prepare(record)
+                if record.levelno < handler.level or not handler.filter(record):
+                    continue
+                try:
+                    lines.append(handler.format(record) + handler.terminator)
+                    last_record = record
+                except Exception:
+                    handler.handleError(record)
+            if lines:
+                handler.acquire()
+                try:
+                    handler.stream.write("".join(lines))
+                    handler.flush()
+                except Exception:
+                    handler.handleError(last_record)
+                finally:
+                    handler.release()
+            if batch[-1] is self._sentinel:
+                break
+
+
+# Unbounded C-implemented queue: putting a record takes no Python-level lock or condition
+log_queue = SimpleQueue()
 
 bastion_logger = logging.getLogger(settings.PROJECT_NAME)
 bastion_logger.setLevel(logging.INFO)
@@ -19,5 +97,5 @@ queue_handler = logging.handlers.QueueHandler(log_queue)
 
 bastion_logger.addHandler(queue_handler)
 
-listener = logging.handlers.QueueListener(log_queue, console_handler)
+listener = BatchingQueueListener(log_queue, console_handler)
 listener.start()
@@ -1,3 +1,6 @@
+from types import MappingProxyType
+
+from app.core.enums import intern_identifier
 from app.pipelines.llm_pipeline.pipeline import LLMPipeline
 from app.pipelines.ml_pipeline.pipeline import MLPipeline
 from app.pipelines.rule_pipeline.pipeline import RulePipeline
@@ -12,14 +15,12 @@ __PIPELINES__ = [
     LLMPipeline(),
 ]
 
+_PIPELINE_ENTRIES = tuple((intern_identifier(pipeline._identifier), pipeline) for pipeline in __PIPELINES__)
 
-ENABLED_PIPELINES_MAP = {
-    pipeline._identifier: pipeline
-    for pipeline in __PIPELINES__ 
+ENABLED_PIPELINES_MAP = MappingProxyType({
+    pipeline_id: pipeline
+    for pipeline_id, pipeline in _PIPELINE_ENTRIES
     if pipeline.enabled
-}
+})
 
-PIPELINES_MAP = {
-    pipeline._identifier: pipeline
-    for pipeline in __PIPELINES__
-}
+PIPELINES_MAP = MappingProxyType(dict(_PIPELINE_ENTRIES))
@@ -84,10 +84,10 @@ class CodeAnalysisPipeline(BasePipeline):
             PipelineResult: Analysis result with triggered rules and status
         """
         language = kwargs.get("language", "")
-        bastion_logger.info(f"Analyzing for language: {language}")
+        bastion_logger.info("Analyzing for language: %s", language)
         triggered_rule_data = await self._scan_for_language(prompt, language)
         status = ActionStatus.BLOCK if triggered_rule_data else ActionStatus.ALLOW
-        bastion_logger.info(f"Analyzing for language: {language}, status: {status}")
+        bastion_logger.info("Analyzing for language: %s, status: %s", language, status)
         return PipelineResult(name=str(self), triggered_rules=triggered_rule_data, status=status)
 
     async def _scan_for_language(self, prompt: str, language: Language) -> list[TriggeredRuleData]:
@@ -1,11 +1,8 @@
-from app.core.enums import ActionStatus, PipelineNames
+from app.core.enums import ActionStatus, ManagerNames, PipelineNames
 from app.core.pipeline import BasePipeline
 from app.managers import ALL_MANAGERS_MAP
 from app.models.pipeline import PipelineResult
 from app.modules.logger import bastion_logger
-from settings import get_settings
-
-settings = get_settings()
 
 
 class LLMPipeline(BasePipeline):
@@ -34,7 +31,7 @@ class LLMPipeline(BasePipeline):
         Sets up the LLM API client with the provided API key and configures
         the model for analysis. Enables the pipeline if API key is available.
         """
-        self.llm_manager = ALL_MANAGERS_MAP["llm"]
+        self.llm_manager = ALL_MANAGERS_MAP[ManagerNames.llm]
 
     def __str__(self) -> str:
         return "LLM Pipeline"
@@ -46,9 +43,9 @@ class LLMPipeline(BasePipeline):
         await self.llm_manager._activate_clients()
         if self.llm_manager.has_active_client:
             self.enabled = True
-            bastion_logger.info(f"[{self}] loaded successfully. Active client: {str(self.llm_manager._active_client)}")
+            bastion_logger.info("[%s] loaded successfully. Active client: %s", self, self.llm_manager._active_client)
         else:
-            bastion_logger.warning(f"[{self}] there are no active client. Check the LLM Manager settings and logs.")
+            bastion_logger.warning("[%s] there are no active client. Check the LLM Manager settings and logs.", self)
 
     async def run(self, prompt: str) -> PipelineResult:
         """
@@ -67,5 +64,5 @@ class LLMPipeline(BasePipeline):
         try:
             return await self.llm_manager.run(text=prompt)
         except Exception as err:
-            bastion_logger.error(f"Error analyzing prompt, error={str(err)}")
+            bastion_logger.error("Error analyzing prompt, error=%s", err)
             return PipelineResult(name=str(self), triggered_rules=[], status=ActionStatus.ERROR, details=str(err))
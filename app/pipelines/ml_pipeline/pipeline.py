@@ -4,7 +4,7 @@ from app.core.enums import ActionStatus, PipelineNames, RuleAction
 from app.core.pipeline import BasePipeline
 from app.models.pipeline import PipelineResult, TriggeredRuleData
 from app.modules.logger import bastion_logger
-from app.utils import text_embedding
+from app.utils import embed_prompt
 from settings import get_settings
 
 settings = get_settings()
@@ -61,7 +61,7 @@ class MLPipeline(BasePipeline):
         except Exception as err:
             bastion_logger.error(f"Error loading model, error={str(err)}")
 
-    def validate_prompt(self, prompt: str):
+    async def validate_prompt(self, prompt: str):
         """
         Validates prompt using ML model.
 
@@ -75,7 +75,8 @@ class MLPipeline(BasePipeline):
             Model classification result or None on embedding creation error
         """
         try:
-            if embedding := text_embedding(prompt):
+            embedding = await embed_prompt(prompt)
+            if embedding.size:
                 predict = self.model_classifier.predict(embedding)
                 return predict
         except Exception as err:
@@ -96,14 +97,14 @@ class MLPipeline(BasePipeline):
             PipelineResult: Analysis result with list of triggered rules
         """
         trigger_rules = []
-        bastion_logger.info(f"Analyzing for {self._identifier}")
+        bastion_logger.info("Analyzing for %s", self._identifier)
         status = ActionStatus.ALLOW
-        if self.validate_prompt(prompt):
+        if await self.validate_prompt(prompt):
             msg = "ML Pipeline detected malicious prompt"
             status = ActionStatus.BLOCK
             trigger_rules.append(
                 TriggeredRuleData(id=self._identifier, name=str(self), details=msg, action=RuleAction.BLOCK)
             )
-            bastion_logger.info(f"Analyzing for {self._identifier}, status: {status}, details: {msg}")
-        bastion_logger.info(f"Analyzing done for {self._identifier}")
+            bastion_logger.info("Analyzing for %s, status: %s, details: %s", self._identifier, status, msg)
+        bastion_logger.info("Analyzing done for %s", self._identifier)
         return PipelineResult(name=str(self), triggered_rules=trigger_rules, status=status)
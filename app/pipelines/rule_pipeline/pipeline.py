@@ -64,7 +64,7 @@ class RulePipeline(BaseRulesPipeline):
             PipelineResult: Analysis result with triggered rules and status
         """
         triggered_rules = []
-        bastion_logger.info(f"Analyzing for {len(self._rules)} rules")
+        bastion_logger.info("Analyzing for %s rules", len(self._rules))
         for rule in self._rules:
             if re.search(rule.body, prompt):
                 triggered_rules.append(
@@ -72,7 +72,7 @@ class RulePipeline(BaseRulesPipeline):
                         id=rule.id, name=rule.name, details=rule.details, body=rule.body, action=rule.action
                     )
                 )
-        bastion_logger.info(f"Found {len(triggered_rules)} triggered rules")
+        bastion_logger.info("Found %s triggered rules", len(triggered_rules))
         status = self._pipeline_status(triggered_rules)
-        bastion_logger.info(f"Analyzing for {len(self._rules)} rules, status: {status}")
+        bastion_logger.info("Analyzing for %s rules, status: %s", len(self._rules), status)
         return PipelineResult(name=str(self), triggered_rules=triggered_rules, status=status)
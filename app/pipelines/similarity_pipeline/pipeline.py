@@ -1,11 +1,8 @@
-from app.core.enums import ActionStatus, PipelineNames
+from app.core.enums import ActionStatus, ManagerNames, PipelineNames
 from app.core.pipeline import BasePipeline
 from app.managers import ALL_MANAGERS_MAP
 from app.models.pipeline import PipelineResult
 from app.modules.logger import bastion_logger
-from settings import get_settings
-
-settings = get_settings()
 
 
 class SimilarityPipeline(BasePipeline):
@@ -27,7 +24,7 @@ class SimilarityPipeline(BasePipeline):
 
     def __init__(self):
         super().__init__()
-        self.similarity_manager = ALL_MANAGERS_MAP["similarity"]
+        self.similarity_manager = ALL_MANAGERS_MAP[ManagerNames.similarity]
 
     async def activate(self) -> None:
         """
@@ -37,11 +34,11 @@ class SimilarityPipeline(BasePipeline):
         if self.similarity_manager.has_active_client:
             self.enabled = True
             bastion_logger.info(
-                f"[{self}] loaded successfully. Active client: {str(self.similarity_manager._active_client)}"
+                "[%s] loaded successfully. Active client: %s", self, self.similarity_manager._active_client
             )
         else:
             bastion_logger.warning(
-                f"[{self}] there are no active client. Check the Similarity Manager settings and logs."
+                "[%s] there are no active client. Check the Similarity Manager settings and logs.", self
             )
 
     async def run(self, prompt: str, **kwargs) -> PipelineResult:
@@ -11,6 +11,9 @@ from app.models.pipeline import (
 
 flow_router = APIRouter(prefix="/flow", tags=["Flow API"])
 
+# Flows listing for the current enabled state of the pipelines; only the latest state is kept
+_flows_cache: dict[tuple[bool, ...], FlowsResponse] = {}
+
 
 @flow_router.post("/run")
 async def run_flow(request: TaskRequest) -> TaskResult:
@@ -25,9 +28,18 @@ async def get_flows_list() -> FlowsResponse:
     """
     Get list of all available flows and their pipelines.
 
+    Flows and pipelines are fixed after startup, so the response is reused
+    until a pipeline is enabled or disabled.
+
     Returns:
         FlowsResponse: List of flows with pipeline information
     """
+    state = tuple(
+        pipeline.enabled for pipelines in bastion_app.pipeline_flows.values() for pipeline in pipelines
+    )
+    if (cached := _flows_cache.get(state)) is not None:
+        return cached
+
     flows = []
 
     for flow_name, pipelines in bastion_app.pipeline_flows.items():
@@ -42,4 +54,7 @@ async def get_flows_list() -> FlowsResponse:
         ]
         flows.append(FlowInfo(flow_name=flow_name, pipelines=pipeline_infos))
 
-    return FlowsResponse(flows=flows)
+    response = FlowsResponse(flows=flows)
+    _flows_cache.clear()
+    _flows_cache[state] = response
+    return response
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 
 from app.managers import ALL_MANAGERS_MAP
 from app.core.manager import BaseManager
@@ -13,40 +13,52 @@ from app.models.manager import (
 
 manager_router = APIRouter(prefix="/manager", tags=["Client Manager API"])
 
+# Serialized managers listing for the current active-client state; only the latest state is kept
+_managers_list_cache: dict[tuple[bool, ...], bytes] = {}
+
 
 def prepare_clients(manager: BaseManager) -> list[ClientInfo]:
     return [
         ClientInfo(
-            id=client._identifier,
-            name=str(client),
-            description=client.description,
+            id=client_class._identifier,
+            name=client_class._display_name,
+            description=client_class.description,
         )
-        for client in manager.get_available_clients()
+        for client_class in manager.get_available_clients()
     ]
 
 
-@manager_router.get("/list")
-async def get_managers() -> ManagersListResponse:
+@manager_router.get("/list", response_model=ManagersListResponse)
+async def get_managers() -> Response:
     """
     Get list of all available managers and their clients.
 
+    The serialized listing is reused until a manager gains or loses its
+    active client, or a client switch may have dropped a client that failed to build.
+
     Returns:
         ManagersListResponse: List of managers with client information
     """
-    managers = []
-
-    for manager_id, manager in ALL_MANAGERS_MAP.items():
-        managers.append(
-            ManagerInfo(
-                id=manager_id,
-                name=str(manager),
-                description=manager.description,
-                enabled=manager.has_active_client,
-                clients=prepare_clients(manager)
+    state = tuple(manager.has_active_client for manager in ALL_MANAGERS_MAP.values())
+    if (content := _managers_list_cache.get(state)) is None:
+        managers = []
+
+        for manager_id, manager in ALL_MANAGERS_MAP.items():
+            managers.append(
+                ManagerInfo(
+                    id=manager_id,
+                    name=str(manager),
+                    description=manager.description,
+                    enabled=manager.has_active_client,
+                    clients=prepare_clients(manager)
+                )
             )
-        )
 
-    return ManagersListResponse(managers=managers)
+        content = ManagersListResponse(managers=managers).model_dump_json().encode()
+        _managers_list_cache.clear()
+        _managers_list_cache[state] = content
+
+    return Response(content=content, media_type="application/json")
 
 
 @manager_router.get("/{manager_id}")
@@ -78,6 +90,7 @@ async def switch_active_client(request: SwitchActiveClientRequest) -> SwitchActi
     status = False
 
     if manager := ALL_MANAGERS_MAP.get(request.manager_id):
-        status = manager.switch_active_client(request.client_id)
+        status = await manager.switch_active_client(request.client_id)
+        _managers_list_cache.clear()
 
     return SwitchActiveClientResponse(client_id=request.client_id, status=status)
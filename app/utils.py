@@ -3,17 +3,19 @@ Module for managing pipelines and their configuration.
 Moved to a separate file to avoid circular imports.
 """
 
-import nltk
-
-try:
-    nltk.data.find("tokenizers/punkt")
-except LookupError:
-    nltk.download("punkt")
-
-from typing import TYPE_CHECKING
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, TypeVar
 
+import nltk
+import numpy as np
+import torch
 from sentence_transformers import SentenceTransformer
 
+from app.core.batcher import MicroBatcher
+from app.core.cache import LRUCache
 from app.modules.logger import bastion_logger
 from settings import get_settings
 
@@ -23,13 +25,108 @@ if TYPE_CHECKING:
 
 settings = get_settings()
 
-model = None
-if settings.EMBEDDINGS_MODEL:
+if settings.SIMILARITY_NLTK_TOKENIZER:
+    # NLTK 3.9+ tokenizes sentences with the punkt_tab data package
+    try:
+        nltk.data.find("tokenizers/punkt_tab")
+    except LookupError:
+        nltk.download("punkt_tab")
+
+# Number of recently split prompts whose sentences are reused
+SENTENCE_CACHE_SIZE = 1024
+
+# Number of recently embedded prompts whose vectors are reused
+EMBEDDING_CACHE_SIZE = 1024
+
+T = TypeVar("T")
+
+# Model calls run on one dedicated thread: the event loop keeps serving I/O while a prompt is encoded,
+# the model and the embedding caches are only touched from that thread, and other blocking work
+# in the default executor does not queue behind inference
+_EMBEDDING_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embeddings")
+
+_SENTENCE_END_PATTERN = re.compile(
+    "|".join(
+        [
+            r"[\n.!:?…]+",
+            r'[.!?]+["\']+',
+            r"[.!?]+\)+",
+            r"[.!?]+\s+[А-ЯA-Z]",
+            r"[.!?\n:]+",
+        ]
+    )
+)
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+# Abbreviations whose period does not end a sentence
+_SENTENCE_ABBREVIATIONS = (
+    "Mr.", "Mrs.", "Ms.", "Dr.", "Prof.", "Sr.", "Jr.", "St.", "vs.", "e.g.", "i.e.", "cf.", "approx.",
+    "Inc.", "Ltd.", "Co.", "Corp.", "No.", "Fig.", "т.е.", "т.к.", "напр.", "см.", "див.",
+)
+# Whitespace after sentence-ending punctuation (optionally closed by a quote or bracket)
+# followed by a capital letter, or a blank line. Periods of abbreviations and of
+# single-letter initials are not sentence ends.
+_SENTENCE_BOUNDARY_PATTERN = re.compile(
+    r"(?:(?<=[.!?…])|(?<=[.!?…][\"'»)\]]))"
+    + "".join(rf"(?<!\b{re.escape(abbreviation)})" for abbreviation in _SENTENCE_ABBREVIATIONS)
+    + r"(?<!\b[A-ZА-ЯЁІЇЄҐ]\.)"
+    + r"\s+(?=[\"'«(\[]?[A-ZÀ-ÖØ-ÞА-ЯЁІЇЄҐŁŚŻŹĆŃČŠŽŘĎŤŇĚŮŐŰĂȘȚ])|\n\s*\n"
+)
+
+
+@lru_cache(maxsize=1)
+def get_embeddings_model() -> SentenceTransformer | None:
+    """
+    Loads the embeddings model on first use.
+
+    Importing this module stays cheap; the server loads the model during
+    startup, and scripts load it only if they embed text.
+
+    Returns:
+        SentenceTransformer | None: Loaded model, or None if EMBEDDINGS_MODEL is not set or failed to load
+    """
+    if not settings.EMBEDDINGS_MODEL:
+        return None
+    if settings.EMBEDDINGS_NUM_THREADS:
+        # Processes running side by side would otherwise each start one thread per core
+        torch.set_num_threads(settings.EMBEDDINGS_NUM_THREADS)
+    model_kwargs = {"file_name": settings.EMBEDDINGS_MODEL_FILE} if settings.EMBEDDINGS_MODEL_FILE else None
     try:
-        model = SentenceTransformer(settings.EMBEDDINGS_MODEL, trust_remote_code=True, revision="main")
+        model = SentenceTransformer(
+            settings.EMBEDDINGS_MODEL,
+            trust_remote_code=True,
+            revision="main",
+            device=settings.EMBEDDINGS_DEVICE,
+            backend=settings.EMBEDDINGS_BACKEND,
+            model_kwargs=model_kwargs,
+        )
+        # ONNX and OpenVINO models keep the precision of the exported file
+        if settings.EMBEDDINGS_BACKEND == "torch":
+            if settings.EMBEDDINGS_DTYPE:
+                # bfloat16 keeps the float32 exponent range, so it also suits CPUs with AVX-512 BF16 or AMX
+                model.to(getattr(torch, settings.EMBEDDINGS_DTYPE))
+            elif settings.EMBEDDINGS_HALF_PRECISION and model.device.type == "cuda":
+                model.half()
+        # Run one batch right away so the first prompt does not pay for kernel setup
+        model.encode(["warm-up"], normalize_embeddings=True)
+        bastion_logger.info(f"Embeddings model loaded on {model.device}")
+        return model
     except Exception as e:
         bastion_logger.error(f"Failed to load embeddings model: {e}")
-        model = None
+        return None
+
+
+async def run_in_embedding_thread(func: Callable[..., T], *args) -> T:
+    """
+    Runs a blocking embeddings call on the dedicated embeddings thread.
+
+    Args:
+        func: Function loading the model or encoding text
+        *args: Positional arguments for the function
+
+    Returns:
+        Result of the function
+    """
+    return await asyncio.get_running_loop().run_in_executor(_EMBEDDING_EXECUTOR, func, *args)
 
 
 def get_pipelines_from_config(configs: list[dict]) -> dict[str, list["BasePipeline"]]:
@@ -48,16 +145,11 @@ def get_pipelines_from_config(configs: list[dict]) -> dict[str, list["BasePipeli
     result = {}
     skipped_pipelines = set()
     for config in configs:
-        pipelines = []
-        flow_name = config.get("pipeline_flow")
-        for pipeline_name in config.get("pipelines"):
-            try:
-                pipeline = PIPELINES_MAP[pipeline_name]
-                # Pipelines will be enabled later through activation
-                pipelines.append(pipeline)
-            except KeyError:
-                skipped_pipelines.add(pipeline_name)
-        if flow_name and pipelines:
+        pipeline_names = config.get("pipelines")
+        skipped_pipelines.update(name for name in pipeline_names if name not in PIPELINES_MAP)
+        # Pipelines will be enabled later through activation
+        pipelines = [PIPELINES_MAP[name] for name in pipeline_names if name in PIPELINES_MAP]
+        if (flow_name := config.get("pipeline_flow")) and pipelines:
             result[flow_name] = pipelines
     result["default"] = list(PIPELINES_MAP.values())
     if skipped_pipelines:
@@ -65,19 +157,101 @@ def get_pipelines_from_config(configs: list[dict]) -> dict[str, list["BasePipeli
     return result
 
 
-def text_embedding(prompt: str) -> list[float]:
+def text_embedding_vector(prompt: str) -> np.ndarray:
     """
-    Create vector embedding from text prompt.
+    Create normalized vector embedding from text prompt as a numpy array.
 
     Args:
         prompt: Text to convert to vector
 
     Returns:
-        List of float values representing the vector
+        float32 array representing the vector
     """
+    model = get_embeddings_model()
     if model is None:
         raise ValueError("Embeddings model is not loaded. Please check EMBEDDINGS_MODEL setting.")
-    return model.encode(prompt, normalize_embeddings=True).tolist()
+    return model.encode(prompt, normalize_embeddings=True).astype(np.float32, copy=False)
+
+
+def text_embedding_batch(prompts: list[str]) -> np.ndarray:
+    """
+    Create normalized vector embeddings for several texts in one model call.
+
+    Args:
+        prompts: Texts to convert to vectors
+
+    Returns:
+        float32 matrix with one vector per text
+    """
+    model = get_embeddings_model()
+    if model is None:
+        raise ValueError("Embeddings model is not loaded. Please check EMBEDDINGS_MODEL setting.")
+    return model.encode(prompts, batch_size=32, normalize_embeddings=True).astype(np.float32, copy=False)
+
+
+def _text_embedding_rows(prompts: list[str]) -> list[np.ndarray]:
+    """
+    Create normalized vector embeddings for a batch of prompts, encoding each distinct prompt once.
+
+    Args:
+        prompts: Texts to convert to vectors
+
+    Returns:
+        float32 array for each text
+    """
+    unique = list(dict.fromkeys(prompts))
+    vectors = dict(zip(unique, (row.copy() for row in text_embedding_batch(unique))))
+    return [vectors[prompt] for prompt in prompts]
+
+
+async def _embed_prompt_batch(prompts: list[str]) -> list[np.ndarray]:
+    return await run_in_embedding_thread(_text_embedding_rows, prompts)
+
+
+# Prompt embeddings of recent requests; only touched from the event loop
+_prompt_embedding_cache: LRUCache[str, np.ndarray] = LRUCache(EMBEDDING_CACHE_SIZE)
+
+# Prompts embedded at the same time are encoded in one model call when batching is enabled
+_prompt_batcher: MicroBatcher[str, np.ndarray] | None = None
+if settings.EMBEDDINGS_BATCH_SIZE > 1:
+    _prompt_batcher = MicroBatcher(
+        _embed_prompt_batch, settings.EMBEDDINGS_BATCH_SIZE, settings.EMBEDDINGS_BATCH_WAIT_MS / 1000
+    )
+
+
+async def embed_prompt(prompt: str) -> np.ndarray:
+    """
+    Create normalized vector embedding of a request prompt without blocking the event loop.
+
+    Vectors of recently embedded prompts are reused, so a prompt checked by
+    both the ML pipeline and the LLM semantic cache is encoded once. With
+    EMBEDDINGS_BATCH_SIZE above 1, prompts of concurrent requests are
+    coalesced into one model call. The returned array is shared between
+    callers and is read-only.
+
+    Args:
+        prompt: Text to convert to vector
+
+    Returns:
+        float32 array representing the vector
+    """
+    if (vector := _prompt_embedding_cache.get(prompt)) is not None:
+        return vector
+    if _prompt_batcher is not None:
+        vector = await _prompt_batcher.submit(prompt)
+    else:
+        vector = await run_in_embedding_thread(text_embedding_vector, prompt)
+    vector.setflags(write=False)
+    _prompt_embedding_cache.put(prompt, vector)
+    return vector
+
+
+async def close_prompt_batcher() -> None:
+    """
+    Stops the prompt embedding batcher if batching is enabled.
+    """
+    if _prompt_batcher is not None:
+        await _prompt_batcher.close()
 
 
 def split_text_into_sentences(text: str) -> list[str]:
@@ -96,18 +270,29 @@ def split_text_into_sentences(text: str) -> list[str]:
     """
     if not text or not text.strip():
         return []
-    try:
-        sentences = nltk.sent_tokenize(text.strip())
-    except Exception:
-        sentences = _fallback_sentence_split(text.strip())
+    return list(_split_text_cached(text.strip()))
 
-    cleaned_sentences = []
-    for sentence in sentences:
-        sentence = sentence.strip()
-        if sentence and len(sentence) > 1:
-            cleaned_sentences.append(sentence)
 
-    return cleaned_sentences
+@lru_cache(maxsize=SENTENCE_CACHE_SIZE)
+def _split_text_cached(text: str) -> tuple[str, ...]:
+    """
+    Splits stripped text into sentences, reusing the result for repeated prompts.
+
+    Args:
+        text: Stripped text to split
+
+    Returns:
+        Tuple of sentences
+    """
+    if settings.SIMILARITY_NLTK_TOKENIZER:
+        try:
+            sentences = nltk.sent_tokenize(text)
+        except Exception:
+            sentences = _fallback_sentence_split(text)
+    else:
+        sentences = _SENTENCE_BOUNDARY_PATTERN.split(text)
+
+    return tuple(sentence for sentence in map(str.strip, sentences) if len(sentence) > 1)
 
 
 def _fallback_sentence_split(text: str) -> list[str]:
@@ -121,23 +306,5 @@ def _fallback_sentence_split(text: str) -> list[str]:
     Returns:
         List of sentences
     """
-    import re
-
-    sentence_end_patterns = [
-        r"[\n.!:?…]+",
-        r'[.!?]+["\']+',
-        r"[.!?]+\)+",
-        r"[.!?]+\s+[А-ЯA-Z]",
-        r"[.!?\n:]+",
-    ]
-    pattern = "|".join(sentence_end_patterns)
-    sentences = re.split(pattern, text)
-    cleaned_sentences = []
-
-    for sentence in sentences:
-        sentence = sentence.strip()
-        if sentence and len(sentence) > 1:
-            sentence = re.sub(r"\s+", " ", sentence)
-            cleaned_sentences.append(sentence)
-
-    return cleaned_sentences
+    sentences = map(str.strip, _SENTENCE_END_PATTERN.split(text))
+    return [_WHITESPACE_PATTERN.sub(" ", sentence) for sentence in sentences if len(sentence) > 1]
@@ -126,6 +126,9 @@ INDEX_MAPPING = {
     },
 }
 
+# Fields of a prompt document read from search hits
+SOURCE_FIELDS = ["id", "category", "details", "text"]
+
 # Alternative mapping for Elasticsearch without k-NN plugin
 INDEX_MAPPING_NO_KNN = {
     "mappings": {
@@ -141,3 +144,23 @@ INDEX_MAPPING_NO_KNN = {
         }
     },
 }
+
+# Mapping for Elasticsearch searched with the top-level kNN request
+INDEX_MAPPING_ES_KNN = {
+    "mappings": {
+        "properties": {
+            "vector": {
+                "type": "dense_vector",
+                "dims": 768,
+                "index": True,
+                "similarity": "cosine",
+                # Graph vectors are scalar quantized to int8, originals are kept for rescoring
+                "index_options": {"type": "int8_hnsw"},
+            },
+            "id": {"type": "keyword"},
+            "category": {"type": "text"},
+            "details": {"type": "text"},
+            "text": {"type": "text"},
+        }
+    },
+}
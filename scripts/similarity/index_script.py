@@ -7,10 +7,11 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from app.core.enums import ManagerNames  # noqa: E402
 from app.managers import ALL_MANAGERS_MAP  # noqa: E402
 from app.managers.similarity.manager import SimilarityManager  # noqa: E402
 from app.modules.logger import bastion_logger  # noqa: E402
-from app.utils import text_embedding  # noqa: E402
+from app.utils import text_embedding_batch  # noqa: E402
 from scripts.similarity.const import PROMPTS_EXAMPLES  # noqa: E402
 from settings import get_settings  # noqa: E402
 
@@ -18,7 +19,7 @@ settings = get_settings()
 
 
 class CreateSearchIndex:
-    similarity_manager: SimilarityManager = ALL_MANAGERS_MAP["similarity"]
+    similarity_manager: SimilarityManager = ALL_MANAGERS_MAP[ManagerNames.similarity]
 
     async def create_index(self):
         """
@@ -56,9 +57,11 @@ class CreateSearchIndex:
                     return False
 
             docs = [asdict(doc) for doc in PROMPTS_EXAMPLES]
-            for doc in docs:
-                doc["vector"] = text_embedding(doc["text"])
-                await self.similarity_manager.index(body=doc)
+            vectors = text_embedding_batch([doc["text"] for doc in docs])
+            for doc, vector in zip(docs, vectors):
+                doc["vector"] = vector
+            if not await self.similarity_manager.index_bulk(docs):
+                return False
 
             bastion_logger.info(f"Uploaded {len(docs)} example prompts to index")
             return True
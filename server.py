@@ -1,14 +1,17 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.managers import ALL_MANAGERS_MAP
 from app.modules.logger import bastion_logger
 from app.pipelines import PIPELINES_MAP
 from app.routers.manager import manager_router
 from app.routers.flow import flow_router
+from app.utils import close_prompt_batcher, get_embeddings_model, run_in_embedding_thread
 from settings import get_settings
 
 settings = get_settings()
@@ -16,11 +19,28 @@ settings = get_settings()
 
 @asynccontextmanager
 async def lifespan(app_: FastAPI):
-    for pipeline in PIPELINES_MAP.values():
-        await pipeline.activate()
+    # Connection checks of the LLM and similarity clients overlap instead of running one after another,
+    # and the embeddings model loads on the embeddings thread meanwhile
+    # A pipeline that fails to activate stays disabled and does not stop the others
+    pipelines = list(PIPELINES_MAP.values())
+    _, *statuses = await asyncio.gather(
+        run_in_embedding_thread(get_embeddings_model),
+        *(pipeline.activate() for pipeline in pipelines),
+        return_exceptions=True,
+    )
+    for pipeline, status in zip(pipelines, statuses):
+        if isinstance(status, Exception):
+            bastion_logger.error(f"[{pipeline}] Failed to activate: {status}")
     yield
-    for manager in ALL_MANAGERS_MAP.values():
-        await manager.close_connections()
+    managers = list(ALL_MANAGERS_MAP.values())
+    _, *statuses = await asyncio.gather(
+        close_prompt_batcher(),
+        *(manager.close_connections() for manager in managers),
+        return_exceptions=True,
+    )
+    for manager, status in zip(managers, statuses):
+        if isinstance(status, Exception):
+            bastion_logger.error(f"[{manager}] Failed to close connections: {status}")
 
 
 app = FastAPI(
@@ -29,6 +49,8 @@ app = FastAPI(
     description="API for LLM Protection",
     version="1.0.0",
     root_path="/api/v1",
+    # Validated responses are encoded with orjson instead of the stdlib json module
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -1,9 +1,9 @@
-import json
 import logging
 from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import orjson
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -22,7 +22,11 @@ class BaseSearchSettings(BaseModel):
     host: str
     port: int
     scheme: str = "https"
-    pool_size: int = 10
+    # Sized for the concurrent multi-search chunks of a prompt and bulk indexing
+    pool_size: int = 32
+    http_compress: bool = Field(
+        default=False, description="Gzip request bodies, shrinking bulk uploads and vector queries on slow links"
+    )
 
     def get_common_config(self) -> dict:
         """
@@ -37,6 +41,7 @@ class BaseSearchSettings(BaseModel):
             "ssl_show_warn": False,
             "retry_on_status": (500, 502, 503, 504),
             "max_retries": 3,
+            "http_compress": self.http_compress,
         }
 
         if self.user and self.password:
@@ -46,6 +51,13 @@ class BaseSearchSettings(BaseModel):
 
 
 class OpenSearchSettings(BaseSearchSettings):
+    concurrent_segment_search: bool = Field(
+        default=False, description="Create the index with concurrent segment search, requires OpenSearch 2.12+"
+    )
+    scalar_quantization: bool = Field(
+        default=False, description="Create the index with int7 scalar quantized HNSW vectors, requires OpenSearch 2.16+"
+    )
+
     def get_client_config(self) -> dict:
         return {
             **self.get_common_config(),
@@ -54,9 +66,19 @@ class OpenSearchSettings(BaseSearchSettings):
 
 
 class ElasticsearchSettings(BaseSearchSettings):
+    native_knn: bool = Field(
+        default=False, description="Search with the top-level kNN request, requires an indexed dense_vector field"
+    )
+    num_candidates: int = Field(default=50, description="Nearest neighbor candidates per shard for kNN search")
+
     def get_client_config(self) -> dict:
         config = {
             "hosts": [f"{self.scheme}://{self.host}:{self.port}"],
+            # One keep-alive pool per node, sized like the OpenSearch client's
+            "connections_per_node": self.pool_size,
+            "retry_on_status": (500, 502, 503, 504),
+            "max_retries": 3,
+            "http_compress": self.http_compress,
         }
 
         # Add authentication only if both user and password are provided
@@ -79,6 +101,14 @@ class QdrantSettings(BaseModel):
     api_key: Optional[str] = None
     prefer_grpc: bool = False
     timeout: int = 30
+    max_concurrent_searches: int = 10
+    batch_size: int = 1
+    batch_wait_ms: int = 5
+    quantization: bool = False
+    oversampling: float = 2.0
+    mrl_dimension: int = 0
+    mrl_candidates: int = 25
+    segment_number: int = 0
 
     def get_client_config(self) -> dict:
         """
@@ -97,6 +127,14 @@ class QdrantSettings(BaseModel):
         if self.grpc_port:
             config["grpc_port"] = self.grpc_port
 
+        if self.prefer_grpc:
+            # Keep the channel alive between bursts so searches do not pay for a new handshake
+            config["grpc_options"] = {
+                "grpc.keepalive_time_ms": 30000,
+                "grpc.keepalive_permit_without_calls": 1,
+                "grpc.http2.max_pings_without_data": 0,
+            }
+
         if self.api_key:
             config["api_key"] = self.api_key
 
@@ -160,12 +198,61 @@ class Settings(BaseSettings):
 
     SIMILARITY_NOTIFY_THRESHOLD: float = 0.7
     SIMILARITY_BLOCK_THRESHOLD: float = 0.87
+    SIMILARITY_EMBEDDING_CACHE_SIZE: int = Field(
+        default=1024, description="Maximum number of sentence embeddings cached for similarity search, 0 disables caching"
+    )
+    SIMILARITY_RESULT_CACHE_SIZE: int = Field(
+        default=0, description="Maximum number of similarity search results cached per client, 0 disables caching"
+    )
+    SIMILARITY_RESULT_CACHE_TTL: float = Field(
+        default=300.0, description="Seconds a cached similarity search result or prompt verdict is reused"
+    )
+    SIMILARITY_PROMPT_CACHE_SIZE: int = Field(
+        default=0, description="Maximum number of prompts whose similarity verdicts are cached per client, 0 disables"
+    )
+    SIMILARITY_REGION_CACHE_SIZE: int = Field(
+        default=0, description="Maximum number of queries answering near-duplicate similarity searches, 0 disables"
+    )
+    SIMILARITY_REGION_CACHE_THRESHOLD: float = Field(
+        default=0.98, description="Initial cosine similarity for reusing the result of a nearby query"
+    )
+    SIMILARITY_REGION_CACHE_MIN_THRESHOLD: float = Field(
+        default=0.93, description="Lowest cosine similarity a cached query can learn to answer"
+    )
+    SIMILARITY_NLTK_TOKENIZER: bool = Field(
+        default=False, description="Split prompts into sentences with NLTK Punkt instead of the built-in regex splitter"
+    )
 
     CORS_ORIGINS: list[str] = Field(default=["*"], env="CORS_ORIGINS", description="List of allowed origins for CORS")
 
     EMBEDDINGS_MODEL: Optional[str] = Field(
         default="nomic-ai/nomic-embed-text-v1.5", description="Model for embeddings"
     )
+    EMBEDDINGS_DEVICE: Optional[str] = Field(
+        default=None, description="Device for the embeddings model (e.g. cpu, cuda); picked automatically if not set"
+    )
+    EMBEDDINGS_HALF_PRECISION: bool = Field(
+        default=False, description="Run the embeddings model in float16 when it is loaded on a CUDA device"
+    )
+    EMBEDDINGS_DTYPE: Optional[str] = Field(
+        default=None,
+        description="Torch dtype for the embeddings model on any device (e.g. bfloat16); overrides EMBEDDINGS_HALF_PRECISION",
+    )
+    EMBEDDINGS_BACKEND: str = Field(
+        default="torch", description="Inference backend for the embeddings model: torch, onnx, or openvino"
+    )
+    EMBEDDINGS_MODEL_FILE: Optional[str] = Field(
+        default=None, description="Model file for the onnx or openvino backend, e.g. onnx/model_quantized.onnx"
+    )
+    EMBEDDINGS_NUM_THREADS: Optional[int] = Field(
+        default=None, description="CPU threads used by the embeddings model per process; torch default if not set"
+    )
+    EMBEDDINGS_BATCH_SIZE: int = Field(
+        default=1, description="Maximum prompts of concurrent requests embedded in one model call, 1 disables batching"
+    )
+    EMBEDDINGS_BATCH_WAIT_MS: int = Field(
+        default=5, description="Maximum time in ms to wait for a prompt embedding batch to fill"
+    )
 
     LLM_DEFAULT_CLIENT: Optional[str] = Field(default="litellm", description="Default client for LLM")
 
@@ -200,6 +287,9 @@ class Settings(BaseSettings):
         default="http://localhost:11434", description="Ollama API base URL (using official Ollama library)"
     )
     OLLAMA_MODEL: Optional[str] = Field(default="llama3", description="Ollama model name")
+    OLLAMA_KEEP_ALIVE: Optional[str] = Field(
+        default="30m", description="How long Ollama keeps the model loaded after a request (e.g. 30m, -1 for always)"
+    )
     
     # LiteLLM Configuration
     LITELLM_BASE_URL: Optional[str] = Field(
@@ -207,9 +297,80 @@ class Settings(BaseSettings):
     )
     LITELLM_MODEL: Optional[str] = Field(default="llama3", description="LiteLLM model route name")
 
+    # Cascade Configuration
+    LLM_CASCADE_ENABLED: bool = Field(
+        default=False, description="Classify with a local Ollama model first and escalate borderline prompts"
+    )
+    LLM_CASCADE_LOCAL_MODEL: Optional[str] = Field(
+        default=None, description="Quantized Ollama model for the first stage (defaults to OLLAMA_MODEL)"
+    )
+    LLM_CASCADE_ESCALATION_CLIENT: Optional[str] = Field(
+        default="azure", description="Client used for low-confidence verdicts (openai, anthropic, azure, litellm)"
+    )
+    LLM_CASCADE_ESCALATION_THRESHOLD: float = Field(
+        default=0.8, description="Minimum local model confidence (0.0-1.0) to skip escalation"
+    )
+    LLM_CASCADE_NUM_CTX: int = Field(default=2048, description="Context window of the local cascade model")
+    LLM_CASCADE_NUM_PREDICT: int = Field(default=96, description="Maximum tokens generated by the local cascade model")
+
     # LLM Common Configuration
     LLM_TEMPERATURE: float = Field(default=0.1, description="Temperature for LLM responses (0.0-2.0)")
     LLM_MAX_TOKENS: int = Field(default=1000, description="Maximum tokens for LLM responses")
+    LLM_MAX_PROMPT_BYTES: int = Field(
+        default=0, description="Truncate prompts sent to the LLM to this many UTF-8 bytes, 0 disables truncation"
+    )
+    LLM_MAX_TOKENS_SAFETY: int = Field(
+        default=256, description="Upper bound on tokens generated for a safety verdict by clients sending the verdict schema"
+    )
+    LLM_STRUCTURED_OUTPUT_ENABLED: bool = Field(
+        default=False, description="Constrain LLM responses to the verdict JSON schema"
+    )
+    LLM_TIMEOUT: float = Field(default=30.0, description="Timeout in seconds for a single LLM API request")
+    LLM_MAX_RETRIES: int = Field(
+        default=2, description="Retries with jittered backoff for rate limited, timed out or 5xx LLM requests"
+    )
+    TRUST_INTERNAL_MODELS: bool = Field(
+        default=False, description="Build LLM verdict models without Pydantic validation once the response is checked"
+    )
+    LLM_POOL_SIZE: int = Field(default=16, description="Maximum concurrent requests per LLM client")
+    LLM_POOL_BURST_LIMIT: int = Field(
+        default=8, description="Extra concurrent LLM requests allowed above LLM_POOL_SIZE during spikes"
+    )
+    LLM_HTTP_MAX_CONNECTIONS: int = Field(
+        default=512, description="Maximum connections in the HTTP pool shared by LLM clients"
+    )
+    LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = Field(
+        default=256, description="Maximum idle keep-alive connections in the HTTP pool shared by LLM clients"
+    )
+    LLM_ADAPTIVE_CONCURRENCY_ENABLED: bool = Field(
+        default=False, description="Halve concurrent LLM requests on 429 responses and regrow them on success"
+    )
+    LLM_HEALTHCHECK_TTL: float = Field(
+        default=30.0, description="Seconds a successful LLM connection check is reused"
+    )
+    LLM_DIRECT_HTTP_ENABLED: bool = Field(
+        default=False, description="Post chat completions over the shared HTTP client instead of the SDK"
+    )
+    LLM_STREAMING_ENABLED: bool = Field(
+        default=False, description="Stream LLM responses and stop reading as soon as an allow verdict is received"
+    )
+    LLM_BATCH_SIZE: int = Field(
+        default=1, description="Maximum prompts coalesced into one LLM batch, 1 disables batching"
+    )
+    LLM_BATCH_WAIT_MS: int = Field(default=15, description="Maximum time in ms to wait for an LLM batch to fill")
+    LLM_EXACT_CACHE_SIZE: int = Field(
+        default=50_000, description="Maximum number of normalized prompts in the LLM exact-match cache, 0 disables it"
+    )
+    LLM_EXACT_CACHE_TTL: float = Field(
+        default=3600, description="Lifetime in seconds of LLM exact-match cache entries, 0 disables expiry"
+    )
+    LLM_SEMANTIC_CACHE_ENABLED: bool = Field(
+        default=False, description="Reuse LLM verdicts for semantically near-identical prompts"
+    )
+    LLM_SEMANTIC_CACHE_SIZE: int = Field(default=1024, description="Maximum number of prompts in the LLM semantic cache")
+    LLM_SEMANTIC_CACHE_THRESHOLD: float = Field(
+        default=0.95, description="Minimum cosine similarity for an LLM semantic cache hit"
+    )
 
     ML_MODEL_PATH: Optional[str] = None
 
@@ -226,9 +387,8 @@ def load_pipeline_config() -> dict:
         return loaded_config
 
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, ValueError, KeyError) as e:
+        return orjson.loads(config_path.read_bytes())
+    except (orjson.JSONDecodeError, ValueError, KeyError) as e:
         logger.error(f"Error reading config.json: {e}")
         return loaded_config
 
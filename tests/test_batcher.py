@@ -0,0 +1,93 @@
+import asyncio
+
+from app.core.batcher import MicroBatcher
+
+
+def test_flushes_when_batch_is_full():
+    batches = []
+
+    async def handler(items):
+        batches.append(items)
+        return [item * 2 for item in items]
+
+    async def main():
+        batcher = MicroBatcher(handler, max_batch_size=3, max_wait=60)
+        try:
+            return await asyncio.wait_for(asyncio.gather(*(batcher.submit(i) for i in range(3))), 1)
+        finally:
+            await batcher.close()
+
+    assert asyncio.run(main()) == [0, 2, 4]
+    assert batches == [[0, 1, 2]]
+
+
+def test_flushes_partial_batch_after_max_wait():
+    batches = []
+
+    async def handler(items):
+        batches.append(items)
+        return [item * 2 for item in items]
+
+    async def main():
+        batcher = MicroBatcher(handler, max_batch_size=10, max_wait=0.01)
+        try:
+            return await asyncio.wait_for(asyncio.gather(*(batcher.submit(i) for i in range(2))), 1)
+        finally:
+            await batcher.close()
+
+    assert asyncio.run(main()) == [0, 2]
+    assert batches == [[0, 1]]
+
+
+def test_splits_items_above_batch_size():
+    batches = []
+
+    async def handler(items):
+        batches.append(items)
+        return items
+
+    async def main():
+        batcher = MicroBatcher(handler, max_batch_size=2, max_wait=0.01)
+        try:
+            return await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+        finally:
+            await batcher.close()
+
+    assert asyncio.run(main()) == [0, 1, 2, 3, 4]
+    assert batches == [[0, 1], [2, 3], [4]]
+
+
+def test_handler_error_is_raised_to_every_submitter():
+    error = ValueError("search failed")
+
+    async def handler(items):
+        raise error
+
+    async def main():
+        batcher = MicroBatcher(handler, max_batch_size=3, max_wait=0.01)
+        try:
+            return await asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True)
+        finally:
+            await batcher.close()
+
+    assert asyncio.run(main()) == [error, error, error]
+
+
+
+def test_result_count_mismatch_fails_every_submitter():
+    async def handler(items):
+        return items[:1]
+
+    async def main():
+        batcher = MicroBatcher(handler, max_batch_size=3, max_wait=0.01)
+        try:
+            return await asyncio.wait_for(
+                asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True), 1
+            )
+        finally:
+            await batcher.close()
+
+    results = asyncio.run(main())
+
+    assert len(results) == 3
+    assert all(isinstance(result, ValueError) for result in results)
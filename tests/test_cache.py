@@ -0,0 +1,125 @@
+import math
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.core import cache
+from app.core.cache import AdaptiveSemanticCache, LFUCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def unit(cosine: float) -> np.ndarray:
+    return np.array([cosine, math.sqrt(1 - cosine**2)], dtype=np.float32)
+
+
+def test_lfu_evicts_least_frequently_used():
+    lfu = LFUCache(2)
+    lfu.put("a", 1)
+    lfu.put("b", 2)
+    assert lfu.get("a") == 1
+
+    lfu.put("c", 3)
+
+    assert lfu.get("b") is None
+    assert lfu.get("a") == 1
+    assert lfu.get("c") == 3
+
+
+def test_lfu_evicts_least_recently_used_among_equal_counts():
+    lfu = LFUCache(2)
+    lfu.put("a", 1)
+    lfu.put("b", 2)
+
+    lfu.put("c", 3)
+
+    assert lfu.get("a") is None
+    assert lfu.get("b") == 2
+    assert lfu.get("c") == 3
+
+
+def test_lfu_update_keeps_hit_count():
+    lfu = LFUCache(2)
+    lfu.put("a", 1)
+    lfu.get("a")
+    lfu.put("a", 10)
+    lfu.put("b", 2)
+
+    lfu.put("c", 3)
+
+    assert lfu.get("a") == 10
+    assert lfu.get("b") is None
+
+
+def test_lfu_entries_expire_after_ttl(clock):
+    lfu = LFUCache(2, ttl=10)
+    lfu.put("a", 1)
+
+    clock[0] += 9
+    assert lfu.get("a") == 1
+
+    clock[0] += 1
+    assert lfu.get("a") is None
+    assert len(lfu) == 0
+
+
+def test_lfu_without_ttl_never_expires(clock):
+    lfu = LFUCache(2)
+    lfu.put("a", 1)
+
+    clock[0] += 1e9
+
+    assert lfu.get("a") == 1
+
+
+def test_lfu_with_zero_size_stores_nothing():
+    lfu = LFUCache(0)
+    lfu.put("a", 1)
+
+    assert lfu.get("a") is None
+
+
+def test_adaptive_cache_misses_below_initial_threshold():
+    semantic = AdaptiveSemanticCache(4, threshold=0.95, min_threshold=0.8)
+    semantic.put(unit(1.0), "a")
+
+    assert semantic.get(unit(0.99)) == "a"
+    assert semantic.get(unit(0.9)) is None
+
+
+def test_adaptive_cache_widens_threshold_to_matching_query():
+    semantic = AdaptiveSemanticCache(4, threshold=0.95, min_threshold=0.8)
+    semantic.put(unit(1.0), "a")
+    index, score = semantic.nearest(unit(0.9))
+
+    semantic.widen(index, score)
+
+    assert semantic.get(unit(0.9)) == "a"
+    assert semantic.get(unit(0.85)) is None
+
+
+def test_adaptive_cache_threshold_stops_at_minimum():
+    semantic = AdaptiveSemanticCache(4, threshold=0.95, min_threshold=0.8)
+    index = semantic.put(unit(1.0), "a")
+
+    semantic.widen(index, 0.5)
+
+    assert semantic.get(unit(0.85)) == "a"
+    assert semantic.get(unit(0.7)) is None
+
+
+def test_adaptive_cache_put_resets_threshold():
+    semantic = AdaptiveSemanticCache(1, threshold=0.95, min_threshold=0.8)
+    index = semantic.put(unit(1.0), "a")
+    semantic.widen(index, 0.8)
+
+    semantic.put(unit(1.0), "b")
+
+    assert semantic.get(unit(0.9)) is None
+    assert semantic.get(unit(1.0)) == "b"
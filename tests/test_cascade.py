@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from app.core.enums import ActionStatus, RuleAction
+from app.managers.llm.clients.base import BaseLLMClient
+from app.managers.llm.clients.cascade import CascadeLLMClient, LocalClassifierClient
+from app.models.pipeline import PipelineResult, TriggeredRuleData
+from settings import get_settings
+
+
+def verdict(status, name="Stage Client"):
+    rules = []
+    if status is ActionStatus.BLOCK:
+        rules = [TriggeredRuleData(id="stage", name=name, details="malware", action=RuleAction.BLOCK)]
+    return PipelineResult(name=name, status=status, triggered_rules=rules)
+
+
+class StubStage:
+    def __init__(self, result):
+        self.result = result
+        self.prompts = []
+
+    def __str__(self):
+        return "Stub Stage"
+
+    async def _analyze(self, text):
+        self.prompts.append(text)
+        return self.result
+
+
+@pytest.fixture
+def local_client(monkeypatch):
+    monkeypatch.setattr(get_settings(), "OLLAMA_BASE_URL", "http://localhost:11434")
+    monkeypatch.setattr(BaseLLMClient, "_load_client", lambda self: None)
+    client = LocalClassifierClient()
+    client.escalation_threshold = 0.8
+    return client
+
+
+@pytest.fixture
+def cascade(monkeypatch):
+    monkeypatch.setattr(CascadeLLMClient, "_load_client", lambda self: None)
+    return CascadeLLMClient()
+
+
+def test_local_classifier_caps_output(local_client):
+    assert local_client._options["num_predict"] == get_settings().LLM_CASCADE_NUM_PREDICT
+    assert local_client._options["num_ctx"] == get_settings().LLM_CASCADE_NUM_CTX
+
+
+def test_local_classifier_accepts_confident_verdict(local_client):
+    result = local_client._process_response('{"status": "block", "confidence": 0.9, "reason": "malware"}', "prompt")
+
+    assert result.status is ActionStatus.BLOCK
+
+
+@pytest.mark.parametrize(
+    "analysis",
+    [
+        '{"status": "block", "confidence": 0.5, "reason": "malware"}',
+        '{"status": "allow", "reason": "safe"}',
+        '{"status": "allow", "confidence": "high", "reason": "safe"}',
+    ],
+)
+def test_local_classifier_rejects_unconfident_verdict(local_client, analysis):
+    assert local_client._process_response(analysis, "prompt").status is ActionStatus.ERROR
+
+
+def test_cascade_keeps_confident_local_verdict(cascade):
+    cascade.local_client = StubStage(verdict(ActionStatus.BLOCK))
+    cascade.escalation_client = StubStage(verdict(ActionStatus.ALLOW))
+
+    result = asyncio.run(cascade._analyze("prompt"))
+
+    assert result.status is ActionStatus.BLOCK
+    assert cascade.escalation_client.prompts == []
+
+
+def test_cascade_escalates_failed_local_verdict(cascade):
+    cascade.local_client = StubStage(verdict(ActionStatus.ERROR))
+    cascade.escalation_client = StubStage(verdict(ActionStatus.BLOCK))
+
+    result = asyncio.run(cascade._analyze("prompt"))
+
+    assert result.status is ActionStatus.BLOCK
+    assert cascade.escalation_client.prompts == ["prompt"]
+
+
+def test_cascade_reports_verdicts_under_its_name(cascade):
+    cascade.local_client = StubStage(verdict(ActionStatus.BLOCK))
+    cascade.escalation_client = StubStage(verdict(ActionStatus.ALLOW))
+
+    result = asyncio.run(cascade._analyze("prompt"))
+
+    assert result.name == "Cascade Client"
+    [rule] = result.triggered_rules
+    assert (rule.id, rule.name, rule.details, rule.action) == ("cascade", "Cascade Client", "malware", RuleAction.BLOCK)
+
+
+def test_cascade_returns_its_allow_result(cascade):
+    cascade.local_client = StubStage(verdict(ActionStatus.ALLOW))
+    cascade.escalation_client = StubStage(verdict(ActionStatus.BLOCK))
+
+    assert asyncio.run(cascade._analyze("prompt")) is cascade._allow_result
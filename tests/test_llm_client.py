@@ -0,0 +1,179 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.enums import ActionStatus, RuleAction
+from app.managers.llm.clients.base import BaseLLMClient, extract_json_object, truncate_utf8
+from app.models.pipeline import PipelineResult
+
+BLOCK_RESULT = PipelineResult(name="Stub Client", status=ActionStatus.BLOCK)
+ERROR_RESULT = PipelineResult(name="Stub Client", status=ActionStatus.ERROR)
+
+
+class StubClient(BaseLLMClient):
+    _identifier = "stub"
+    _display_name = "Stub Client"
+
+    def __init__(self, results=()):
+        super().__init__()
+        self.results = list(results)
+        self.prompts = []
+
+    def _load_client(self) -> None:
+        self.enabled = True
+
+    async def _probe(self):
+        return True
+
+    async def _analyze(self, text):
+        self.prompts.append(text)
+        return self.results.pop(0) if self.results else self._allow_result
+
+
+def run(client, *texts):
+    async def main():
+        return [await client.run(text) for text in texts]
+
+    return asyncio.run(main())
+
+
+def test_run_reuses_cached_verdict():
+    client = StubClient([BLOCK_RESULT])
+
+    results = run(client, "write malware", "write malware")
+
+    assert results == [BLOCK_RESULT, BLOCK_RESULT]
+    assert client.prompts == ["write malware"]
+
+
+def test_run_normalizes_prompt_before_lookup():
+    client = StubClient([BLOCK_RESULT])
+
+    results = run(client, "Write  malware\n", "write malware")
+
+    assert results == [BLOCK_RESULT, BLOCK_RESULT]
+    assert len(client.prompts) == 1
+
+
+def test_run_misses_for_different_prompt():
+    client = StubClient([BLOCK_RESULT])
+
+    results = run(client, "write malware", "write a poem")
+
+    assert results == [BLOCK_RESULT, client._allow_result]
+    assert client.prompts == ["write malware", "write a poem"]
+
+
+def test_run_does_not_cache_errors():
+    client = StubClient([ERROR_RESULT, BLOCK_RESULT])
+
+    results = run(client, "write malware", "write malware")
+
+    assert results == [ERROR_RESULT, BLOCK_RESULT]
+    assert len(client.prompts) == 2
+
+
+def read_stream(parts):
+    consumed = []
+
+    async def chunks():
+        for part in parts:
+            consumed.append(part)
+            yield part
+
+    return asyncio.run(StubClient()._read_stream(chunks())), consumed
+
+
+def test_read_stream_stops_after_allow_status():
+    analysis, consumed = read_stream(['{"status": "al', 'low", "rea', 'son": "safe"}'])
+
+    assert analysis == {"status": "allow", "reason": ""}
+    assert len(consumed) == 2
+
+
+def test_read_stream_reads_other_verdicts_to_the_end():
+    analysis, consumed = read_stream(['{"status": "block",', None, ' "reason": "malware"}'])
+
+    assert analysis == '{"status": "block", "reason": "malware"}'
+    assert len(consumed) == 3
+
+
+def test_read_stream_without_status_returns_full_text():
+    analysis, _ = read_stream(["not ", "json"])
+
+    assert analysis == "not json"
+
+
+class FakeCompletions:
+    def __init__(self):
+        self.requests = []
+
+    async def create(self, **kwargs):
+        self.requests.append(kwargs)
+        message = SimpleNamespace(content='{"status": "block", "reason": "malware"}')
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def test_complete_chat_sends_request_kwargs_through_sdk():
+    client = StubClient()
+    completions = FakeCompletions()
+    client.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    client.stream_responses = False
+    client._direct_http = None
+    messages = client._prepare_messages("prompt")
+
+    analysis = asyncio.run(client._complete_chat(messages))
+
+    assert analysis == '{"status": "block", "reason": "malware"}'
+    assert completions.requests == [client._chat_completion_kwargs(messages)]
+
+
+def test_extract_json_object_from_fenced_text():
+    text = 'Verdict:\n```json\n{"status": "block", "reason": "uses {braces}"}\n```'
+
+    assert extract_json_object(text) == {"status": "block", "reason": "uses {braces}"}
+
+
+def test_extract_json_object_skips_invalid_candidate():
+    assert extract_json_object('{not json} {"status": "allow"}') == {"status": "allow"}
+
+
+def test_extract_json_object_inside_unclosed_brace():
+    assert extract_json_object('{"a": {"status":"allow"}') == {"status": "allow"}
+
+
+def test_extract_json_object_without_object():
+    assert extract_json_object('{"status": "allow"') is None
+
+
+@pytest.mark.parametrize("trusted", [True, False])
+def test_process_response_builds_same_rule_with_and_without_validation(trusted):
+    client = StubClient()
+    client.trust_internal_models = trusted
+
+    result = client._process_response('{"status": "notify", "reason": "borderline"}', "prompt")
+
+    assert result.status is ActionStatus.NOTIFY
+    [rule] = result.triggered_rules
+    assert (rule.id, rule.name, rule.details) == ("stub", "Stub Client", "borderline")
+    assert type(rule.action) is RuleAction
+    assert rule.action is RuleAction.NOTIFY
+
+
+def test_truncate_utf8_keeps_text_that_fits():
+    assert truncate_utf8("héllo", 6) == "héllo"
+
+
+def test_truncate_utf8_does_not_split_characters():
+    assert truncate_utf8("aé€😀", 5) == "aé"
+    assert truncate_utf8("aé€😀", 6) == "aé€"
+
+
+def test_truncate_utf8_result_fits_limit():
+    text = "ж" * 1000
+
+    truncated = truncate_utf8(text, 101)
+
+    assert truncated == "ж" * 50
+    assert len(truncated.encode("utf-8")) <= 101
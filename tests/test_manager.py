@@ -0,0 +1,102 @@
+import pytest
+
+from app.core import manager as manager_module
+from app.core.manager import BaseManager
+
+built = []
+
+
+class FakeClient:
+    _identifier = "fake"
+    configured = True
+    fails = False
+
+    def __init__(self):
+        built.append(self._identifier)
+        if self.fails:
+            raise RuntimeError("cannot build")
+
+    @classmethod
+    def is_configured(cls, app_settings):
+        return cls.configured
+
+
+class FirstClient(FakeClient):
+    _identifier = "first"
+
+
+class SecondClient(FakeClient):
+    _identifier = "second"
+
+
+class UnconfiguredClient(FakeClient):
+    _identifier = "unconfigured"
+    configured = False
+
+
+class BrokenClient(FakeClient):
+    _identifier = "broken"
+    fails = True
+
+
+class FakeManager(BaseManager[FakeClient]):
+    async def run(self, text):
+        return None
+
+
+CLIENTS = {
+    "broken": BrokenClient,
+    "first": FirstClient,
+    "second": SecondClient,
+    "unconfigured": UnconfiguredClient,
+}
+
+
+@pytest.fixture(autouse=True)
+def reset_built():
+    built.clear()
+
+
+def make_manager(monkeypatch, default):
+    monkeypatch.setattr(manager_module.settings, "LLM_DEFAULT_CLIENT", default)
+    return FakeManager(CLIENTS, "LLM_DEFAULT_CLIENT")
+
+
+def test_only_default_client_is_built(monkeypatch):
+    manager = make_manager(monkeypatch, "second")
+
+    assert built == ["second"]
+    assert manager.get_available_clients() == [BrokenClient, FirstClient, SecondClient]
+
+
+def test_other_clients_are_built_on_first_use(monkeypatch):
+    manager = make_manager(monkeypatch, "second")
+
+    client = manager.get_client("first")
+
+    assert isinstance(client, FirstClient)
+    assert manager.get_client("first") is client
+    assert built == ["second", "first"]
+
+
+def test_unconfigured_client_is_never_built(monkeypatch):
+    manager = make_manager(monkeypatch, "second")
+
+    assert manager.get_client("unconfigured") is None
+    assert "unconfigured" not in built
+
+
+def test_failed_client_is_dropped_and_not_retried(monkeypatch):
+    manager = make_manager(monkeypatch, "second")
+
+    assert manager.get_client("broken") is None
+    assert manager.get_client("broken") is None
+    assert built == ["second", "broken"]
+    assert BrokenClient not in manager.get_available_clients()
+
+
+def test_next_client_is_built_when_default_fails(monkeypatch):
+    manager = make_manager(monkeypatch, "broken")
+
+    assert built == ["broken", "first"]
+    assert manager.get_available_clients() == [FirstClient, SecondClient]
@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from app.managers.llm.pool import ConnectionPool
+
+
+def test_size_must_be_positive():
+    with pytest.raises(ValueError):
+        ConnectionPool(0)
+
+
+def test_limit_starts_at_size_plus_burst():
+    pool = ConnectionPool(4, burst_limit=2)
+
+    assert pool.limit == 6
+
+
+def test_decrease_halves_limit_down_to_one():
+    pool = ConnectionPool(4, burst_limit=2)
+
+    limits = []
+    for _ in range(4):
+        pool.decrease()
+        limits.append(pool.limit)
+
+    assert limits == [3, 1, 1, 1]
+
+
+def test_increase_stops_at_size_plus_burst():
+    pool = ConnectionPool(4, burst_limit=2)
+    pool.decrease()
+
+    for _ in range(10):
+        pool.increase()
+
+    assert pool.limit == 6
+
+
+def test_burst_slots_are_handed_out_after_regular_ones():
+    async def main():
+        pool = ConnectionPool(2, burst_limit=1)
+        slots = [await pool.acquire() for _ in range(3)]
+        return slots, pool.in_use
+
+    slots, in_use = asyncio.run(main())
+
+    assert slots == [0, 1, -1]
+    assert in_use == 3
+
+
+def test_increase_wakes_caller_waiting_on_limit():
+    async def main():
+        pool = ConnectionPool(2)
+        pool.decrease()
+        await pool.acquire()
+        waiter = asyncio.ensure_future(pool.acquire())
+        await asyncio.sleep(0)
+        blocked = not waiter.done()
+
+        pool.increase()
+        slot = await asyncio.wait_for(waiter, 1)
+        return blocked, slot, pool.in_use
+
+    blocked, slot, in_use = asyncio.run(main())
+
+    assert blocked
+    assert slot == 1
+    assert in_use == 2
+
+
+def test_release_wakes_waiting_caller():
+    async def main():
+        pool = ConnectionPool(1)
+        async with pool.get_connection() as slot:
+            waiter = asyncio.ensure_future(pool.acquire())
+            await asyncio.sleep(0)
+            blocked = not waiter.done()
+        return blocked, slot, await asyncio.wait_for(waiter, 1)
+
+    blocked, slot, next_slot = asyncio.run(main())
+
+    assert blocked
+    assert slot == next_slot == 0
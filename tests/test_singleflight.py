@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from app.core.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "verdict"
+
+    async def main():
+        flight = SingleFlight()
+        results = await asyncio.gather(flight.do("key", call), flight.do("key", call))
+        return results, len(flight)
+
+    results, in_flight = asyncio.run(main())
+
+    assert results == [("verdict", False), ("verdict", True)]
+    assert len(calls) == 1
+    assert in_flight == 0
+
+
+def test_error_is_raised_to_every_caller():
+    error = RuntimeError("provider failed")
+
+    async def call():
+        await asyncio.sleep(0.01)
+        raise error
+
+    async def main():
+        flight = SingleFlight()
+        results = await asyncio.gather(flight.do("key", call), flight.do("key", call), return_exceptions=True)
+        return results, len(flight)
+
+    results, in_flight = asyncio.run(main())
+
+    assert results == [error, error]
+    assert in_flight == 0
+
+
+def test_failed_call_is_retried_by_next_caller():
+    attempts = []
+
+    async def call():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("provider failed")
+        return "verdict"
+
+    async def main():
+        flight = SingleFlight()
+        with pytest.raises(RuntimeError):
+            await flight.do("key", call)
+        return await flight.do("key", call)
+
+    assert asyncio.run(main()) == ("verdict", False)
+    assert len(attempts) == 2
+
+
+def test_cancelled_caller_does_not_cancel_shared_call():
+    async def call():
+        await asyncio.sleep(0.01)
+        return "verdict"
+
+    async def main():
+        flight = SingleFlight()
+        first = asyncio.ensure_future(flight.do("key", call))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(flight.do("key", call))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == ("verdict", True)